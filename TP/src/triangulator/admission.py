@@ -0,0 +1,131 @@
+"""
+Module Admission
+Description : Ce module borne le travail de triangulation accepté en même
+temps. Chaque calcul est admis selon son coût estimé (le nombre de points
+annoncé par l'en-tête du PointSet), attend son tour dans une file bornée
+jusqu'à un délai, ou est refusé (503 et Retry-After) si le service est saturé.
+"""
+import math
+import struct
+import threading
+import time
+from contextlib import contextmanager
+
+from .config import (
+    ADMISSION_MAX_COST,
+    ADMISSION_MAX_QUEUE,
+    ADMISSION_QUEUE_TIMEOUT,
+    ADMISSION_SMALL_COST,
+)
+from .execption import ServiceOverloaded
+from .metrics import record_stage
+
+
+def estimate_cost(pointset_bin) -> int:
+    """Coût estimé d'un binaire PointSet : son nombre de points déclaré.
+
+    Un en-tête absent compte pour 0 ; la désérialisation rejettera le binaire.
+    """
+    if len(pointset_bin) < 4:
+        return 0
+    return struct.unpack_from('<I', pointset_bin)[0]
+
+
+class AdmissionController:
+    """Limite le coût total des calculs en cours.
+
+    Un calcul est admis si le coût en cours plus le sien tient dans le
+    budget ; sinon il attend, au plus `queue_timeout` secondes et derrière
+    au plus `max_queue` autres, avant d'être refusé. Une part du budget
+    (RESERVED_SHARE) est réservée aux petites requêtes (au plus `small_cost`
+    points) pour qu'elles restent rapides pendant les gros calculs. Un calcul
+    plus gros que le budget qui lui est ouvert est ramené à ce budget : il
+    s'exécute alors seul parmi les gros.
+    """
+
+    RESERVED_SHARE = 0.25
+
+    def __init__(self, max_cost=ADMISSION_MAX_COST, small_cost=ADMISSION_SMALL_COST,
+                 queue_timeout=ADMISSION_QUEUE_TIMEOUT, max_queue=ADMISSION_MAX_QUEUE):
+        """Crée un contrôleur de budget `max_cost` points (0 = sans limite)."""
+        self.max_cost = max_cost
+        self.small_cost = small_cost
+        self.queue_timeout = queue_timeout
+        self.max_queue = max_queue
+        self.in_use = 0
+        self.waiting = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._condition = threading.Condition()
+
+    @property
+    def retry_after(self) -> int:
+        """Délai conseillé avant un nouvel essai, en secondes entières."""
+        return max(1, math.ceil(self.queue_timeout))
+
+    def limit(self, cost: int) -> int:
+        """Budget ouvert à un calcul de ce coût."""
+        if cost <= self.small_cost:
+            return self.max_cost
+        return self.max_cost - int(self.max_cost * self.RESERVED_SHARE)
+
+    @contextmanager
+    def admit(self, cost: int):
+        """Réserve `cost` dans le budget le temps du bloc.
+
+        Lève ServiceOverloaded si la file est pleine ou si le délai
+        d'attente expire. Le temps passé en file est mesuré (étape "queue").
+        """
+        if self.max_cost <= 0:
+            yield
+            return
+
+        limit = self.limit(cost)
+        cost = min(max(cost, 1), limit)
+        start = time.perf_counter()
+        with self._condition:
+            queued = self.in_use + cost > limit
+            if queued:
+                self._wait(cost, limit, start + self.queue_timeout)
+            self.in_use += cost
+            self.admitted += 1
+        if queued:
+            record_stage("queue", time.perf_counter() - start)
+
+        try:
+            yield
+        finally:
+            with self._condition:
+                self.in_use -= cost
+                self._condition.notify_all()
+
+    def _wait(self, cost: int, limit: int, deadline: float):
+        """Attend (verrou tenu) qu'il y ait la place, ou lève ServiceOverloaded."""
+        if self.waiting >= self.max_queue:
+            self.rejected += 1
+            raise ServiceOverloaded(
+                "Service saturé : file d'attente pleine.", self.retry_after
+            )
+        self.waiting += 1
+        try:
+            while self.in_use + cost > limit:
+                remaining = deadline - time.perf_counter()
+                if remaining <= 0:
+                    self.rejected += 1
+                    raise ServiceOverloaded(
+                        "Service saturé : délai d'attente dépassé.", self.retry_after
+                    )
+                self._condition.wait(remaining)
+        finally:
+            self.waiting -= 1
+
+    def stats(self) -> dict:
+        """Renvoie l'occupation du budget et les compteurs."""
+        with self._condition:
+            return {
+                "in_use": self.in_use,
+                "waiting": self.waiting,
+                "admitted": self.admitted,
+                "rejected": self.rejected,
+                "max_cost": self.max_cost,
+            }
@@ -4,16 +4,40 @@ Description : Ce module gère l'app avec Flask.
 """
 import uuid
 
-from flask import Flask, Response, jsonify
-from werkzeug.exceptions import HTTPException
+from flask import Flask, Response, jsonify, request
+from werkzeug.exceptions import HTTPException, RequestEntityTooLarge
+from werkzeug.wsgi import wrap_file
 
-from .execption import PointSetManagerUnavailable, PointSetNotFound, TriangulatorError
-from .service import process_triangulation_request
+from .config import BATCH_MAX_ITEMS, UPLOAD_MAX_BYTES
+from .core import CHUNK_ITEMS
+from .encoding import Negotiated, iter_encode, negotiate
+from .execption import (
+    InsufficientPointsError,
+    InvalidBinaryFormat,
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    ServiceOverloaded,
+    TriangulationTimeout,
+    TriangulatorError,
+    UnsupportedEncoding,
+    WorkerCrashed,
+)
+from .metrics import server_timing, start_request_timings
+from .profiling import PROFILE_HEADER, request_profile
+from .service import (
+    render_metrics,
+    start_warm_up,
+    stream_batch_request,
+    stream_triangulation_request,
+    stream_upload_request,
+)
+from .spill import SpilledResult
 
 
 def create_app():
     """Créer et configurer l'instance de l'application Flask."""
     app = Flask(__name__)
+    app.config["MAX_CONTENT_LENGTH"] = UPLOAD_MAX_BYTES
     
     
     @app.errorhandler(Exception)
@@ -31,6 +55,42 @@ def create_app():
             {"code": "SERVICE_UNAVAILABLE", "message": str(error)}
         ), 503
 
+    @app.errorhandler(TriangulationTimeout)
+    def handle_timeout(error):
+        """Gérer les triangulations qui dépassent le délai imparti (503)."""
+        return jsonify(
+            {"code": "TRIANGULATION_TIMEOUT", "message": str(error)}
+        ), 503
+
+    @app.errorhandler(WorkerCrashed)
+    def handle_worker_crashed(error):
+        """Gérer les workers arrêtés pendant une triangulation (503)."""
+        return jsonify(
+            {"code": "WORKER_CRASHED", "message": str(error)}
+        ), 503
+
+    @app.errorhandler(ServiceOverloaded)
+    def handle_overloaded(error):
+        """Gérer les calculs refusés par le contrôle d'admission (503)."""
+        return jsonify(
+            {"code": "OVERLOADED", "message": str(error)}
+        ), 503, {"Retry-After": str(error.retry_after)}
+
+    @app.errorhandler(UnsupportedEncoding)
+    def handle_not_acceptable(error):
+        """Gérer les encodages de réponse demandés mais invalides (406)."""
+        return jsonify(
+            {"code": "NOT_ACCEPTABLE", "message": str(error)}
+        ), 406
+
+    @app.errorhandler(RequestEntityTooLarge)
+    def handle_payload_too_large(error):
+        """Gérer les corps de requête au-delà de la taille maximale (413)."""
+        return jsonify(
+            {"code": "PAYLOAD_TOO_LARGE", "message":
+            f"Request body exceeds {app.config['MAX_CONTENT_LENGTH']} bytes."}
+        ), 413
+
     @app.errorhandler(Exception)
     def handle_generic_exception(error):
         """Gérer toutes les autres exceptions et les convertir en erreur 500.
@@ -52,27 +112,155 @@ def create_app():
         ), 500
 
 
+    @app.route("/triangulation", methods=["POST"])
+    def post_triangulation():
+        """Traiter une demande de triangulation d'un PointSet envoyé en corps.
+
+        Le corps est un binaire PointSet (application/octet-stream), lu par
+        morceaux depuis le flux de la requête et limité à
+        MAX_CONTENT_LENGTH octets. Le résultat est diffusé comme pour la
+        route GET. Le corps venant du client, un binaire mal formé ou un
+        PointSet de moins de trois points est refusé en 400.
+        """
+        if request.mimetype != "application/octet-stream":
+            return jsonify(
+                {"code": "UNSUPPORTED_MEDIA_TYPE", "message":
+                "Body must be an application/octet-stream PointSet."}
+            ), 415
+
+        negotiated = negotiate_request()
+        timings = start_request_timings()
+        request_profile(bool(request.headers.get(PROFILE_HEADER)))
+        try:
+            triangles_chunks = stream_upload_request(request.stream)
+        except (InvalidBinaryFormat, InsufficientPointsError) as e:
+            return jsonify(
+                {"code": "INVALID_POINTSET", "message": str(e)}
+            ), 400
+
+        return triangles_response(triangles_chunks, negotiated, timings)
+
+    @app.route("/triangulation/batch", methods=["POST"])
+    def post_triangulation_batch():
+        """Traiter une demande de triangulation pour un lot d'identifiants.
+
+        Le corps est un objet JSON {"pointSetIds": [...]}. La réponse est une
+        suite de trames binaires (voir `core.BATCH_FRAME`), une par
+        identifiant, émises dans l'ordre où les calculs se terminent.
+        """
+        body = request.get_json(silent=True)
+        pointset_ids = body.get("pointSetIds") if isinstance(body, dict) else None
+        if not isinstance(pointset_ids, list) or not pointset_ids:
+            return jsonify(
+                {"code": "INVALID_REQUEST", "message":
+                "Body must be a JSON object with a non-empty pointSetIds list."}
+            ), 400
+
+        if len(pointset_ids) > BATCH_MAX_ITEMS:
+            return jsonify(
+                {"code": "BATCH_TOO_LARGE", "message":
+                f"A batch may contain at most {BATCH_MAX_ITEMS} PointSetIDs."}
+            ), 400
+
+        try:
+            for pointset_id in pointset_ids:
+                uuid.UUID(pointset_id)
+        except (ValueError, TypeError, AttributeError):
+            return jsonify(
+                {"code": "INVALID_ID_FORMAT", "message":
+                "Every PointSetID must be a valid UUID."}
+            ), 400
+
+        return Response(
+            stream_batch_request(pointset_ids),
+            mimetype='application/octet-stream',
+            status=200,
+            direct_passthrough=True
+        )
+
     @app.route("/triangulation/<pointSetId>", methods=["GET"])
     def get_triangulation(pointSetId):
         """Traiter une demande de triangulation pour un identifiant donné.
 
         Vérifie d'abord si l'identifiant est un UUID valide, puis délègue
-        le traitement à la couche service avant de renvoyer le binaire.
+        le traitement à la couche service. Le binaire est ensuite diffusé par
+        morceaux (transfert chunked) sans être assemblé en mémoire. Le
+        paramètre `base` désigne une version précédente du PointSet dont la
+        triangulation est mise à jour plutôt que recalculée.
         """
+        base = request.args.get("base")
         try:
             uuid.UUID(pointSetId)
+            if base is not None:
+                uuid.UUID(base)
         except ValueError:
             return jsonify(
                 {"code": "INVALID_ID_FORMAT", "message": 
                 "PointSetID must be a valid UUID."}
             ), 400
 
-        triangles_bin = process_triangulation_request(pointSetId)
-        
+        negotiated = negotiate_request()
+        timings = start_request_timings()
+        request_profile(bool(request.headers.get(PROFILE_HEADER)))
+        triangles_chunks = stream_triangulation_request(pointSetId, base)
+
+        return triangles_response(triangles_chunks, negotiated, timings)
+
+    @app.route("/metrics", methods=["GET"])
+    def get_metrics():
+        """Exposer les métriques du service au format texte Prometheus."""
         return Response(
-            triangles_bin,
-            mimetype='application/octet-stream',
-            status=200
+            render_metrics(),
+            content_type="text/plain; version=0.0.4; charset=utf-8",
+        )
+
+    def negotiate_request():
+        """Négocier l'encodage de la réponse avant tout calcul.
+
+        Le format par défaut est conservé sauf si le client demande
+        `application/x-triangles` (indices compacts, sommets facultatifs)
+        ou une compression via Accept-Encoding.
+        """
+        return negotiate(
+            request.headers.get("Accept"), request.headers.get("Accept-Encoding")
+        )
+
+    def triangles_response(triangles_chunks, negotiated, timings):
+        """Diffuser un binaire Triangles dans l'encodage négocié.
+
+        L'en-tête Server-Timing reprend les étapes déjà terminées (récupération,
+        désérialisation, triangulation) ; la sérialisation, diffusée après les
+        en-têtes, n'apparaît que dans /metrics. Un résultat écrit sur disque
+        (mode débordement) sans encodage particulier est servi directement
+        depuis son fichier.
+        """
+        headers = {"Vary": "Accept, Accept-Encoding"}
+        if timings:
+            headers["Server-Timing"] = server_timing(timings)
+
+        if isinstance(triangles_chunks, SpilledResult) and negotiated == Negotiated():
+            # Résultat sur disque servi tel quel : le serveur WSGI peut
+            # utiliser sendfile via wsgi.file_wrapper.
+            headers["Content-Length"] = str(triangles_chunks.size)
+            return Response(
+                wrap_file(
+                    request.environ, triangles_chunks.file, 12 * CHUNK_ITEMS
+                ),
+                mimetype=negotiated.mimetype,
+                headers=headers,
+                status=200,
+                direct_passthrough=True
+            )
+        if negotiated.coding is not None:
+            headers["Content-Encoding"] = negotiated.coding
+
+        return Response(
+            iter_encode(triangles_chunks, negotiated),
+            mimetype=negotiated.mimetype,
+            headers=headers,
+            status=200,
+            direct_passthrough=True
         )
 
+    start_warm_up()
     return app
\ No newline at end of file
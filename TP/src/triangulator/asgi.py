@@ -0,0 +1,271 @@
+"""
+Module ASGI
+Description : Ce module fournit une variante asyncio de l'application pour
+les routes de lecture (GET /triangulation/{pointSetId} et GET /metrics), avec
+les mêmes réponses d'erreur que `create_app`. Les routes POST (envoi direct
+et lots) ne sont servies que par `create_app`.
+"""
+import asyncio
+import contextvars
+import functools
+import json
+import logging
+import uuid
+from urllib.parse import parse_qs
+
+from .client_psm_async import AsyncPSMClient
+from .config import PSM_PREWARM_CONNECTIONS
+from .encoding import iter_encode, negotiate
+from .execption import (
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    ServiceOverloaded,
+    TriangulationTimeout,
+    UnsupportedEncoding,
+    WorkerCrashed,
+)
+from .metrics import server_timing, start_request_timings, timed
+from .profiling import PROFILE_HEADER, request_profile
+from .service import (
+    HeaderAdmission,
+    inflight,
+    iter_cached_result,
+    lookup_or_triangulate,
+    render_metrics,
+    result_cache,
+    result_chunks,
+    start_warm_up,
+)
+
+logger = logging.getLogger(__name__)
+
+ROUTE_PREFIX = "/triangulation/"
+METRICS_PATH = "/metrics"
+METRICS_CONTENT_TYPE = b"text/plain; version=0.0.4; charset=utf-8"
+
+
+def create_asgi_app(psm_client: AsyncPSMClient | None = None, executor=None):
+    """Créer l'application ASGI du Triangulator.
+
+    Routes servies : GET /triangulation/{pointSetId} (avec `?base=`) et
+    GET /metrics. POST /triangulation et POST /triangulation/batch n'existent
+    que dans `create_app` : ici, POST /triangulation reçoit 404 NOT_FOUND
+    et POST /triangulation/batch, lu comme un identifiant, 405
+    METHOD_NOT_ALLOWED.
+
+    Les PointSets sont récupérés sans bloquer la boucle d'événements et le
+    calcul est confié à `executor` (le pool de threads par défaut de la
+    boucle si None), ce qui permet de garder un grand nombre de requêtes
+    en vol dans un seul processus. Comme avec `create_app`, l'admission est
+    décidée dès l'en-tête du PointSet : un service saturé répond 503
+    OVERLOADED sans lire les coordonnées.
+    """
+    client = psm_client or AsyncPSMClient()
+
+    async def app(scope, receive, send):
+        """Point d'entrée ASGI."""
+        if scope["type"] == "lifespan":
+            await _lifespan(receive, send, client)
+            return
+        if scope["type"] != "http":
+            return
+
+        path = scope["path"]
+        if path == METRICS_PATH and scope["method"] == "GET":
+            await _send_metrics(send)
+            return
+        pointset_id = path[len(ROUTE_PREFIX):] if path.startswith(ROUTE_PREFIX) else ""
+        if not pointset_id or "/" in pointset_id:
+            await _send_json(send, 404, "NOT_FOUND", "Route inconnue.")
+            return
+        if scope["method"] != "GET":
+            await _send_json(send, 405, "METHOD_NOT_ALLOWED", "Méthode non autorisée.")
+            return
+
+        base = parse_qs(scope.get("query_string", b"").decode("latin-1")).get("base")
+        base = base[0] if base else None
+        try:
+            uuid.UUID(pointset_id)
+            if base is not None:
+                uuid.UUID(base)
+        except ValueError:
+            await _send_json(
+                send, 400, "INVALID_ID_FORMAT", "PointSetID must be a valid UUID."
+            )
+            return
+
+        request_headers = {
+            name.decode("latin-1").lower(): value.decode("latin-1")
+            for name, value in scope.get("headers", [])
+        }
+        try:
+            negotiated = negotiate(
+                request_headers.get("accept"), request_headers.get("accept-encoding")
+            )
+        except UnsupportedEncoding as e:
+            await _send_json(send, 406, "NOT_ACCEPTABLE", str(e))
+            return
+
+        timings = start_request_timings()
+        request_profile(bool(request_headers.get(PROFILE_HEADER.lower())))
+        try:
+            chunks = await _triangulation_chunks(pointset_id, client, executor, base)
+        except PointSetNotFound as e:
+            await _send_json(send, 404, "NOT_FOUND", str(e))
+            return
+        except TriangulationTimeout as e:
+            await _send_json(send, 503, "TRIANGULATION_TIMEOUT", str(e))
+            return
+        except WorkerCrashed as e:
+            await _send_json(send, 503, "WORKER_CRASHED", str(e))
+            return
+        except ServiceOverloaded as e:
+            await _send_json(
+                send, 503, "OVERLOADED", str(e),
+                [(b"retry-after", str(e.retry_after).encode())],
+            )
+            return
+        except PointSetManagerUnavailable as e:
+            await _send_json(send, 503, "SERVICE_UNAVAILABLE", str(e))
+            return
+        except Exception as e:
+            logger.error(f"Erreur non gérée: {e}")
+            await _send_json(send, 500, "INTERNAL_ERROR", str(e))
+            return
+
+        headers = [
+            (b"content-type", negotiated.mimetype.encode()),
+            (b"vary", b"Accept, Accept-Encoding"),
+        ]
+        if negotiated.coding is not None:
+            headers.append((b"content-encoding", negotiated.coding.encode()))
+        if timings:
+            headers.append((b"server-timing", server_timing(timings).encode()))
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        # Sérialisation, encodage compact et compression sont du calcul pur :
+        # chaque morceau est produit dans l'exécuteur pour ne pas bloquer la
+        # boucle d'événements pendant une grosse réponse.
+        loop = asyncio.get_running_loop()
+        encoded = iter_encode(chunks, negotiated)
+        while True:
+            chunk = await loop.run_in_executor(executor, next, encoded, None)
+            if chunk is None:
+                break
+            await send({"type": "http.response.body", "body": chunk, "more_body": True})
+        await send({"type": "http.response.body", "body": b""})
+
+    return app
+
+
+async def _triangulation_chunks(pointset_id: str, client, executor, base=None):
+    """Récupère, triangule et renvoie les morceaux du binaire Triangles.
+
+    Comme `service.stream_triangulation_request`, `base` force une nouvelle
+    récupération et la mise à jour de la triangulation de cette version.
+    """
+    if base is None:
+        cached = result_cache.get_by_id(pointset_id)
+        if cached is not None:
+            return iter_cached_result(cached)
+
+    # Comme dans `service._fetch_and_triangulate`, l'admission est décidée
+    # dès l'en-tête du PointSet, avant la lecture des coordonnées ; l'attente
+    # éventuelle de place se fait dans l'exécuteur, pas dans la boucle.
+    admission = HeaderAdmission()
+    try:
+        with timed("fetch"):
+            pointset_bin = await client.get_pointset_bytes(
+                pointset_id,
+                on_header=functools.partial(_admit_in_executor, admission, executor),
+            )
+    except BaseException:
+        admission.close()
+        raise
+    # Le contexte est copié pour que les durées mesurées dans l'exécuteur
+    # remontent dans l'en-tête Server-Timing de la requête. Comme dans
+    # `stream_triangulation_request`, les requêtes concurrentes pour un même
+    # identifiant partagent un seul calcul.
+    key = pointset_id if base is None else (pointset_id, base)
+    outcome = await asyncio.get_running_loop().run_in_executor(
+        executor,
+        contextvars.copy_context().run,
+        _triangulate_admitted,
+        admission,
+        key,
+        pointset_bin,
+        pointset_id,
+        base,
+    )
+    return result_chunks(pointset_id, *outcome)
+
+
+async def _admit_in_executor(admission: HeaderAdmission, executor, num_points: int):
+    """Rappel `on_header` asynchrone : réserve la place dans `executor`.
+
+    Si la requête est annulée pendant l'attente, la place obtenue malgré
+    tout est rendue dès que l'exécuteur a fini.
+    """
+    future = asyncio.get_running_loop().run_in_executor(
+        executor, contextvars.copy_context().run, admission, num_points
+    )
+    try:
+        await asyncio.shield(future)
+    except asyncio.CancelledError:
+        future.add_done_callback(lambda _future: admission.close())
+        raise
+
+
+def _triangulate_admitted(admission: HeaderAdmission, key, pointset_bin: bytes,
+                          pointset_id: str, base: str | None):
+    """Triangule dans l'exécuteur puis rend la place réservée à l'en-tête."""
+    with admission:
+        return inflight.do(
+            key, lookup_or_triangulate, pointset_bin, pointset_id, base,
+            admission.admitted,
+        )
+
+
+async def _send_metrics(send):
+    """Envoie les métriques du service au format texte Prometheus."""
+    body = render_metrics().encode()
+    await send({
+        "type": "http.response.start",
+        "status": 200,
+        "headers": [
+            (b"content-type", METRICS_CONTENT_TYPE),
+            (b"content-length", str(len(body)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _send_json(send, status: int, code: str, message: str, headers=()):
+    """Envoie une réponse d'erreur JSON au format de l'API."""
+    body = json.dumps({"code": code, "message": message}).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(body)).encode()),
+            *headers,
+        ],
+    })
+    await send({"type": "http.response.body", "body": body})
+
+
+async def _lifespan(receive, send, client):
+    """Gère les messages de démarrage et d'arrêt du serveur ASGI."""
+    while True:
+        message = await receive()
+        if message["type"] == "lifespan.startup":
+            start_warm_up(connections=0)
+            try:
+                await client.warm_up(PSM_PREWARM_CONNECTIONS)
+            except PointSetManagerUnavailable as e:
+                logger.warning(f"Préchauffage des connexions au PSM impossible: {e}")
+            await send({"type": "lifespan.startup.complete"})
+        elif message["type"] == "lifespan.shutdown":
+            await client.close()
+            await send({"type": "lifespan.shutdown.complete"})
+            return
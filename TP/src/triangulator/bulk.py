@@ -0,0 +1,269 @@
+"""
+Module Bulk
+Description : Ce module triangule hors ligne des lots de PointSets (fichiers,
+dossiers ou archives de PointSets concaténés) dans un pool de processus,
+sans passer par l'API HTTP.
+
+Usage : python -m src.triangulator.bulk ENTRÉE [ENTRÉE ...] --output DOSSIER
+        [--jobs N] [--order brio] [--archive] [--pattern '*.bin'] [--resume]
+
+Chaque PointSet produit DOSSIER/<nom>.triangles ; avec --archive, le membre i
+d'une archive <nom> produit DOSSIER/<nom>-<i>.triangles. Les sorties sont
+écrites sous un nom temporaire puis renommées : avec --resume, une sortie
+présente et de taille cohérente est considérée comme terminée.
+"""
+import argparse
+import fnmatch
+import multiprocessing
+import os
+import struct
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import NamedTuple
+
+from .core import (
+    HEADER_SIZE,
+    POINT_SIZE,
+    deserialize_pointset,
+    serialize_triangles,
+    triangulate_points,
+)
+from .execption import TriangulatorError
+from .ordering import ORDERINGS
+
+OUTPUT_SUFFIX = ".triangles"
+PARTIAL_SUFFIX = ".part"
+TRIANGLE_SIZE = 12
+
+
+class Job(NamedTuple):
+    """PointSet à trianguler : `size` octets de `source` à partir de `offset`."""
+
+    name: str
+    source: str
+    offset: int
+    size: int
+    output: str
+
+
+class Result(NamedTuple):
+    """Bilan d'un job ; `error` est renseigné si le PointSet a été rejeté."""
+
+    name: str
+    points: int
+    triangles: int
+    seconds: float
+    error: str | None = None
+
+
+def archive_members(path: str) -> list[tuple[int, int]]:
+    """Renvoie (offset, taille) de chaque PointSet d'une archive concaténée.
+
+    Seuls les en-têtes sont lus. Un dernier membre tronqué est conservé
+    avec la taille restante : sa désérialisation le rejettera.
+    """
+    members = []
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        offset = 0
+        while offset < size:
+            f.seek(offset)
+            header = f.read(HEADER_SIZE)
+            length = HEADER_SIZE
+            if len(header) == HEADER_SIZE:
+                length += struct.unpack('<I', header)[0] * POINT_SIZE
+            length = min(length, size - offset)
+            members.append((offset, length))
+            offset += length
+    return members
+
+
+def list_jobs(inputs: list[str], output_dir: str, archive: bool = False,
+              pattern: str = "*.bin") -> list[Job]:
+    """Construit la liste des jobs à partir de fichiers et de dossiers.
+
+    Les dossiers sont parcourus (sans récursion) dans l'ordre des noms, en
+    ne gardant que les fichiers qui correspondent à `pattern`. Lève
+    `ValueError` si deux jobs écriraient la même sortie.
+    """
+    files = []
+    for path in inputs:
+        if os.path.isdir(path):
+            files.extend(
+                os.path.join(path, entry) for entry in sorted(os.listdir(path))
+                if fnmatch.fnmatch(entry, pattern)
+                and os.path.isfile(os.path.join(path, entry))
+            )
+        else:
+            files.append(path)
+
+    jobs = []
+    outputs = set()
+    for path in files:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        if archive:
+            members = [
+                (f"{stem}-{index:06d}", offset, size)
+                for index, (offset, size) in enumerate(archive_members(path))
+            ]
+        else:
+            members = [(stem, 0, os.path.getsize(path))]
+        for name, offset, size in members:
+            output = os.path.join(output_dir, name + OUTPUT_SUFFIX)
+            if output in outputs:
+                raise ValueError(f"Plusieurs entrées produiraient {output}.")
+            outputs.add(output)
+            jobs.append(Job(name, path, offset, size, output))
+    return jobs
+
+
+def is_complete(path: str) -> bool:
+    """Indique si `path` est un binaire Triangles complet.
+
+    Seuls les deux en-têtes sont lus et comparés à la taille du fichier.
+    """
+    try:
+        with open(path, "rb") as f:
+            size = os.fstat(f.fileno()).st_size
+            header = f.read(HEADER_SIZE)
+            if len(header) != HEADER_SIZE:
+                return False
+            offset = HEADER_SIZE + struct.unpack('<I', header)[0] * POINT_SIZE
+            f.seek(offset)
+            header = f.read(HEADER_SIZE)
+    except OSError:
+        return False
+    if len(header) != HEADER_SIZE:
+        return False
+    triangles = struct.unpack('<I', header)[0]
+    return size == offset + HEADER_SIZE + triangles * TRIANGLE_SIZE
+
+
+def run_job(job: Job, order: str = "brio") -> Result:
+    """Lit, triangule et écrit un PointSet ; exécuté dans un worker.
+
+    La sortie est écrite sous un nom temporaire puis renommée, pour qu'une
+    sortie interrompue ne soit jamais prise pour une sortie complète.
+    """
+    start = time.perf_counter()
+    try:
+        with open(job.source, "rb") as f:
+            f.seek(job.offset)
+            data = f.read(job.size)
+        points = deserialize_pointset(data)
+        triangles = triangulate_points(points, order)
+        result = serialize_triangles(points, triangles)
+        partial = job.output + PARTIAL_SUFFIX
+        with open(partial, "wb") as f:
+            f.write(result)
+        os.replace(partial, job.output)
+    except (OSError, TriangulatorError) as e:
+        return Result(job.name, 0, 0, time.perf_counter() - start, str(e))
+    return Result(job.name, len(points), len(triangles), time.perf_counter() - start)
+
+
+def iter_results(jobs: list[Job], order: str = "brio", processes: int = 1):
+    """Exécute les jobs et produit leurs `Result` au fil de leur fin.
+
+    Avec `processes` > 1, les jobs sont répartis dans un pool de processus ;
+    seuls leurs descripteurs traversent la frontière, chaque worker lit son
+    PointSet et écrit sa sortie lui-même.
+    """
+    if processes <= 1:
+        for job in jobs:
+            yield run_job(job, order)
+        return
+
+    executor = ProcessPoolExecutor(
+        max_workers=processes, mp_context=multiprocessing.get_context("spawn")
+    )
+    try:
+        futures = [executor.submit(run_job, job, order) for job in jobs]
+        for future in as_completed(futures):
+            yield future.result()
+    finally:
+        executor.shutdown(wait=True, cancel_futures=True)
+
+
+def run(jobs: list[Job], order: str = "brio", processes: int = 1,
+        resume: bool = False, log=print) -> dict:
+    """Exécute un lot et renvoie son bilan.
+
+    Avec `resume`, les jobs dont la sortie est déjà complète sont sautés.
+    Chaque fin de job est journalisée par `log`, avec sa durée et son débit.
+    """
+    todo = [job for job in jobs if not (resume and is_complete(job.output))]
+    summary = {
+        "done": 0, "skipped": len(jobs) - len(todo), "failed": 0, "points": 0,
+    }
+    start = time.perf_counter()
+    for result in iter_results(todo, order, processes):
+        if result.error is not None:
+            summary["failed"] += 1
+            log(f"{result.name:<32} ERREUR {result.error}")
+            continue
+        summary["done"] += 1
+        summary["points"] += result.points
+        log(format_result(result))
+    summary["seconds"] = time.perf_counter() - start
+    return summary
+
+
+def format_result(result: Result) -> str:
+    """Formate le bilan d'un job sur une ligne."""
+    rate = result.points / result.seconds if result.seconds > 0 else 0.0
+    return (
+        f"{result.name:<32} {result.points:>10} points "
+        f"{result.triangles:>10} triangles {result.seconds * 1000:10.3f} ms "
+        f"{rate:>12.0f} points/s"
+    )
+
+
+def format_summary(summary: dict) -> str:
+    """Formate le bilan d'un lot : nombres de jobs et débit global."""
+    seconds = summary["seconds"]
+    points_rate = summary["points"] / seconds if seconds > 0 else 0.0
+    files_rate = summary["done"] / seconds if seconds > 0 else 0.0
+    return (
+        f"{summary['done']} triangulés, {summary['skipped']} déjà complets, "
+        f"{summary['failed']} en erreur en {seconds:.3f}s "
+        f"({points_rate:.0f} points/s, {files_rate:.1f} fichiers/s)"
+    )
+
+
+def main(argv=None) -> int:
+    """Point d'entrée de la ligne de commande ; renvoie le code de sortie."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.triangulator.bulk",
+        description="Triangule hors ligne des lots de PointSets.",
+    )
+    parser.add_argument("inputs", nargs="+",
+                        help="fichiers PointSet, dossiers ou archives")
+    parser.add_argument("--output", required=True, help="dossier des sorties")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="nombre de processus (défaut : %(default)s)")
+    parser.add_argument("--order", choices=sorted(ORDERINGS), default="brio")
+    parser.add_argument("--archive", action="store_true",
+                        help="les entrées sont des PointSets concaténés")
+    parser.add_argument("--pattern", default="*.bin",
+                        help="fichiers retenus dans les dossiers "
+                             "(défaut : %(default)s)")
+    parser.add_argument("--resume", action="store_true",
+                        help="saute les sorties déjà complètes")
+    args = parser.parse_args(argv)
+
+    try:
+        os.makedirs(args.output, exist_ok=True)
+        jobs = list_jobs(args.inputs, args.output, args.archive, args.pattern)
+    except (OSError, ValueError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+
+    summary = run(jobs, args.order, args.jobs, args.resume)
+    print(format_summary(summary))
+    return 1 if summary["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
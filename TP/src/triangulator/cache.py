@@ -0,0 +1,317 @@
+"""
+Module Cache
+Description : Ce module gère le cache des résultats de triangulation, adressé
+par le contenu du PointSet, et celui des triangulations modifiables gardées
+pour les mises à jour incrémentales.
+"""
+import hashlib
+import os
+import tempfile
+import threading
+from collections import OrderedDict
+from contextlib import suppress
+
+from .config import CACHE_DISK_MAX_BYTES
+
+
+class ResultCache:
+    """Cache LRU des binaires Triangles borné en octets.
+
+    Les entrées sont indexées par l'empreinte du binaire PointSet : deux
+    identifiants dont le contenu est identique partagent la même entrée.
+    Un répertoire optionnel sert de second niveau persistant entre deux
+    démarrages du service, borné à `disk_max_bytes` octets : les fichiers
+    les moins récemment utilisés (d'après leur date de modification, mise à
+    jour à chaque lecture) sont supprimés au-delà.
+    """
+
+    DISK_SUFFIX = ".bin"
+
+    def __init__(self, max_bytes: int, disk_dir: str | None = None,
+                 disk_max_bytes: int = CACHE_DISK_MAX_BYTES):
+        """Crée un cache vide d'au plus `max_bytes` octets en mémoire."""
+        self.max_bytes = max_bytes
+        self.disk_dir = disk_dir
+        self.disk_max_bytes = disk_max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.disk_evictions = 0
+        self._entries = OrderedDict()
+        self._aliases = {}
+        self._ids_by_digest = {}
+        self._size = 0
+        self._disk_entries = OrderedDict()
+        self._disk_size = 0
+        self._lock = threading.Lock()
+        if disk_dir:
+            os.makedirs(disk_dir, exist_ok=True)
+            self._load_disk_index()
+
+    @staticmethod
+    def digest(pointset_bin: bytes) -> str:
+        """Calcule l'empreinte de contenu d'un binaire PointSet."""
+        return hashlib.blake2b(pointset_bin, digest_size=16).hexdigest()
+
+    def get_by_id(self, pointset_id: str) -> bytes | None:
+        """Renvoie le résultat déjà associé à un identifiant, sans compter
+        d'échec si l'identifiant est inconnu.
+        """
+        with self._lock:
+            digest = self._aliases.get(pointset_id)
+        if digest is None:
+            return None
+        return self.get(digest)
+
+    def get(self, digest: str, pointset_id: str | None = None) -> bytes | None:
+        """Renvoie le résultat associé à une empreinte, ou None.
+
+        En cas de succès, l'identifiant éventuel est rattaché à l'entrée.
+        """
+        with self._lock:
+            result = self._entries.get(digest)
+            if result is not None:
+                self._entries.move_to_end(digest)
+
+        if result is None:
+            result = self._read_disk(digest)
+            if result is not None:
+                self._store(digest, result)
+
+        with self._lock:
+            if result is None:
+                self.misses += 1
+                self._unalias(pointset_id)
+                return None
+            self.hits += 1
+            if pointset_id is not None:
+                self._alias(pointset_id, digest)
+        return result
+
+    def put(self, digest: str, result: bytes, pointset_id: str | None = None):
+        """Enregistre un résultat, en mémoire et sur disque si configuré."""
+        self._store(digest, result)
+        self._write_disk(digest, result)
+        if pointset_id is not None:
+            with self._lock:
+                self._alias(pointset_id, digest)
+
+    def clear(self):
+        """Vide le niveau mémoire et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self._aliases.clear()
+            self._ids_by_digest.clear()
+            self._size = 0
+            self.hits = self.misses = self.evictions = self.disk_evictions = 0
+
+    def stats(self) -> dict:
+        """Renvoie les compteurs et l'occupation du cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._size,
+                "max_bytes": self.max_bytes,
+                "disk_evictions": self.disk_evictions,
+                "disk_entries": len(self._disk_entries),
+                "disk_bytes": self._disk_size,
+            }
+
+    def _store(self, digest: str, result: bytes):
+        """Insère une entrée en mémoire en évinçant les moins récentes."""
+        size = len(result)
+        if size > self.max_bytes:
+            return
+        with self._lock:
+            previous = self._entries.pop(digest, None)
+            if previous is not None:
+                self._size -= len(previous)
+            self._entries[digest] = result
+            self._size += size
+            while self._size > self.max_bytes:
+                old_digest, old_result = self._entries.popitem(last=False)
+                self._size -= len(old_result)
+                self.evictions += 1
+                self._drop_aliases(old_digest)
+
+    def _alias(self, pointset_id: str, digest: str):
+        """Rattache un identifiant à une empreinte (verrou tenu)."""
+        self._unalias(pointset_id)
+        self._aliases[pointset_id] = digest
+        self._ids_by_digest.setdefault(digest, set()).add(pointset_id)
+
+    def _unalias(self, pointset_id: str | None):
+        """Détache un identifiant de son empreinte éventuelle (verrou tenu)."""
+        digest = self._aliases.pop(pointset_id, None)
+        if digest is None:
+            return
+        ids = self._ids_by_digest[digest]
+        ids.discard(pointset_id)
+        if not ids:
+            del self._ids_by_digest[digest]
+
+    def _drop_aliases(self, digest: str):
+        """Oublie les identifiants qui pointent vers une entrée évincée."""
+        for key in self._ids_by_digest.pop(digest, ()):
+            del self._aliases[key]
+
+    def _disk_path(self, digest: str) -> str:
+        """Chemin du fichier associé à une empreinte dans le niveau disque."""
+        return os.path.join(self.disk_dir, digest + self.DISK_SUFFIX)
+
+    def _load_disk_index(self):
+        """Indexe les fichiers du niveau disque, du plus ancien au plus récent
+        d'après leur date de modification, puis applique le budget.
+        """
+        files = []
+        for entry in os.scandir(self.disk_dir):
+            if not entry.name.endswith(self.DISK_SUFFIX):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            digest = entry.name[:-len(self.DISK_SUFFIX)]
+            files.append((stat.st_mtime_ns, digest, stat.st_size))
+        files.sort()
+        with self._lock:
+            for _, digest, size in files:
+                self._disk_entries[digest] = size
+                self._disk_size += size
+            stale = self._evict_disk()
+        self._remove_disk(stale)
+
+    def _read_disk(self, digest: str) -> bytes | None:
+        """Lit une entrée du niveau disque, ou None si absente.
+
+        Une lecture rafraîchit la date de modification du fichier, pour que
+        l'ordre LRU survive à un redémarrage.
+        """
+        if not self.disk_dir:
+            return None
+        path = self._disk_path(digest)
+        try:
+            with open(path, "rb") as f:
+                result = f.read()
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                size = self._disk_entries.pop(digest, None)
+                if size is not None:
+                    self._disk_size -= size
+            return None
+        with self._lock:
+            if digest in self._disk_entries:
+                self._disk_entries.move_to_end(digest)
+        return result
+
+    def _write_disk(self, digest: str, result: bytes):
+        """Écrit une entrée sur disque de façon atomique, puis évince les
+        fichiers les moins récents au-delà du budget.
+        """
+        if not self.disk_dir or len(result) > self.disk_max_bytes:
+            return
+        fd, tmp_path = tempfile.mkstemp(dir=self.disk_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(result)
+            os.replace(tmp_path, self._disk_path(digest))
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+        with self._lock:
+            previous = self._disk_entries.pop(digest, None)
+            if previous is not None:
+                self._disk_size -= previous
+            self._disk_entries[digest] = len(result)
+            self._disk_size += len(result)
+            stale = self._evict_disk()
+        self._remove_disk(stale)
+
+    def _evict_disk(self) -> list[str]:
+        """Retire de l'index les entrées disque au-delà du budget (verrou
+        tenu) ; renvoie leurs empreintes, à supprimer hors verrou.
+        """
+        stale = []
+        while self._disk_size > self.disk_max_bytes:
+            digest, size = self._disk_entries.popitem(last=False)
+            self._disk_size -= size
+            self.disk_evictions += 1
+            stale.append(digest)
+        return stale
+
+    def _remove_disk(self, digests: list[str]):
+        """Supprime les fichiers du niveau disque de ces empreintes."""
+        for digest in digests:
+            with suppress(OSError):
+                os.remove(self._disk_path(digest))
+
+
+class TriangulationCache:
+    """Cache LRU de triangulations modifiables (`core.Triangulation`).
+
+    Les entrées sont indexées par identifiant de PointSet et bornées par leur
+    nombre total de points. Une triangulation est retirée du cache pendant
+    qu'on la modifie (`take`), puis remise sous son nouvel identifiant
+    (`put`) : deux requêtes ne modifient jamais la même en même temps.
+    """
+
+    def __init__(self, max_points: int):
+        """Crée un cache vide d'au plus `max_points` points (0 = désactivé)."""
+        self.max_points = max_points
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._points = 0
+        self._lock = threading.Lock()
+
+    def take(self, pointset_id: str):
+        """Retire et renvoie la triangulation d'un identifiant, ou None."""
+        with self._lock:
+            triangulation = self._entries.pop(pointset_id, None)
+            if triangulation is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            self._points -= len(triangulation)
+            return triangulation
+
+    def put(self, pointset_id: str, triangulation):
+        """Enregistre une triangulation en évinçant les moins récentes."""
+        size = len(triangulation)
+        if size > self.max_points:
+            return
+        with self._lock:
+            previous = self._entries.pop(pointset_id, None)
+            if previous is not None:
+                self._points -= len(previous)
+            self._entries[pointset_id] = triangulation
+            self._points += size
+            while self._points > self.max_points:
+                _, old = self._entries.popitem(last=False)
+                self._points -= len(old)
+                self.evictions += 1
+
+    def clear(self):
+        """Vide le cache et remet les compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self._points = 0
+            self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> dict:
+        """Renvoie les compteurs et l'occupation du cache."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "points": self._points,
+                "max_points": self.max_points,
+            }
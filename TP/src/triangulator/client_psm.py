@@ -1,40 +1,275 @@
-from urllib.error import HTTPError, URLError
-from urllib.request import Request, urlopen
+import struct
+import threading
+import time
+from http.client import HTTPConnection, HTTPException, HTTPSConnection
+from queue import Empty, LifoQueue
+from urllib.parse import urlsplit
 
-from .core import PSM_BASE_URL
-from .execption import PointSetManagerUnavailable, PointSetNotFound
+from .config import PSM_CONNECT_TIMEOUT, PSM_POOL_SIZE, PSM_READ_TIMEOUT
+from .core import HEADER_SIZE, POINT_SIZE, PSM_BASE_URL
+from .execption import (
+    InvalidBinaryFormat,
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    TriangulatorError,
+)
+from .spill import allocate, should_spill
 
 
-def get_pointset_bytes(pointset_id: str) -> bytes:
+class PSMClient:
+    """Client du PointSetManager avec un pool borné de connexions keep-alive.
+
+    Les connexions sont partagées entre les threads de requête : un thread
+    emprunte une connexion libre (ou en ouvre une si le pool n'est pas plein),
+    puis la rend au pool si le serveur accepte de la garder ouverte.
+    """
+
+    def __init__(
+        self,
+        base_url: str = PSM_BASE_URL,
+        pool_size: int = PSM_POOL_SIZE,
+        connect_timeout: float = PSM_CONNECT_TIMEOUT,
+        read_timeout: float = PSM_READ_TIMEOUT,
+    ):
+        """Prépare le pool sans ouvrir de connexion."""
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port
+        self.base_path = parts.path.rstrip("/")
+        self.connection_class = (
+            HTTPSConnection if parts.scheme == "https" else HTTPConnection
+        )
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._idle = LifoQueue()
+        self._slots = threading.BoundedSemaphore(pool_size)
+        self._lock = threading.Lock()
+        self._in_use = 0
+        self._opened = 0
+        self._requests = 0
+        self._wait_total = 0.0
+        self._wait_max = 0.0
+
+    def get_pointset_bytes(self, pointset_id: str, on_header=None) -> bytearray:
+        """Récupère les données binaires PointSet auprès du PointSetManager.
+
+        Le corps est lu au fil de l'eau : l'en-tête est validé dès réception
+        et les coordonnées sont écrites directement dans un buffer
+        préalloué, exploitable sans copie par `deserialize_pointset_buffer`.
+        `on_header` est transmis à `read_pointset_body`.
+        """
+        status, body = self._get(
+            f"{self.base_path}/pointset/{pointset_id}", on_header
+        )
+
+        if status == 404:
+            raise PointSetNotFound("PointSet ID non trouvé sur le PSM.")
+        if status != 200:
+            raise PointSetManagerUnavailable(
+                f"PSM a retourné l'erreur HTTP {status}."
+            )
+        return body
+
+    def stats(self) -> dict:
+        """Renvoie l'occupation du pool et les temps d'attente cumulés."""
+        with self._lock:
+            return {
+                "pool_size": self.pool_size,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "opened": self._opened,
+                "requests": self._requests,
+                "wait_total": self._wait_total,
+                "wait_max": self._wait_max,
+            }
+
+    def warm_up(self, count: int) -> int:
+        """Ouvre jusqu'à `count` connexions et les range dans le pool.
+
+        Les premières requêtes réutilisent ainsi des connexions déjà
+        établies. Renvoie le nombre de connexions ouvertes ; lève
+        `PointSetManagerUnavailable` si le PSM est injoignable.
+        """
+        count = min(count, self.pool_size - self._idle.qsize())
+        for opened in range(count):
+            conn = self.connection_class(
+                self.host, self.port, timeout=self.connect_timeout
+            )
+            try:
+                self._connect(conn)
+            except OSError as e:
+                raise PointSetManagerUnavailable(
+                    f"Connexion au PSM impossible après {opened} connexions: {e}"
+                ) from e
+            self._idle.put(conn)
+        return max(count, 0)
+
+    def close(self):
+        """Ferme toutes les connexions inactives du pool."""
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except Empty:
+                return
+
+    def _get(self, path: str, on_header=None) -> tuple[int, bytes]:
+        """Exécute un GET sur une connexion du pool.
+
+        Une connexion réutilisée peut avoir été fermée par le serveur entre
+        deux requêtes : dans ce cas la requête est rejouée une fois sur une
+        connexion neuve. Les erreurs du service levées par `on_header`
+        (ServiceOverloaded...) sont propagées telles quelles.
+        """
+        conn, reused = self._acquire()
+        try:
+            try:
+                return self._send(conn, path, on_header)
+            except (ConnectionError, HTTPException):
+                if not reused:
+                    raise
+                conn.close()
+                return self._send(conn, path, on_header)
+        except TriangulatorError:
+            conn.close()
+            raise
+        except (OSError, HTTPException) as e:
+            conn.close()
+            raise PointSetManagerUnavailable(
+                f"Connexion au PSM impossible: {e}"
+            ) from e
+        except Exception as e:
+            conn.close()
+            raise PointSetManagerUnavailable(
+                f"Erreur inattendue lors de la communication avec le PSM: {e}"
+            ) from e
+        finally:
+            self._release(conn)
+
+    def _send(self, conn, path: str, on_header=None) -> tuple[int, bytes]:
+        """Envoie la requête et lit entièrement la réponse."""
+        if conn.sock is None:
+            self._connect(conn)
+        conn.request("GET", path)
+        response = conn.getresponse()
+        if response.status == 200:
+            body = read_pointset_body(response, on_header)
+        else:
+            body = response.read()
+        if response.will_close:
+            conn.close()
+        return response.status, body
+
+    def _connect(self, conn):
+        """Ouvre la connexion avec le délai de connexion, puis applique
+        le délai de lecture au socket.
+        """
+        conn.timeout = self.connect_timeout
+        conn.connect()
+        conn.sock.settimeout(self.read_timeout)
+        with self._lock:
+            self._opened += 1
+
+    def _acquire(self):
+        """Emprunte une connexion, en attendant qu'une place se libère."""
+        start = time.perf_counter()
+        if not self._slots.acquire(timeout=self.connect_timeout):
+            raise PointSetManagerUnavailable(
+                "Aucune connexion au PSM disponible dans le pool."
+            )
+        waited = time.perf_counter() - start
+
+        try:
+            conn = self._idle.get_nowait()
+            reused = True
+        except Empty:
+            conn = self.connection_class(
+                self.host, self.port, timeout=self.connect_timeout
+            )
+            reused = False
+
+        with self._lock:
+            self._in_use += 1
+            self._requests += 1
+            self._wait_total += waited
+            self._wait_max = max(self._wait_max, waited)
+        return conn, reused
+
+    def _release(self, conn):
+        """Rend une connexion au pool si elle est encore ouverte."""
+        if conn.sock is not None:
+            self._idle.put(conn)
+        with self._lock:
+            self._in_use -= 1
+        self._slots.release()
+
+
+def read_pointset_body(stream, on_header=None) -> bytearray:
+    """Lit un PointSet depuis un flux binaire en validant au fil de l'eau.
+
+    L'en-tête est lu en premier ; si le flux annonce sa longueur
+    (`Content-Length`), une incohérence est rejetée avant de lire les
+    coordonnées. `on_header(nombre de points)` est ensuite appelé avant
+    toute allocation : une exception qu'il lève (ServiceOverloaded...)
+    interrompt la lecture sans que le corps soit lu. Le buffer, alloué une
+    fois d'après l'en-tête (longueur annoncée ou non), est ensuite rempli
+    par `readinto`, et un corps tronqué ou trop long lève
+    `InvalidBinaryFormat`. Au-delà du seuil de débordement (voir `spill`),
+    le buffer est un fichier temporaire projeté en mémoire (`mmap.mmap`)
+    plutôt qu'un bytearray.
+    """
+    header = bytearray(HEADER_SIZE)
+    if _fill(stream, memoryview(header)) != HEADER_SIZE:
+        raise InvalidBinaryFormat(
+            "Données PointSet trop courtes pour l'en-tête."
+        )
+    num_points = struct.unpack('<I', header)[0]
+    expected_size = HEADER_SIZE + num_points * POINT_SIZE
+
+    announced = getattr(stream, "length", None)
+    if announced is not None and announced != expected_size - HEADER_SIZE:
+        raise InvalidBinaryFormat(
+            "Taille du binaire incohérente avec le nombre de points déclaré."
+        )
+    if on_header is not None:
+        on_header(num_points)
+
+    if should_spill(expected_size):
+        body = allocate(expected_size)
+    else:
+        body = bytearray(expected_size)
+    body[:HEADER_SIZE] = header
+    received = HEADER_SIZE + _fill(stream, memoryview(body)[HEADER_SIZE:])
+
+    if received != expected_size or stream.read(1):
+        raise InvalidBinaryFormat(
+            "Taille du binaire incohérente avec le nombre de points déclaré."
+        )
+    return body
+
+
+def _fill(stream, view: memoryview) -> int:
+    """Remplit `view` depuis le flux ; renvoie le nombre d'octets lus."""
+    filled = 0
+    while filled < len(view):
+        count = stream.readinto(view[filled:])
+        if not count:
+            break
+        filled += count
+    return filled
+
+
+default_client = PSMClient()
+
+
+def get_pointset_bytes(pointset_id: str, on_header=None) -> bytearray:
     """Récupère les données binaires PointSet auprès du PointSetManager."""
-    url = f"{PSM_BASE_URL}/pointset/{pointset_id}"
-    
-    req = Request(url, method='GET')
-    
-    try:
-        with urlopen(req, timeout=5) as response:
-            if response.status != 200:
-                 raise HTTPError(
-                     url, response.status, 'PSM returned non-200 status', 
-                     response.headers, response.fp
-                    )
-
-            return response.read()
-            
-    except HTTPError as e:
-        if e.code == 404:
-            raise PointSetNotFound("PointSet ID non trouvé sur le PSM.") from e
-        
-        raise PointSetManagerUnavailable(
-            f"PSM a retourné l'erreur HTTP {e.code}."
-        ) from e
-        
-    except URLError as e:
-        raise PointSetManagerUnavailable(
-            f"Connexion au PSM impossible: {e.reason}"
-        ) from e
-    
-    except Exception as e:
-        raise PointSetManagerUnavailable(
-            f"Erreur inattendue lors de la communication avec le PSM: {e}"
-        ) from e
\ No newline at end of file
+    return default_client.get_pointset_bytes(pointset_id, on_header)
+
+
+def __getattr__(name: str):
+    """Charge `AsyncPSMClient` à la demande, sans importer asyncio avant."""
+    if name == "AsyncPSMClient":
+        from .client_psm_async import AsyncPSMClient
+        return AsyncPSMClient
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
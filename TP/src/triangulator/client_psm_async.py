@@ -0,0 +1,249 @@
+"""
+Module Client PSM Async
+Description : Ce module fournit le client asyncio du PointSetManager, utilisé
+par l'application ASGI. Il est séparé de `client_psm` pour que l'application
+Flask n'importe pas asyncio au démarrage.
+"""
+import asyncio
+import struct
+from urllib.parse import urlsplit
+
+from .config import PSM_CONNECT_TIMEOUT, PSM_POOL_SIZE, PSM_READ_TIMEOUT
+from .core import HEADER_SIZE, POINT_SIZE, PSM_BASE_URL
+from .execption import InvalidBinaryFormat, PointSetManagerUnavailable, PointSetNotFound
+
+
+class AsyncPSMClient:
+    """Équivalent asyncio de `PSMClient`, pour l'application ASGI.
+
+    Les connexions keep-alive sont gardées dans un pool borné par un
+    sémaphore ; aucune opération réseau ne bloque la boucle d'événements.
+    """
+
+    def __init__(
+        self,
+        base_url: str = PSM_BASE_URL,
+        pool_size: int = PSM_POOL_SIZE,
+        connect_timeout: float = PSM_CONNECT_TIMEOUT,
+        read_timeout: float = PSM_READ_TIMEOUT,
+    ):
+        """Prépare le pool sans ouvrir de connexion."""
+        parts = urlsplit(base_url)
+        self.host = parts.hostname
+        self.port = parts.port or (443 if parts.scheme == "https" else 80)
+        self.netloc = parts.netloc
+        self.ssl = parts.scheme == "https"
+        self.base_path = parts.path.rstrip("/")
+        self.pool_size = pool_size
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self._idle = []
+        self._slots = None
+        self._opened = 0
+
+    async def get_pointset_bytes(self, pointset_id: str, on_header=None) -> bytes:
+        """Récupère les données binaires PointSet auprès du PointSetManager.
+
+        `on_header`, coroutine optionnelle, est attendue avec le nombre de
+        points dès l'en-tête lu, avant les coordonnées ; son attente n'est pas
+        comptée dans le délai de lecture.
+        """
+        try:
+            status, body = await self._get(
+                f"{self.base_path}/pointset/{pointset_id}", on_header
+            )
+        except (InvalidBinaryFormat, PointSetManagerUnavailable):
+            raise
+        except (OSError, asyncio.IncompleteReadError, ValueError) as e:
+            raise PointSetManagerUnavailable(
+                f"Connexion au PSM impossible: {e!r}"
+            ) from e
+
+        if status == 404:
+            raise PointSetNotFound("PointSet ID non trouvé sur le PSM.")
+        if status != 200:
+            raise PointSetManagerUnavailable(
+                f"PSM a retourné l'erreur HTTP {status}."
+            )
+        return body
+
+    def stats(self) -> dict:
+        """Renvoie le nombre de connexions ouvertes et inactives."""
+        return {
+            "pool_size": self.pool_size,
+            "idle": len(self._idle),
+            "opened": self._opened,
+        }
+
+    async def warm_up(self, count: int) -> int:
+        """Ouvre jusqu'à `count` connexions et les range dans le pool.
+
+        Renvoie le nombre de connexions ouvertes ; lève
+        `PointSetManagerUnavailable` si le PSM est injoignable.
+        """
+        count = min(count, self.pool_size - len(self._idle))
+        for opened in range(count):
+            try:
+                self._idle.append(await self._connect())
+            except OSError as e:
+                raise PointSetManagerUnavailable(
+                    f"Connexion au PSM impossible après {opened} connexions: {e!r}"
+                ) from e
+        return max(count, 0)
+
+    async def close(self):
+        """Ferme toutes les connexions inactives du pool."""
+        while self._idle:
+            _, writer = self._idle.pop()
+            writer.close()
+
+    async def _get(self, path: str, on_header=None) -> tuple[int, bytes]:
+        """Exécute un GET sur une connexion du pool, rejoué une fois si une
+        connexion réutilisée a été fermée par le serveur.
+        """
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.pool_size)
+
+        async with self._slots:
+            conn = self._idle.pop() if self._idle else None
+            reused = conn is not None
+            try:
+                if conn is None:
+                    conn = await self._connect()
+                try:
+                    status, body, keep_alive = await _async_exchange(
+                        *conn, self.netloc, path,
+                        _ReadBudget(self.read_timeout), on_header,
+                    )
+                except (ConnectionError, asyncio.IncompleteReadError):
+                    if not reused:
+                        raise
+                    conn[1].close()
+                    conn = await self._connect()
+                    status, body, keep_alive = await _async_exchange(
+                        *conn, self.netloc, path,
+                        _ReadBudget(self.read_timeout), on_header,
+                    )
+            except BaseException:
+                if conn is not None:
+                    conn[1].close()
+                raise
+
+            if keep_alive:
+                self._idle.append(conn)
+            else:
+                conn[1].close()
+            return status, body
+
+    async def _connect(self):
+        """Ouvre une connexion avec le délai de connexion configuré."""
+        conn = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port, ssl=self.ssl or None),
+            self.connect_timeout,
+        )
+        self._opened += 1
+        return conn
+
+
+
+
+class _ReadBudget:
+    """Délai de lecture d'une réponse, décompté pendant les lectures seulement.
+
+    Le temps passé dans `on_header` (attente d'admission) n'est pas imputé
+    au PSM.
+    """
+
+    def __init__(self, timeout: float):
+        """Initialise le délai restant."""
+        self.remaining = timeout
+
+    async def __call__(self, awaitable):
+        """Attend `awaitable` dans le délai restant, puis le décompte."""
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        try:
+            return await asyncio.wait_for(awaitable, max(self.remaining, 0))
+        finally:
+            self.remaining -= loop.time() - start
+
+
+async def _async_exchange(
+    reader, writer, host: str, path: str, read: _ReadBudget, on_header=None
+):
+    """Envoie un GET HTTP/1.1 et lit la réponse, chaque lecture passant par
+    `read`. `on_header` est attendu avec le nombre de points d'une réponse
+    200, avant la lecture des coordonnées.
+
+    Renvoie (statut, corps, connexion réutilisable).
+    """
+    status, version, headers = await read(_async_read_head(reader, writer, host, path))
+    if status != 200:
+        on_header = None
+
+    keep_alive = headers.get("connection") != "close" and version != b"HTTP/1.0"
+    if "chunked" in headers.get("transfer-encoding", ""):
+        body = await _async_read_chunked(reader, read, on_header)
+    elif "content-length" in headers:
+        length = int(headers["content-length"])
+        if status == 200 and length >= HEADER_SIZE:
+            header = await read(reader.readexactly(HEADER_SIZE))
+            num_points = struct.unpack('<I', header)[0]
+            if length != HEADER_SIZE + num_points * POINT_SIZE:
+                writer.close()
+                raise InvalidBinaryFormat(
+                    "Taille du binaire incohérente avec le nombre de points déclaré."
+                )
+            if on_header is not None:
+                await on_header(num_points)
+            body = header + await read(reader.readexactly(length - HEADER_SIZE))
+        else:
+            body = await read(reader.readexactly(length))
+    else:
+        body = await read(reader.read())
+        keep_alive = False
+    return status, body, keep_alive
+
+
+async def _async_read_head(reader, writer, host: str, path: str):
+    """Envoie la requête et lit la ligne de statut et les en-têtes.
+
+    Renvoie (statut, version, en-têtes en minuscules).
+    """
+    writer.write(
+        f"GET {path} HTTP/1.1\r\nHost: {host}\r\n"
+        "Accept: application/octet-stream\r\n\r\n".encode("latin-1")
+    )
+    await writer.drain()
+
+    status_line = await reader.readline()
+    if not status_line:
+        raise ConnectionResetError("Connexion fermée par le PSM.")
+    version, status = status_line.split()[:2]
+
+    headers = {}
+    while True:
+        line = await reader.readline()
+        if line in (b"\r\n", b"\n", b""):
+            break
+        name, _, value = line.decode("latin-1").partition(":")
+        headers[name.strip().lower()] = value.strip().lower()
+    return int(status), version, headers
+
+
+async def _async_read_chunked(reader, read: _ReadBudget, on_header=None) -> bytes:
+    """Décode un corps HTTP en transfert chunked ; `on_header` est attendu
+    une fois l'en-tête du PointSet reçu.
+    """
+    body = bytearray()
+    while True:
+        size = int((await read(reader.readline())).split(b";")[0], 16)
+        if size == 0:
+            while (await read(reader.readline())) not in (b"\r\n", b"\n", b""):
+                pass
+            return bytes(body)
+        body += await read(reader.readexactly(size))
+        await read(reader.readexactly(2))
+        if on_header is not None and len(body) >= HEADER_SIZE:
+            await on_header(struct.unpack_from('<I', body)[0])
+            on_header = None
@@ -0,0 +1,56 @@
+"""
+Module Config
+Description : Ce module centralise les réglages du Triangulator, surchargeables
+par variables d'environnement.
+"""
+import os
+
+
+def env_int(name: str, default: int) -> int:
+    """Lit un entier dans l'environnement, ou renvoie la valeur par défaut."""
+    value = os.environ.get(name)
+    return int(value) if value else default
+
+
+def env_str(name: str, default: str | None = None) -> str | None:
+    """Lit une chaîne dans l'environnement, ou renvoie la valeur par défaut."""
+    return os.environ.get(name) or default
+
+
+CACHE_MAX_BYTES = env_int("TRIANGULATOR_CACHE_MAX_BYTES", 64 * 1024 * 1024)
+CACHE_DIR = env_str("TRIANGULATOR_CACHE_DIR")
+# Budget en octets du niveau disque du cache (CACHE_DIR) ; au-delà, les
+# fichiers les moins récemment utilisés sont supprimés.
+CACHE_DISK_MAX_BYTES = env_int("TRIANGULATOR_CACHE_DISK_MAX_BYTES", 1024 * 1024 * 1024)
+# Budget, en nombre de points, des triangulations modifiables conservées pour
+# les mises à jour incrémentales (0 = désactivé).
+INCREMENTAL_MAX_POINTS = env_int("TRIANGULATOR_INCREMENTAL_MAX_POINTS", 0)
+
+PSM_POOL_SIZE = env_int("TRIANGULATOR_PSM_POOL_SIZE", 8)
+PSM_CONNECT_TIMEOUT = float(env_str("TRIANGULATOR_PSM_CONNECT_TIMEOUT", "5"))
+PSM_READ_TIMEOUT = float(env_str("TRIANGULATOR_PSM_READ_TIMEOUT", "5"))
+# Connexions au PSM ouvertes dès le démarrage de l'application (0 = aucune).
+PSM_PREWARM_CONNECTIONS = env_int("TRIANGULATOR_PSM_PREWARM_CONNECTIONS", 0)
+
+WORKER_PROCESSES = env_int("TRIANGULATOR_WORKERS", 0)
+JOB_TIMEOUT = float(env_str("TRIANGULATOR_JOB_TIMEOUT", "300"))
+PARALLEL_MIN_POINTS = env_int("TRIANGULATOR_PARALLEL_MIN_POINTS", 200000)
+
+BATCH_MAX_ITEMS = env_int("TRIANGULATOR_BATCH_MAX_ITEMS", 1000)
+BATCH_CONCURRENCY = env_int("TRIANGULATOR_BATCH_CONCURRENCY", PSM_POOL_SIZE)
+
+UPLOAD_MAX_BYTES = env_int("TRIANGULATOR_UPLOAD_MAX_BYTES", 64 * 1024 * 1024)
+
+# Contrôle d'admission : coût (en points) des calculs simultanés (0 = sans
+# limite), taille d'une « petite » requête, attente et file maximales.
+ADMISSION_MAX_COST = env_int("TRIANGULATOR_ADMISSION_MAX_COST", 2_000_000)
+ADMISSION_SMALL_COST = env_int("TRIANGULATOR_ADMISSION_SMALL_COST", 50_000)
+ADMISSION_QUEUE_TIMEOUT = float(env_str("TRIANGULATOR_ADMISSION_QUEUE_TIMEOUT", "5"))
+ADMISSION_MAX_QUEUE = env_int("TRIANGULATOR_ADMISSION_MAX_QUEUE", 64)
+
+PROFILE_DIR = env_str("TRIANGULATOR_PROFILE_DIR")
+PROFILE_THRESHOLD = float(env_str("TRIANGULATOR_PROFILE_THRESHOLD", "0"))
+PROFILE_INTERVAL = float(env_str("TRIANGULATOR_PROFILE_INTERVAL", "0.005"))
+
+SPILL_THRESHOLD = env_int("TRIANGULATOR_SPILL_THRESHOLD", 0)
+SPILL_DIR = env_str("TRIANGULATOR_SPILL_DIR")
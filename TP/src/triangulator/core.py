@@ -1,78 +1,212 @@
-import io
 import struct
+import sys
+import uuid
+from array import array
+from itertools import chain
 
 from .execption import InsufficientPointsError, InvalidBinaryFormat
+from .ordering import ORDERINGS, hilbert_keys
+from .predicates import incircle, orient2d
+from .store import CIRCLE_MARGIN, FLAT_RATIO, NAN, NO_NEIGHBOUR, TriangleStore
 
 PSM_BASE_URL = "http://point-set-manager-service:8080" 
 
-def deserialize_pointset(data: bytes) -> list[tuple[float, float]]:
-    """Convertit les données binaires PointSet en liste de tuples (X, Y)."""
-    HEADER_SIZE = 4
-    POINT_SIZE = 8 
+HEADER_SIZE = 4
+POINT_SIZE = 8
+CHUNK_ITEMS = 16384
+# Trame d'un résultat de lot : UUID (16 octets), statut HTTP (uint16) et
+# taille du contenu (uint32), suivis du contenu.
+BATCH_FRAME = struct.Struct('<16sHI')
+
+def deserialize_pointset_buffer(data) -> memoryview:
+    """Décode un PointSet binaire en vue float32 sans copie.
+
+    La vue renvoyée est à plat (x0, y0, x1, y1, ...), c'est-à-dire une
+    matrice (N, 2) en ordre C, et partage la mémoire de `data` sur les
+    machines little-endian.
+    """
+    view = memoryview(data).cast('B')
 
-    if len(data) < HEADER_SIZE:
+    if len(view) < HEADER_SIZE:
         raise InvalidBinaryFormat(
             "Données PointSet trop courtes pour l'en-tête."
         )
-    try:
-        num_points = struct.unpack('<I', data[:HEADER_SIZE])[0]
-    except struct.error:
-        raise InvalidBinaryFormat(
-            "Impossible de lire le nombre de points dans l'en-tête."
-        ) from struct.error
+    num_points = struct.unpack_from('<I', view)[0]
 
-    expected_data_size = num_points * POINT_SIZE
-    
-    if len(data) != HEADER_SIZE + expected_data_size:
+    if len(view) != HEADER_SIZE + num_points * POINT_SIZE:
         raise InvalidBinaryFormat(
             "Taille du binaire incohérente avec le nombre de points déclaré."
         )
-    
-    points = []
-    
-    for i in range(num_points):
-        offset = HEADER_SIZE + i * POINT_SIZE
-        x, y = struct.unpack('<ff', data[offset:offset + POINT_SIZE])
-        points.append((x, y))
-        
-    return points
+
+    if sys.byteorder == 'little':
+        return view[HEADER_SIZE:].cast('f')
+    coords = array('f')
+    coords.frombytes(view[HEADER_SIZE:])
+    coords.byteswap()
+    return memoryview(coords)
+
+def deserialize_pointset(data: bytes) -> list[tuple[float, float]]:
+    """Convertit les données binaires PointSet en liste de tuples (X, Y)."""
+    coords = deserialize_pointset_buffer(data).tolist()
+    return list(zip(coords[0::2], coords[1::2], strict=True))
+
+class PointSetView:
+    """Séquence de points (x, y) lue directement dans un buffer float32 à plat.
+
+    Remplace la liste de tuples de `deserialize_pointset` quand le PointSet
+    est trop grand pour être dupliqué : chaque tuple est créé à la lecture,
+    et `coords` reste la vue du buffer d'origine (par exemple une projection
+    mmap).
+    """
+
+    __slots__ = ("coords",)
+
+    def __init__(self, coords):
+        """Enveloppe un buffer float32 à plat (x0, y0, x1, y1, ...)."""
+        self.coords = coords
+
+    def __len__(self):
+        return len(self.coords) // 2
+
+    def __getitem__(self, i):
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("Indice de point hors limite.")
+        return self.coords[2 * i], self.coords[2 * i + 1]
+
+    def __iter__(self):
+        values = iter(self.coords)
+        return zip(values, values, strict=True)
+
+def deserialize_pointset_view(data) -> PointSetView:
+    """Variante sans copie de `deserialize_pointset` (voir PointSetView)."""
+    return PointSetView(deserialize_pointset_buffer(data))
+
+def _checked_buffers(coords, indices):
+    """Valide les buffers de sommets et d'indices avant sérialisation.
+
+    Renvoie des vues float32 / uint32 little-endian prêtes à être écrites.
+    """
+    coords = memoryview(coords).cast('B').cast('f')
+    indices = memoryview(indices).cast('B').cast('I')
+
+    if len(coords) % 2 or len(indices) % 3:
+        raise InvalidBinaryFormat(
+            "Buffers de sommets ou de triangles de taille incohérente."
+        )
+    if len(indices) and max(indices) >= len(coords) // 2:
+        raise InvalidBinaryFormat(
+            "Indice de sommet hors limite dans la sérialisation des triangles."
+        )
+
+    if sys.byteorder != 'little':
+        coords = array('f', coords)
+        coords.byteswap()
+        indices = array('I', indices)
+        indices.byteswap()
+        coords, indices = memoryview(coords), memoryview(indices)
+    return coords, indices
+
+def _triangle_arrays(points: list, triangles: list):
+    """Convertit les listes de tuples en buffers float32 / uint32."""
+    coords = array('f', chain.from_iterable(points))
+    try:
+        indices = array('I', chain.from_iterable(triangles))
+    except OverflowError as e:
+        raise InvalidBinaryFormat(
+            "Indice de sommet hors limite dans la sérialisation des triangles."
+        ) from e
+
+    if len(indices) != 3 * len(triangles):
+        raise InvalidBinaryFormat("Chaque triangle doit avoir trois sommets.")
+    return coords, indices
+
+def serialize_triangles_buffer(coords, indices) -> bytes:
+    """Construit le binaire Triangles en une seule écriture.
+
+    `coords` est un buffer float32 à plat (x0, y0, ...) et `indices` un
+    buffer uint32 à plat (T, 3) d'indices de sommets, par exemple des
+    `array('f')` et `array('I')`.
+    """
+    coords, indices = _checked_buffers(coords, indices)
+
+    return b''.join((
+        struct.pack('<I', len(coords) // 2), coords,
+        struct.pack('<I', len(indices) // 3), indices,
+    ))
 
 def serialize_triangles(points: list, triangles: list) -> bytes:
     """Convertit la liste de points et d'indices de triangles
     en format binaire Triangles.
     """
-    buffer = io.BytesIO()
-    
-    num_points = len(points)
-    buffer.write(struct.pack('<I', num_points))
-    
-    for x, y in points:
-        buffer.write(struct.pack('<ff', x, y))
-    
-    num_triangles = len(triangles)
-    buffer.write(struct.pack('<I', num_triangles))
-    
-    max_index = num_points - 1
-    
-    for i1, i2, i3 in triangles:
-        if (
-            i1 > max_index or i2 > max_index or i3 > max_index or 
-            i1 < 0 or i2 < 0 or i3 < 0
-        ):
-            raise InvalidBinaryFormat(
-                "Indice de sommet hors limite dans la sérialisation des triangles."
-            )
-            
-        buffer.write(struct.pack('<III', i1, i2, i3))
-        
-    return buffer.getvalue()
+    return serialize_triangles_buffer(*_triangle_arrays(points, triangles))
+
+def iter_serialize_triangles_buffer(coords, indices, chunk_items=CHUNK_ITEMS):
+    """Produit le binaire Triangles par morceaux de taille fixe.
+
+    Le bloc des sommets est émis en premier, puis les triangles, par
+    paquets de `chunk_items` éléments. La validation est faite avant le
+    premier morceau, pour qu'une erreur puisse encore être renvoyée au client.
+    """
+    coords, indices = _checked_buffers(coords, indices)
+    return _iter_chunks(coords, indices, chunk_items)
+
+def iter_serialize_triangles(points: list, triangles: list, chunk_items=CHUNK_ITEMS):
+    """Équivalent par morceaux de `serialize_triangles`."""
+    return iter_serialize_triangles_buffer(
+        *_triangle_arrays(points, triangles), chunk_items
+    )
+
+def _iter_chunks(coords, indices, chunk_items):
+    """Générateur des morceaux : en-tête et sommets, puis triangles."""
+    yield struct.pack('<I', len(coords) // 2)
+    step = 2 * chunk_items
+    for start in range(0, len(coords), step):
+        yield coords[start:start + step].tobytes()
+
+    yield struct.pack('<I', len(indices) // 3)
+    step = 3 * chunk_items
+    for start in range(0, len(indices), step):
+        yield indices[start:start + step].tobytes()
+
+def pack_batch_frame(pointset_id: str, status: int, payload: bytes) -> bytes:
+    """Encode le résultat d'un élément de lot en trame binaire.
+
+    Le contenu est le binaire Triangles si `status` vaut 200, sinon l'erreur
+    JSON que renverrait la route unitaire.
+    """
+    header = BATCH_FRAME.pack(uuid.UUID(pointset_id).bytes, status, len(payload))
+    return header + payload
+
+def iter_batch_frames(data):
+    """Décode un flux de lot en triplets (pointSetId, statut, contenu)."""
+    view = memoryview(data).cast('B')
+    offset = 0
+    while offset < len(view):
+        if len(view) - offset < BATCH_FRAME.size:
+            raise InvalidBinaryFormat("En-tête de trame de lot tronqué.")
+        raw_id, status, size = BATCH_FRAME.unpack_from(view, offset)
+        offset += BATCH_FRAME.size
+        if len(view) - offset < size:
+            raise InvalidBinaryFormat("Contenu de trame de lot tronqué.")
+        yield str(uuid.UUID(bytes=raw_id)), status, view[offset:offset + size].tobytes()
+        offset += size
 
 def is_collinear(p1, p2, p3, epsilon=1e-9):
-    """Vérifie si trois points sont colinéaires (standard library only)."""
-    val = abs(p1[0] * (p2[1] - p3[1]) + 
-              p2[0] * (p3[1] - p1[1]) + 
-              p3[0] * (p1[1] - p2[1]))
-    return val < epsilon
+    """Vérifie si trois points sont colinéaires (standard library only).
+
+    `epsilon` est relatif à l'échelle du triangle : l'aire signée est
+    comparée au carré de sa plus grande arête. Avec `epsilon=0`, le test est
+    exact.
+    """
+    area = orient2d(p1[0], p1[1], p2[0], p2[1], p3[0], p3[1])
+    scale = max(
+        (p2[0] - p1[0])**2 + (p2[1] - p1[1])**2,
+        (p3[0] - p1[0])**2 + (p3[1] - p1[1])**2,
+        (p3[0] - p2[0])**2 + (p3[1] - p2[1])**2,
+    )
+    return abs(area) <= epsilon * scale
 
 def get_circumcircle(p1, p2, p3):
     """Calcule le centre et le rayon au carré du cercle circonscrit à 3 points."""
@@ -97,61 +231,514 @@ def get_circumcircle(p1, p2, p3):
     radius_sq = (x1 - ux)**2 + (y1 - uy)**2
     return center, radius_sq
 
-def triangulate_points(points: list[tuple[float, float]]) -> list[tuple[int, int, int]]:
-    """Calcule la triangulation de Delaunay via l'algorithme de Bowyer-Watson."""
+def _locate_triangle(store, start, px, py):
+    """Localise le triangle contenant (px, py) par marche depuis `start`.
+
+    À chaque pas, on traverse la première arête qui laisse le point à sa
+    droite. Dans une triangulation de Delaunay cette marche termine toujours ;
+    une recherche linéaire sert uniquement de garde-fou numérique.
+    """
+    xs, ys = store.xs, store.ys
+    vertices, neighbours = store.vertices, store.neighbours
+    t = start
+    for _ in range(len(vertices) // 3 + 1):
+        if t < 0:
+            break
+        a, b, c = vertices[t:t + 3]
+        if orient2d(xs[b], ys[b], xs[c], ys[c], px, py) < 0:
+            t = neighbours[t]
+        elif orient2d(xs[c], ys[c], xs[a], ys[a], px, py) < 0:
+            t = neighbours[t + 1]
+        elif orient2d(xs[a], ys[a], xs[b], ys[b], px, py) < 0:
+            t = neighbours[t + 2]
+        else:
+            return t
+
+    for t in store.triangles():
+        a, b, c = vertices[t:t + 3]
+        if (
+            orient2d(xs[b], ys[b], xs[c], ys[c], px, py) >= 0 and
+            orient2d(xs[c], ys[c], xs[a], ys[a], px, py) >= 0 and
+            orient2d(xs[a], ys[a], xs[b], ys[b], px, py) >= 0
+        ):
+            return t
+    return start
+
+def unique_points(points):
+    """Élimine les points en double, en O(n) grâce à un index par hachage.
+
+    Renvoie (points uniques, indices d'origine) : le k-ième point unique est
+    la première occurrence `points[originals[k]]`. Sans doublon, la liste
+    d'origine est renvoyée telle quelle avec None comme indices.
+    """
     n = len(points)
-    if n < 3:
+    first = dict(zip(reversed(points), range(n - 1, -1, -1), strict=True))
+    if len(first) == n:
+        return points, None
+    originals = sorted(first.values())
+    return [points[i] for i in originals], originals
+
+def all_collinear(points) -> bool:
+    """Indique, en O(n) et de façon exacte, si des points distincts sont
+    tous alignés (aucun triangle n'est alors possible).
+    """
+    (ax, ay), (bx, by) = points[0], points[1]
+    return all(orient2d(ax, ay, bx, by, x, y) == 0 for x, y in points)
+
+def remap_triangles(triangles, originals):
+    """Ramène des triangles d'indices de points uniques aux indices d'origine."""
+    return [(originals[a], originals[b], originals[c]) for a, b, c in triangles]
+
+def _prepare(points, order):
+    """Valide l'entrée puis applique la passe de nettoyage.
+
+    Renvoie (points uniques, indices d'origine ou None), ou None si les
+    points distincts sont moins de trois ou tous alignés.
+    """
+    if len(points) < 3:
         raise InsufficientPointsError("Moins de 3 points fournis.")
+    if order not in ORDERINGS:
+        raise ValueError(f"Ordre d'insertion inconnu : {order}")
+    unique, originals = unique_points(points)
+    if len(unique) < 3 or all_collinear(unique):
+        return None
+    return unique, originals
+
+def triangulate_points(
+    points: list[tuple[float, float]], order: str = "brio"
+) -> list[tuple[int, int, int]]:
+    """Calcule la triangulation de Delaunay via l'algorithme de Bowyer-Watson.
+
+    Version incrémentale : chaque triangle connaît ses trois voisins, chaque
+    point est localisé par marche depuis le dernier triangle créé et la
+    cavité est obtenue par parcours en largeur des triangles voisins dont le
+    cercle circonscrit contient le point. Les points sont insérés dans
+    l'ordre `order` ("brio", "hilbert" ou "grid", voir le module ordering)
+    pour garder la marche courte ; les indices renvoyés restent ceux de
+    `points` et les triangles sont orientés dans le sens trigonométrique.
+
+    Une passe préalable retire les doublons (seule la première occurrence
+    est triangulée) et renvoie directement une liste vide si tous les
+    points sont alignés.
+    """
+    prepared = _prepare(points, order)
+    if prepared is None:
+        return []
+    unique, originals = prepared
+
+    store = _triangulate_store(unique, order)
+    n = len(unique)
+    vertices = store.vertices
+    triangles = [
+        tuple(vertices[t:t + 3]) for t in store.triangles()
+        if max(vertices[t:t + 3]) < n
+    ]
+    if originals is None:
+        return triangles
+    return remap_triangles(triangles, originals)
+
+def triangulate_indices(points, order: str = "brio") -> array:
+    """Variante de `triangulate_points` renvoyant les indices à plat.
+
+    Le résultat est un `array('i')` (a0, b0, c0, a1, ...), soit 12 octets
+    par triangle au lieu d'un tuple ; il se sérialise directement avec
+    `iter_serialize_triangles_buffer`.
+    """
+    indices = array('i')
+    prepared = _prepare(points, order)
+    if prepared is None:
+        return indices
+    unique, originals = prepared
+
+    store = _triangulate_store(unique, order)
+    n = len(unique)
+    vertices = store.vertices
+    for t in store.triangles():
+        triangle = vertices[t:t + 3]
+        if max(triangle) < n:
+            indices.extend(triangle)
+    if originals is not None:
+        indices = array('i', [originals[i] for i in indices])
+    return indices
+
+def _triangulate_store(points, order="brio") -> TriangleStore:
+    """Construit la triangulation, super-triangle compris, dans un TriangleStore.
+
+    Les sommets d'indices n à n + 2 sont ceux du super-triangle. Le test du
+    cercle compare d'abord le point au cercle circonscrit mémorisé et ne
+    recourt au prédicat `incircle` que lorsque le point en est très proche.
+    Les points sont supposés distincts ; un seul suffit (voir Triangulation).
+    """
+    n = len(points)
+    if n < 1:
+        raise InsufficientPointsError("Aucun point fourni.")
+    if order not in ORDERINGS:
+        raise ValueError(f"Ordre d'insertion inconnu : {order}")
 
     min_x = min(p[0] for p in points)
     max_x = max(p[0] for p in points)
     min_y = min(p[1] for p in points)
     max_y = max(p[1] for p in points)
     dx, dy = max_x - min_x, max_y - min_y
-    delta = max(dx, dy)
+    delta = max(dx, dy) or 1.0
     mid_x, mid_y = (min_x + max_x) / 2, (min_y + max_y) / 2
 
-    st_points = [
-        (mid_x - 20 * delta, mid_y - delta),
-        (mid_x + 20 * delta, mid_y - delta),
-        (mid_x, mid_y + 20 * delta)
-    ]
-    all_pts = points + st_points
-    triangulation = [(n, n + 1, n + 2)]
-
-    for i, p in enumerate(points):
-        bad_triangles = []
-        for tri in triangulation:
-            center, r_sq = get_circumcircle(
-                all_pts[tri[0]], 
-                all_pts[tri[1]], 
-                all_pts[tri[2]])
-            dist_sq = (p[0] - center[0])**2 + (p[1] - center[1])**2
-            if dist_sq < r_sq:
-                bad_triangles.append(tri)
-
-        polygon = []
-        for tri in bad_triangles:
-            edges = [(tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])]
-            for edge in edges:
-                is_shared = any(
-                    all(e in other for e in edge) or 
-                    all(e in other for e in edge[::-1])
-                    for other in bad_triangles if other != tri
-                )
-
-                if not is_shared:
-                    polygon.append(edge)
-
-        for tri in bad_triangles:
-            triangulation.remove(tri)
-
-        for edge in polygon:
-            triangulation.append((edge[0], edge[1], i))
-
-    final_triangulation = []
-    for tri in triangulation:
-        if not any(idx >= n for idx in tri):
-            final_triangulation.append(tri)
-
-    return final_triangulation
\ No newline at end of file
+    xs = [p[0] for p in points] + [mid_x - 20 * delta, mid_x + 20 * delta, mid_x]
+    ys = [p[1] for p in points] + [mid_y - delta, mid_y - delta, mid_y + 20 * delta]
+
+    store = TriangleStore(xs, ys)
+    last = store.add(n, n + 1, n + 2)
+    for i in ORDERINGS[order](xs, ys, n, min_x, min_y, delta):
+        last = _insert_vertex(store, i, last)
+
+    return store
+
+def _insert_vertex(store, i, start) -> int:
+    """Insère le sommet `i` du stockage par Bowyer-Watson.
+
+    Le triangle qui le contient est localisé par marche depuis `start`, la
+    cavité est obtenue par parcours en largeur des voisins dont le cercle
+    circonscrit contient le point, puis remplacée par un éventail autour du
+    point. Renvoie le dernier triangle créé (ou celui trouvé si le point est
+    déjà un sommet), point de départ de la prochaine marche.
+    """
+    xs, ys = store.xs, store.ys
+    vertices, neighbours, circles = store.vertices, store.neighbours, store.circles
+    free = store.free
+    low, high = 1 - CIRCLE_MARGIN, 1 + CIRCLE_MARGIN
+    px, py = xs[i], ys[i]
+    seed = _locate_triangle(store, start, px, py)
+    a, b, c = vertices[seed:seed + 3]
+    if (
+        (xs[a] == px and ys[a] == py) or
+        (xs[b] == px and ys[b] == py) or
+        (xs[c] == px and ys[c] == py)
+    ):
+        return seed
+
+    cavity = [seed]
+    in_cavity = {seed}
+    boundary = []
+    for t in cavity:
+        va, vb, vc = vertices[t:t + 3]
+        for k, other in enumerate(neighbours[t:t + 3]):
+            if other in in_cavity:
+                continue
+            if other >= 0:
+                ox, oy = px - circles[other], py - circles[other + 1]
+                d_sq, r_sq = ox * ox + oy * oy, circles[other + 2]
+                if d_sq < low * r_sq:
+                    inside = True
+                elif d_sq > high * r_sq:
+                    inside = False
+                else:
+                    a, b, c = vertices[other:other + 3]
+                    inside = incircle(
+                        xs[a], ys[a], xs[b], ys[b], xs[c], ys[c], px, py
+                    ) > 0
+                if inside:
+                    in_cavity.add(other)
+                    cavity.append(other)
+                    continue
+                back = other + neighbours[other:other + 3].index(t)
+            else:
+                back = -1
+            if k == 0:
+                boundary.append((vb, vc, other, back))
+            elif k == 1:
+                boundary.append((vc, va, other, back))
+            else:
+                boundary.append((va, vb, other, back))
+
+    # La frontière compte toujours deux arêtes de plus que la cavité :
+    # ses emplacements sont réutilisés et deux triangles sont ajoutés, dans
+    # des emplacements libérés s'il y en a, sinon en fin de colonnes. Le
+    # calcul du cercle est déroulé ici car c'est la boucle chaude (voir
+    # TriangleStore.update_circle).
+    by_start = {}
+    by_end = {}
+    for j, (a, b, other, back) in enumerate(boundary):
+        if j < len(cavity):
+            t = cavity[j]
+            vertices[t] = a
+            vertices[t + 1] = b
+            vertices[t + 2] = i
+            neighbours[t + 2] = other
+        elif free:
+            t = free.pop()
+            vertices[t] = a
+            vertices[t + 1] = b
+            vertices[t + 2] = i
+            neighbours[t + 2] = other
+        else:
+            t = len(vertices)
+            vertices.extend((a, b, i))
+            neighbours.extend((NO_NEIGHBOUR, NO_NEIGHBOUR, other))
+            circles.extend((0.0, 0.0, 0.0))
+        ax, ay = xs[a], ys[a]
+        bx, by = xs[b] - ax, ys[b] - ay
+        cx, cy = px - ax, py - ay
+        d = 2 * (bx * cy - by * cx)
+        b_sq = bx * bx + by * by
+        c_sq = cx * cx + cy * cy
+        if abs(d) > FLAT_RATIO * (b_sq + c_sq):
+            ux = (cy * b_sq - by * c_sq) / d
+            uy = (bx * c_sq - cx * b_sq) / d
+            circles[t] = ax + ux
+            circles[t + 1] = ay + uy
+            circles[t + 2] = ux * ux + uy * uy
+        else:
+            circles[t] = circles[t + 1] = circles[t + 2] = NAN
+        if other >= 0:
+            neighbours[back] = t
+        by_start[a] = t
+        by_end[b] = t
+
+    for a, t in by_start.items():
+        neighbours[t] = by_start[vertices[t + 1]]
+        neighbours[t + 1] = by_end[a]
+    return t
+
+class Triangulation:
+    """Triangulation de Delaunay modifiable point par point.
+
+    Construite une fois comme `triangulate_points`, elle conserve son
+    TriangleStore, super-triangle compris : `insert` creuse la cavité du
+    nouveau point comme lors de la construction, `remove` retire l'étoile du
+    point et comble le trou par des oreilles de Delaunay, et `update` applique
+    la différence avec une nouvelle version du PointSet. Les points forment
+    un ensemble (un doublon n'est pas inséré) ; `points` et `triangles()` se
+    sérialisent à tout moment avec `serialize_triangles`.
+    """
+
+    # Au-delà de cette part de points modifiés, `update` reconstruit tout :
+    # une insertion isolée coûte plus cher qu'une insertion en bloc ordonnée.
+    REBUILD_RATIO = 0.25
+
+    def __init__(self, points, order: str = "brio"):
+        """Triangule `points` (au moins trois), doublons retirés."""
+        if len(points) < 3:
+            raise InsufficientPointsError("Moins de 3 points fournis.")
+        if order not in ORDERINGS:
+            raise ValueError(f"Ordre d'insertion inconnu : {order}")
+        self.order = order
+        self._build(list(dict.fromkeys(points)))
+
+    def _build(self, points):
+        """(Re)construit le stockage à partir de points distincts.
+
+        Le super-triangle est dimensionné sur leur boîte englobante ; un
+        point inséré plus tard hors de cette boîte élargie de sa taille
+        (`_fits`) provoque une reconstruction.
+        """
+        self._store = _triangulate_store(points, self.order)
+        n = len(points)
+        self._super = n
+        self._slots = {point: i for i, point in enumerate(points)}
+        self._free_slots = []
+        self._last = len(self._store.vertices) - 3
+
+        xs, ys = self._store.xs, self._store.ys
+        min_x, max_x = min(xs[:n]), max(xs[:n])
+        min_y, max_y = min(ys[:n]), max(ys[:n])
+        delta = max(max_x - min_x, max_y - min_y) or 1.0
+        self._frame = (min_x, min_y, delta)
+        self._bounds = (min_x - delta, max_x + delta, min_y - delta, max_y + delta)
+
+    def __len__(self):
+        """Nombre de points de la triangulation."""
+        return len(self._slots)
+
+    def __contains__(self, point):
+        """Indique si `point` est un sommet de la triangulation."""
+        return tuple(point) in self._slots
+
+    @property
+    def points(self) -> list[tuple[float, float]]:
+        """Points de la triangulation, dans l'ordre où ils ont été ajoutés."""
+        return list(self._slots)
+
+    def _fits(self, x, y) -> bool:
+        """Indique si (x, y) peut être inséré sans changer de super-triangle."""
+        min_x, max_x, min_y, max_y = self._bounds
+        return min_x <= x <= max_x and min_y <= y <= max_y
+
+    def insert(self, point) -> bool:
+        """Insère un point ; renvoie False s'il est déjà présent."""
+        point = tuple(point)
+        if point in self._slots:
+            return False
+        if not self._fits(*point):
+            self._build([*self._slots, point])
+            return True
+        self._insert_slot(point)
+        return True
+
+    def _insert_slot(self, point):
+        """Attribue un emplacement de sommet au point et l'insère."""
+        xs, ys = self._store.xs, self._store.ys
+        if self._free_slots:
+            slot = self._free_slots.pop()
+            xs[slot], ys[slot] = point
+        else:
+            slot = len(xs)
+            xs.append(point[0])
+            ys.append(point[1])
+        self._slots[point] = slot
+        self._last = _insert_vertex(self._store, slot, self._last)
+
+    def remove(self, point) -> bool:
+        """Retire un point ; renvoie False s'il est absent."""
+        point = tuple(point)
+        slot = self._slots.pop(point, None)
+        if slot is None:
+            return False
+        if not self._remove_slot(slot, *point):
+            self._build(list(self._slots))
+            return True
+        self._free_slots.append(slot)
+        return True
+
+    def _remove_slot(self, slot, x, y) -> bool:
+        """Retire le sommet `slot` et retriangule le trou laissé.
+
+        L'étoile du sommet est parcourue dans le sens trigonométrique pour
+        obtenir le polygone de ses voisins ; une oreille convexe dont le
+        cercle circonscrit ne contient aucun autre sommet du polygone est un
+        triangle de Delaunay, on la découpe jusqu'à épuisement. Renvoie
+        False si la réparation locale échoue (la reconstruction prend alors
+        le relais).
+        """
+        store = self._store
+        xs, ys = store.xs, store.ys
+        vertices, neighbours = store.vertices, store.neighbours
+
+        t = _locate_triangle(store, self._last, x, y)
+        if slot not in vertices[t:t + 3]:
+            t = next(
+                (t for t in store.triangles() if slot in vertices[t:t + 3]), -1
+            )
+            if t < 0:
+                return False
+
+        star, ring, outer = [], [], {}
+        first = t
+        while True:
+            k = vertices[t:t + 3].index(slot)
+            b = vertices[t + (k + 1) % 3]
+            c = vertices[t + (k + 2) % 3]
+            other = neighbours[t + k]
+            back = (
+                other + neighbours[other:other + 3].index(t) if other >= 0 else -1
+            )
+            star.append(t)
+            ring.append(b)
+            outer[(b, c)] = (other, back)
+            t = neighbours[t + (k + 1) % 3]
+            if t == first:
+                break
+            if t < 0 or len(star) > len(vertices) // 3:
+                return False
+
+        ears = []
+        polygon = ring[:]
+        while len(polygon) > 3:
+            m = len(polygon)
+            for j in range(m):
+                a, b, c = polygon[j], polygon[(j + 1) % m], polygon[(j + 2) % m]
+                ax, ay, bx, by, cx, cy = xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]
+                if orient2d(ax, ay, bx, by, cx, cy) <= 0:
+                    continue
+                if any(
+                    incircle(ax, ay, bx, by, cx, cy, xs[v], ys[v]) > 0
+                    for v in polygon if v != a and v != b and v != c
+                ):
+                    continue
+                ears.append((a, b, c))
+                del polygon[(j + 1) % m]
+                break
+            else:
+                return False
+        a, b, c = polygon
+        if orient2d(xs[a], ys[a], xs[b], ys[b], xs[c], ys[c]) <= 0:
+            return False
+        ears.append((a, b, c))
+
+        for t in star:
+            store.release(t)
+        inner = {}
+        for a, b, c in ears:
+            t = store.add(a, b, c)
+            for k, edge in enumerate(((b, c), (c, a), (a, b))):
+                if edge in outer:
+                    other, back = outer[edge]
+                    neighbours[t + k] = other
+                    if other >= 0:
+                        neighbours[back] = t
+                elif edge[::-1] in inner:
+                    twin = inner.pop(edge[::-1])
+                    neighbours[t + k] = twin - twin % 3
+                    neighbours[twin] = t
+                else:
+                    inner[edge] = t + k
+        self._last = t
+        return True
+
+    def update(self, points) -> tuple[int, int]:
+        """Fait correspondre la triangulation à `points` (au moins trois).
+
+        Seule la différence est appliquée : retraits, puis insertions dans
+        l'ordre de Hilbert pour garder la marche de localisation courte. Si
+        plus de REBUILD_RATIO des points changent, ou si un nouveau point
+        sort du cadre du super-triangle, tout est reconstruit. Renvoie le
+        nombre de points (insérés, retirés).
+        """
+        if len(points) < 3:
+            raise InsufficientPointsError("Moins de 3 points fournis.")
+        wanted = dict.fromkeys(points)
+        removed = [point for point in self._slots if point not in wanted]
+        added = [point for point in wanted if point not in self._slots]
+        if (
+            len(removed) + len(added) > self.REBUILD_RATIO * len(wanted)
+            or not all(self._fits(x, y) for x, y in added)
+        ):
+            self._build(list(wanted))
+            return len(added), len(removed)
+
+        for point in removed:
+            self.remove(point)
+        min_x, min_y, delta = self._frame
+        keys = hilbert_keys(
+            [x for x, _ in added], [y for _, y in added], range(len(added)),
+            min_x, min_y, delta,
+        )
+        for j in sorted(range(len(added)), key=keys.__getitem__):
+            self._insert_slot(added[j])
+        return len(added), len(removed)
+
+    def triangles(self, points=None) -> list[tuple[int, int, int]]:
+        """Renvoie les triangles, orientés dans le sens trigonométrique.
+
+        Les indices désignent `points` (par défaut `self.points`), qui doit
+        contenir chaque point de la triangulation ; un point répété prend
+        l'indice de sa première occurrence.
+        """
+        if points is None:
+            points = self._slots
+        first = dict(zip(reversed(points), range(len(points) - 1, -1, -1),
+                         strict=True))
+        remap = [-1] * len(self._store.xs)
+        try:
+            for point, slot in self._slots.items():
+                remap[slot] = first[point]
+        except KeyError as e:
+            raise ValueError(f"Point absent de la liste fournie : {e}") from e
+
+        vertices = self._store.vertices
+        triangles = []
+        for t in self._store.triangles():
+            a, b, c = vertices[t:t + 3]
+            a, b, c = remap[a], remap[b], remap[c]
+            if a >= 0 and b >= 0 and c >= 0:
+                triangles.append((a, b, c))
+        return triangles
@@ -0,0 +1,313 @@
+"""
+Module Encoding
+Description : Ce module gère la négociation et la production des encodages
+alternatifs du binaire Triangles (indices compacts, sommets omis,
+compression).
+"""
+import struct
+import sys
+import zlib
+from array import array
+from typing import NamedTuple
+
+from .execption import InvalidBinaryFormat, UnsupportedEncoding
+
+try:
+    from compression import zstd
+except ImportError:
+    zstd = None
+
+DEFAULT_MIMETYPE = "application/octet-stream"
+COMPACT_MIMETYPE = "application/x-triangles"
+
+INDEX_U32 = 0
+INDEX_U16 = 1
+INDEX_VARINT = 2
+INDEX_ENCODINGS = {"u32": INDEX_U32, "u16": INDEX_U16, "varint": INDEX_VARINT}
+# En-tête compact : drapeaux (uint8), nombre de sommets, nombre de triangles.
+COMPACT_HEADER = struct.Struct('<BII')
+FLAG_VERTICES = 0x01
+
+COMPRESSION_LEVEL = 6
+# Compressions proposées, dans l'ordre de préférence du serveur.
+CONTENT_CODINGS = ("zstd", "gzip", "deflate") if zstd is not None else (
+    "gzip", "deflate"
+)
+
+
+class Negotiated(NamedTuple):
+    """Résultat de la négociation d'une réponse Triangles.
+
+    `indices` vaut None pour le format par défaut ; sinon c'est "auto",
+    "u32", "u16" ou "varint" et `vertices` indique si les sommets sont
+    inclus. `coding` est la compression HTTP retenue, ou None.
+    """
+
+    indices: str | None = None
+    vertices: bool = True
+    coding: str | None = None
+
+    @property
+    def mimetype(self) -> str:
+        """Type de contenu de la réponse."""
+        return DEFAULT_MIMETYPE if self.indices is None else COMPACT_MIMETYPE
+
+
+def negotiate(accept: str | None, accept_encoding: str | None) -> Negotiated:
+    """Choisit l'encodage de la réponse d'après les en-têtes de la requête.
+
+    Le format compact est retenu si `application/x-triangles` est le type
+    accepté de plus forte qualité ; ses paramètres `indices` (auto, u32,
+    u16, varint) et `vertices` (1 ou 0) le précisent. Tout autre cas,
+    en-tête absent compris, donne le format par défaut. Un paramètre
+    invalide lève UnsupportedEncoding.
+    """
+    indices, vertices = None, True
+    for media_type, params in _by_quality(accept):
+        if media_type == COMPACT_MIMETYPE:
+            indices, vertices = _compact_params(params)
+            break
+        if media_type in (DEFAULT_MIMETYPE, "application/*", "*/*"):
+            break
+
+    coding = next(
+        (coding for coding, _ in _by_quality(accept_encoding)
+         if coding in CONTENT_CODINGS),
+        None,
+    )
+    return Negotiated(indices, vertices, coding)
+
+
+def _compact_params(params: dict) -> tuple[str, bool]:
+    """Valide les paramètres `indices` et `vertices` du format compact."""
+    indices = params.get("indices", "auto")
+    if indices != "auto" and indices not in INDEX_ENCODINGS:
+        raise UnsupportedEncoding(f"Encodage d'indices inconnu : {indices}")
+    vertices = params.get("vertices", "1")
+    if vertices not in ("0", "1"):
+        raise UnsupportedEncoding("Le paramètre vertices doit valoir 0 ou 1.")
+    return indices, vertices == "1"
+
+
+def _by_quality(header: str | None):
+    """Découpe un en-tête Accept* en (valeur, paramètres), par qualité
+    décroissante (l'ordre d'origine départage), sans les valeurs à q=0.
+    """
+    items = []
+    for position, item in enumerate((header or "").split(",")):
+        value, *raw_params = (part.strip() for part in item.split(";"))
+        params = {}
+        for raw in raw_params:
+            key, _, param = raw.partition("=")
+            params[key.strip().lower()] = param.strip().strip('"')
+        try:
+            quality = float(params.pop("q", "1"))
+        except ValueError:
+            quality = 0.0
+        if value and quality > 0:
+            items.append((-quality, position, value.lower(), params))
+    return [(value, params) for _, _, value, params in sorted(items)]
+
+
+def iter_encode(chunks, negotiated: Negotiated):
+    """Applique l'encodage négocié aux morceaux du binaire Triangles.
+
+    Le format compact est produit au fil de l'eau (voir
+    `iter_encode_compact`) ; la taille totale est lue sur `chunks.size` quand
+    le flux la connaît (`SpilledResult`).
+    """
+    if negotiated.indices is not None:
+        chunks = iter_encode_compact(
+            chunks, negotiated.indices, negotiated.vertices,
+            getattr(chunks, "size", None),
+        )
+    if negotiated.coding is not None:
+        chunks = _compress(chunks, negotiated.coding)
+    return chunks
+
+
+def encode_compact(triangles_bin, indices: str = "auto", vertices: bool = True):
+    """Réencode un binaire Triangles au format compact.
+
+    Format : drapeaux (uint8 ; bit 0 = sommets présents, bits 1-2 =
+    encodage des indices), nombre de sommets N (uint32), nombre de
+    triangles T (uint32), puis les N * 8 octets de sommets s'ils sont
+    présents, puis les 3 * T indices : uint32, uint16 (si N < 65536), ou
+    écarts successifs en zigzag et varint LEB128. Avec "auto", uint16 est
+    choisi dès que N < 65536, uint32 sinon ; uint16 demandé avec
+    N >= 65536 retombe aussi sur uint32.
+    """
+    return b"".join(iter_encode_compact(
+        [triangles_bin], indices, vertices, memoryview(triangles_bin).nbytes
+    ))
+
+
+def iter_encode_compact(chunks, indices: str = "auto", vertices: bool = True,
+                        size: int | None = None):
+    """Réencode au fil de l'eau un flux de morceaux du binaire Triangles au
+    format compact (voir `encode_compact`).
+
+    Les sommets sont relayés tels quels et les indices encodés morceau par
+    morceau. L'en-tête compact contient T, qui suit les sommets dans le
+    binaire Triangles : sans `size` (taille totale du binaire), seuls les
+    sommets sont gardés en mémoire le temps de le lire.
+    """
+    reader = _ChunkReader(chunks)
+    num_points = struct.unpack('<I', reader.read(4))[0]
+    encoding = INDEX_U16 if indices == "auto" else INDEX_ENCODINGS[indices]
+    if encoding == INDEX_U16 and num_points >= 1 << 16:
+        encoding = INDEX_U32
+    flags = (encoding << 1) | (FLAG_VERTICES if vertices else 0)
+
+    if size is not None:
+        num_triangles = (size - 8 - 8 * num_points) // 12
+        yield COMPACT_HEADER.pack(flags, num_points, num_triangles)
+        for piece in reader.iter_exact(8 * num_points):
+            if vertices:
+                yield piece
+        if struct.unpack('<I', reader.read(4))[0] != num_triangles:
+            raise InvalidBinaryFormat("Binaire Triangles tronqué.")
+    else:
+        coords = [piece for piece in reader.iter_exact(8 * num_points) if vertices]
+        num_triangles = struct.unpack('<I', reader.read(4))[0]
+        yield COMPACT_HEADER.pack(flags, num_points, num_triangles)
+        yield from coords
+
+    carry = b""
+    previous = 0
+    for piece in reader.iter_exact(12 * num_triangles):
+        if encoding == INDEX_U32:
+            yield piece
+            continue
+        piece = carry + piece
+        aligned = len(piece) - len(piece) % 4
+        carry = piece[aligned:]
+        values = array('I')
+        values.frombytes(piece[:aligned])
+        if not values:
+            continue
+        if sys.byteorder != 'little':
+            values.byteswap()
+        if encoding == INDEX_U16:
+            values = array('H', values)
+            if sys.byteorder != 'little':
+                values.byteswap()
+            yield values.tobytes()
+        else:
+            yield _delta_varint(values, previous)
+            previous = values[-1]
+    reader.expect_end()
+
+
+class _ChunkReader:
+    """Lit un nombre exact d'octets dans un flux de morceaux quelconques."""
+
+    def __init__(self, chunks):
+        """Prépare la lecture de l'itérable `chunks`."""
+        self._chunks = iter(chunks)
+        self._pending = b""
+
+    def iter_exact(self, count: int):
+        """Produit des morceaux totalisant exactement `count` octets.
+
+        Lève `InvalidBinaryFormat` si le flux se termine avant.
+        """
+        while count > 0:
+            if not self._pending:
+                chunk = next(self._chunks, None)
+                if chunk is None:
+                    raise InvalidBinaryFormat("Binaire Triangles tronqué.")
+                self._pending = bytes(chunk)
+                continue
+            piece = self._pending[:count]
+            self._pending = self._pending[count:]
+            count -= len(piece)
+            yield piece
+
+    def read(self, count: int) -> bytes:
+        """Lit exactement `count` octets."""
+        return b"".join(self.iter_exact(count))
+
+    def expect_end(self):
+        """Vérifie que le flux ne contient plus aucun octet."""
+        if self._pending or any(len(chunk) for chunk in self._chunks):
+            raise InvalidBinaryFormat("Binaire Triangles tronqué.")
+
+
+def decode_compact(data) -> tuple[int, bytes | None, list[int]]:
+    """Décode le format compact en (N, sommets ou None, indices à plat)."""
+    view = memoryview(data).cast('B')
+    if len(view) < COMPACT_HEADER.size:
+        raise InvalidBinaryFormat("En-tête Triangles compact tronqué.")
+    flags, num_points, num_triangles = COMPACT_HEADER.unpack_from(view)
+    offset = COMPACT_HEADER.size
+    coords = None
+    if flags & FLAG_VERTICES:
+        coords = view[offset:offset + 8 * num_points].tobytes()
+        offset += 8 * num_points
+    encoding = flags >> 1
+    body = view[offset:]
+    if encoding == INDEX_VARINT:
+        indices = _undelta_varint(body)
+    else:
+        indices = array('H' if encoding == INDEX_U16 else 'I')
+        if len(body) % indices.itemsize:
+            raise InvalidBinaryFormat("Binaire Triangles compact incohérent.")
+        indices.frombytes(body)
+        if sys.byteorder != 'little':
+            indices.byteswap()
+        indices = indices.tolist()
+    if len(indices) != 3 * num_triangles or (
+        coords is not None and len(coords) != 8 * num_points
+    ):
+        raise InvalidBinaryFormat("Binaire Triangles compact incohérent.")
+    return num_points, coords, indices
+
+
+def _delta_varint(values, previous: int = 0) -> bytes:
+    """Encode chaque indice par son écart au précédent (zigzag + varint).
+
+    `previous` est le dernier indice du morceau précédent.
+    """
+    out = bytearray()
+    for value in values:
+        delta = value - previous
+        previous = value
+        zigzag = delta << 1 if delta >= 0 else (-delta << 1) - 1
+        while zigzag >= 0x80:
+            out.append((zigzag & 0x7F) | 0x80)
+            zigzag >>= 7
+        out.append(zigzag)
+    return bytes(out)
+
+
+def _undelta_varint(data) -> list[int]:
+    """Inverse de `_delta_varint`."""
+    values = []
+    previous = zigzag = shift = 0
+    for byte in bytes(data):
+        zigzag |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+            continue
+        previous += zigzag >> 1 if not zigzag & 1 else -((zigzag + 1) >> 1)
+        values.append(previous)
+        zigzag = shift = 0
+    if shift:
+        raise InvalidBinaryFormat("Varint tronqué.")
+    return values
+
+
+def _compress(chunks, coding: str):
+    """Compresse un flux de morceaux sans l'assembler en mémoire."""
+    if coding == "zstd":
+        compressor = zstd.ZstdCompressor()
+    else:
+        compressor = zlib.compressobj(
+            COMPRESSION_LEVEL, zlib.DEFLATED, 31 if coding == "gzip" else 15
+        )
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
@@ -27,4 +27,31 @@ class PointSetNotFound(TriangulatorError):
 class PointSetManagerUnavailable(TriangulatorError):
     """Levée en cas d'erreur réseau ou si le PointSetManager retourne 503/5xx."""
 
-    pass
\ No newline at end of file
+    pass
+
+class TriangulationTimeout(TriangulatorError):
+    """Levée si une triangulation dépasse le délai accordé à un job."""
+
+    pass
+
+class WorkerCrashed(TriangulatorError):
+    """Levée si un worker du pool s'arrête (plantage, mémoire épuisée, arrêt
+    forcé) pendant un job.
+    """
+
+    pass
+
+class UnsupportedEncoding(TriangulatorError, ValueError):
+    """Levée si l'encodage demandé par le client (Accept) est invalide."""
+
+    pass
+
+class ServiceOverloaded(TriangulatorError):
+    """Levée si une triangulation est refusée faute de capacité (admission).
+
+    `retry_after` est le délai conseillé au client, en secondes.
+    """
+
+    def __init__(self, message: str, retry_after: int = 1):
+        super().__init__(message)
+        self.retry_after = retry_after
@@ -0,0 +1,174 @@
+"""
+Module Metrics
+Description : Ce module mesure la durée de chaque étape d'une triangulation
+et les tailles traitées, sous forme d'histogrammes exposés au format texte
+Prometheus et d'en-têtes Server-Timing.
+"""
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+STAGES = ("fetch", "queue", "deserialize", "triangulate", "serialize")
+DURATION_BUCKETS = (
+    0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5,
+    1.0, 2.5, 5.0, 10.0, 30.0, 60.0,
+)
+COUNT_BUCKETS = tuple(10 ** e for e in range(1, 8))
+BYTES_BUCKETS = tuple(2 ** e for e in range(10, 31, 2))
+
+# Durées des étapes de la requête en cours, pour l'en-tête Server-Timing.
+_request_timings = ContextVar("request_timings", default=None)
+
+
+class Histogram:
+    """Histogramme cumulatif à bornes fixes, sûr entre threads."""
+
+    def __init__(self, name: str, help_text: str, buckets, labels=()):
+        """Crée un histogramme vide ; `labels` nomme ses étiquettes."""
+        self.name = name
+        self.help_text = help_text
+        self.buckets = tuple(buckets)
+        self.labels = tuple(labels)
+        self._series = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *label_values):
+        """Enregistre une valeur pour la série `label_values`."""
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(label_values)
+            if series is None:
+                series = self._series[label_values] = [
+                    [0] * (len(self.buckets) + 1), 0.0, 0
+                ]
+            series[0][index] += 1
+            series[1] += value
+            series[2] += 1
+
+    def snapshot(self, *label_values) -> tuple[list[int], float, int]:
+        """Renvoie (compteurs par borne, somme, nombre) d'une série."""
+        with self._lock:
+            counts, total, count = self._series.get(
+                label_values, ([0] * (len(self.buckets) + 1), 0.0, 0)
+            )
+            return list(counts), total, count
+
+    def render(self) -> list[str]:
+        """Renvoie les lignes au format texte Prometheus."""
+        lines = [
+            f"# HELP {self.name} {self.help_text}",
+            f"# TYPE {self.name} histogram",
+        ]
+        with self._lock:
+            series = sorted(
+                (key, list(counts), total, count)
+                for key, (counts, total, count) in self._series.items()
+            )
+        for label_values, counts, total, count in series:
+            labels = [
+                f'{key}="{value}"'
+                for key, value in zip(self.labels, label_values, strict=True)
+            ]
+            cumulative = 0
+            for bound, bucket_count in zip(
+                (*self.buckets, "+Inf"), counts, strict=True
+            ):
+                cumulative += bucket_count
+                le = ",".join((*labels, f'le="{bound}"'))
+                lines.append(f"{self.name}_bucket{{{le}}} {cumulative}")
+            suffix = f"{{{','.join(labels)}}}" if labels else ""
+            lines.append(f"{self.name}_sum{suffix} {total}")
+            lines.append(f"{self.name}_count{suffix} {count}")
+        return lines
+
+
+stage_seconds = Histogram(
+    "triangulator_stage_seconds",
+    "Durée de chaque étape du traitement d'une requête.",
+    DURATION_BUCKETS,
+    labels=("stage",),
+)
+pointset_points = Histogram(
+    "triangulator_pointset_points", "Nombre de points par PointSet.", COUNT_BUCKETS
+)
+result_triangles = Histogram(
+    "triangulator_result_triangles",
+    "Nombre de triangles par triangulation.",
+    COUNT_BUCKETS,
+)
+payload_bytes = Histogram(
+    "triangulator_payload_bytes",
+    "Taille des binaires reçus (pointset) et envoyés (triangles).",
+    BYTES_BUCKETS,
+    labels=("kind",),
+)
+HISTOGRAMS = (stage_seconds, pointset_points, result_triangles, payload_bytes)
+
+
+@contextmanager
+def timed(stage: str):
+    """Mesure la durée du bloc et l'enregistre pour l'étape `stage`."""
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_stage(stage, time.perf_counter() - start)
+
+
+def record_stage(stage: str, seconds: float):
+    """Enregistre une durée d'étape dans l'histogramme et la requête en cours."""
+    stage_seconds.observe(seconds, stage)
+    timings = _request_timings.get()
+    if timings is not None:
+        timings[stage] = timings.get(stage, 0.0) + seconds
+
+
+def timed_chunks(chunks, stage: str = "serialize", elapsed: float = 0.0):
+    """Relaie un flux de morceaux en mesurant le temps passé à les produire.
+
+    Le temps passé par le consommateur entre deux morceaux n'est pas compté ;
+    `elapsed` ajoute une durée déjà écoulée (préparation du flux). La taille
+    totale est enregistrée comme charge utile « triangles ».
+    """
+    size = 0
+    iterator = iter(chunks)
+    while True:
+        start = time.perf_counter()
+        chunk = next(iterator, None)
+        elapsed += time.perf_counter() - start
+        if chunk is None:
+            break
+        size += len(chunk)
+        yield chunk
+    record_stage(stage, elapsed)
+    payload_bytes.observe(size, "triangles")
+
+
+def start_request_timings() -> dict:
+    """Démarre le relevé des durées d'étapes de la requête courante."""
+    timings = {}
+    _request_timings.set(timings)
+    return timings
+
+
+def server_timing(timings: dict) -> str:
+    """Formate des durées d'étapes en valeur d'en-tête Server-Timing."""
+    return ", ".join(
+        f"{stage};dur={seconds * 1000:.3f}" for stage, seconds in timings.items()
+    )
+
+
+def render(extra: dict | None = None) -> str:
+    """Renvoie toutes les métriques au format texte Prometheus.
+
+    `extra` ajoute des jauges simples, {nom: valeur}.
+    """
+    lines = []
+    for histogram in HISTOGRAMS:
+        lines.extend(histogram.render())
+    for name, value in (extra or {}).items():
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + "\n"
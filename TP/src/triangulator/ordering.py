@@ -0,0 +1,83 @@
+"""
+Module Ordering
+Description : Ce module fournit les ordres d'insertion des points utilisés
+par la triangulation incrémentale (grille en serpentin, courbe de Hilbert et
+BRIO).
+"""
+import random
+
+HILBERT_BITS = 16
+BRIO_SEED = 0
+
+
+def grid_order(xs, ys, n, min_x, min_y, delta):
+    """Ordonne les indices des points selon une grille parcourue en serpentin.
+
+    Des points consécutifs sont ainsi proches dans le plan, ce qui garde
+    courte la marche de localisation depuis le dernier triangle créé.
+    """
+    side = max(1, int((n / 4) ** 0.5))
+    scale = side / delta
+    keys = []
+    for i in range(n):
+        row = min(side - 1, int((ys[i] - min_y) * scale))
+        col = min(side - 1, int((xs[i] - min_x) * scale))
+        keys.append(row * side + (col if row % 2 == 0 else side - 1 - col))
+    return sorted(range(n), key=keys.__getitem__)
+
+
+def hilbert_keys(xs, ys, indices, min_x, min_y, delta, bits=HILBERT_BITS):
+    """Calcule la position de chaque point sur une courbe de Hilbert.
+
+    Le carré englobant est découpé en 2**bits x 2**bits cellules ; contrairement
+    à la grille en serpentin, la résolution ne dépend pas du nombre de points,
+    si bien que les amas denses restent eux aussi ordonnés localement.
+    """
+    side = 1 << bits
+    scale = (side - 1) / delta
+    keys = []
+    for i in indices:
+        x = int((xs[i] - min_x) * scale)
+        y = int((ys[i] - min_y) * scale)
+        key = 0
+        s = side >> 1
+        while s:
+            rx = 1 if x & s else 0
+            ry = 1 if y & s else 0
+            key += s * s * ((3 * rx) ^ ry)
+            if not ry:
+                if rx:
+                    x = side - 1 - x
+                    y = side - 1 - y
+                x, y = y, x
+            s >>= 1
+        keys.append(key)
+    return keys
+
+
+def hilbert_order(xs, ys, n, min_x, min_y, delta):
+    """Ordonne les indices des points le long d'une courbe de Hilbert."""
+    keys = hilbert_keys(xs, ys, range(n), min_x, min_y, delta)
+    return sorted(range(n), key=keys.__getitem__)
+
+
+def brio_order(xs, ys, n, min_x, min_y, delta, seed=BRIO_SEED):
+    """Ordre d'insertion randomisé biaisé (BRIO, Amenta et al.).
+
+    Les points sont mélangés puis répartis en tours de tailles doublant à
+    chaque fois (la dernière moitié, le quart précédent, ...). Chaque tour est
+    trié selon Hilbert : le hasard évite les grandes cavités des entrées
+    ordonnées et le tri spatial garde la marche de localisation courte.
+    """
+    indices = list(range(n))
+    random.Random(seed).shuffle(indices)
+    keys = hilbert_keys(xs, ys, indices, min_x, min_y, delta)
+    ranked = sorted(range(n), key=lambda j: (j.bit_length(), keys[j]))
+    return [indices[j] for j in ranked]
+
+
+ORDERINGS = {
+    "grid": grid_order,
+    "hilbert": hilbert_order,
+    "brio": brio_order,
+}
@@ -0,0 +1,255 @@
+"""
+Module Parallel
+Description : Ce module calcule la triangulation de Delaunay de grands
+ensembles de points en découpant le plan en bandes triangulées en parallèle.
+"""
+import math
+from array import array
+from itertools import chain
+
+from .core import (
+    all_collinear,
+    remap_triangles,
+    triangulate_points,
+    unique_points,
+)
+from .execption import InsufficientPointsError
+from .predicates import EPSILON, orient2d
+from .store import CIRCLE_MARGIN, FLAT_RATIO
+
+MIN_STRIP_POINTS = 20000
+# Marque, dans `_repair_seams`, une arête bordée par deux triangles sûrs.
+SHARED = -1
+
+
+def triangulate_points_parallel(
+    points: list[tuple[float, float]],
+    strips: int | None = None,
+    pool=None,
+    min_strip_points: int = MIN_STRIP_POINTS,
+) -> list[tuple[int, int, int]]:
+    """Calcule la triangulation de Delaunay par partition puis réparation.
+
+    Les points sont triés selon X et découpés en `strips` bandes, triangulées
+    indépendamment (dans `pool`, un `TriangulationPool`, s'il est fourni).
+    Un triangle local dont le cercle circonscrit reste strictement dans sa
+    bande est aussi un triangle de Delaunay global. Les autres triangles,
+    ainsi que les bords des bandes, sont recalculés en une seule
+    triangulation séquentielle de leurs sommets, recousue avec les
+    prédicats exacts (les grilles et autres points cocycliques restent sur
+    ce chemin). Le calcul séquentiel complet ne sert que si la couture
+    obtenue est incohérente. Comme pour `triangulate_points`, les doublons
+    sont retirés avant le découpage.
+    """
+    n = len(points)
+    if n < 3:
+        raise InsufficientPointsError("Moins de 3 points fournis.")
+
+    unique, originals = unique_points(points)
+    if originals is not None:
+        if len(unique) < 3:
+            return []
+        triangles = triangulate_points_parallel(unique, strips, pool, min_strip_points)
+        return remap_triangles(triangles, originals)
+    if all_collinear(points):
+        return []
+
+    if strips is None:
+        strips = pool.processes if pool is not None else 1
+    strips = min(strips, n // max(3, min_strip_points))
+    if strips < 2:
+        return triangulate_points(points)
+
+    order = sorted(range(n), key=lambda i: points[i][0])
+    bounds = [n * s // strips for s in range(strips + 1)]
+    groups = [order[bounds[s]:bounds[s + 1]] for s in range(strips)]
+    splits = [-math.inf]
+    for s in range(1, strips):
+        splits.append(
+            (points[order[bounds[s] - 1]][0] + points[order[bounds[s]]][0]) / 2
+        )
+    splits.append(math.inf)
+
+    jobs = [
+        ([points[i] for i in group], splits[s], splits[s + 1])
+        for s, group in enumerate(groups)
+    ]
+    if pool is None:
+        outcomes = [_strip_job(*job) for job in jobs]
+    else:
+        outcomes = pool.map_points(
+            _strip_job,
+            [array('d', chain.from_iterable(job[0])) for job in jobs],
+            [job[1:] for job in jobs],
+        )
+
+    safe = []
+    seam_vertices = set()
+    for group, (safe_local, seam_local) in zip(groups, outcomes, strict=True):
+        it = (group[i] for i in safe_local)
+        safe.extend(zip(it, it, it, strict=True))
+        seam_vertices.update(group[i] for i in seam_local)
+
+    merged = _repair_seams(points, safe, seam_vertices)
+    if merged is None:
+        return triangulate_points(points)
+    return merged
+
+
+def _strip_job(points, lo: float, hi: float):
+    """Triangule une bande et sépare ses triangles sûrs des sommets de couture.
+
+    Renvoie deux tableaux d'indices locaux : les triangles dont le cercle
+    circonscrit est strictement entre `lo` et `hi` (voir `_inside_strip`),
+    puis les sommets des autres triangles, du bord de la bande et les points
+    non triangulés.
+    """
+    safe = array('I')
+    seam = set()
+    covered = set()
+    edge_count = {}
+    triangles = triangulate_points(points) if len(points) >= 3 else []
+    for a, b, c in triangles:
+        if _inside_strip(points[a], points[b], points[c], lo, hi):
+            safe.extend((a, b, c))
+        else:
+            seam.update((a, b, c))
+        covered.update((a, b, c))
+        for edge in ((a, b), (b, c), (c, a)):
+            key = (min(edge), max(edge))
+            edge_count[key] = edge_count.get(key, 0) + 1
+
+    for (a, b), count in edge_count.items():
+        if count == 1:
+            seam.update((a, b))
+    seam.update(i for i in range(len(points)) if i not in covered)
+    return safe, array('I', sorted(seam))
+
+
+def _inside_strip(a, b, c, lo: float, hi: float) -> bool:
+    """Indique si le cercle circonscrit à (a, b, c) est strictement entre
+    `lo` et `hi`.
+
+    Le cercle est calculé relativement à `a`, comme dans `TriangleStore`, et
+    doit rester à une marge relative CIRCLE_MARGIN des bornes : un triangle
+    douteux, ou trop plat pour un centre fiable, passe dans la couture, qui
+    est recalculée avec les prédicats exacts.
+    """
+    bx, by = b[0] - a[0], b[1] - a[1]
+    cx, cy = c[0] - a[0], c[1] - a[1]
+    d = 2 * (bx * cy - by * cx)
+    b2 = bx * bx + by * by
+    c2 = cx * cx + cy * cy
+    if abs(d) <= FLAT_RATIO * (b2 + c2):
+        return False
+    ux = (cy * b2 - by * c2) / d
+    uy = (bx * c2 - cx * b2) / d
+    r = math.sqrt(ux * ux + uy * uy)
+    x = a[0] + ux
+    margin = CIRCLE_MARGIN * r + 4 * EPSILON * abs(x)
+    return lo < x - r - margin and x + r + margin < hi
+
+
+def _repair_seams(points, safe, seam_vertices):
+    """Recalcule la zone non couverte par les triangles sûrs.
+
+    La triangulation des sommets de couture contient les triangles de cette
+    zone et, ailleurs, des triangles qui recouvrent des triangles sûrs. Elle
+    est découpée le long des arêtes des triangles sûrs : un triangle adjacent
+    à une telle arête est dans la zone s'il est du côté opposé au triangle
+    sûr (orientation exacte), et l'étiquette se propage aux triangles voisins
+    par les autres arêtes. Les points cocycliques (grilles) sont ainsi
+    recousus sans dépendre d'un test de position approché. Renvoie la
+    triangulation complète, ou None si la couture est incohérente.
+    """
+    seam = sorted(seam_vertices)
+    repaired = list(safe)
+    if len(seam) >= 3:
+        # Arête d'un triangle sûr -> son troisième sommet, ou SHARED si deux
+        # triangles sûrs la bordent.
+        sides = {}
+        for a, b, c in safe:
+            for u, v, w in ((a, b, c), (b, c, a), (c, a, b)):
+                key = (u, v) if u < v else (v, u)
+                sides[key] = SHARED if key in sides else w
+
+        triangles = [
+            (seam[a], seam[b], seam[c])
+            for a, b, c in triangulate_points([points[i] for i in seam])
+        ]
+        labels = _label_seam_triangles(points, triangles, sides)
+        if labels is None:
+            return None
+        repaired.extend(tri for tri, kept in zip(triangles, labels, strict=True)
+                        if kept)
+
+    return repaired if _is_valid_triangulation(repaired) else None
+
+
+def _label_seam_triangles(points, triangles, sides):
+    """Indique, pour chaque triangle de couture, s'il est hors des triangles
+    sûrs ; renvoie None si deux indices se contredisent.
+    """
+    labels = [None] * len(triangles)
+    neighbours = {}
+    for t, (a, b, c) in enumerate(triangles):
+        for u, v, w in ((a, b, c), (b, c, a), (c, a, b)):
+            key = (u, v) if u < v else (v, u)
+            other = sides.get(key)
+            if other is None:
+                neighbours.setdefault(key, []).append(t)
+                continue
+            if other == SHARED:
+                label = False
+            else:
+                pu, pv = points[u], points[v]
+                inner = orient2d(*pu, *pv, *points[other])
+                outer = orient2d(*pu, *pv, *points[w])
+                if inner == 0 or outer == 0:
+                    continue
+                label = (inner > 0) != (outer > 0)
+            if labels[t] is not None and labels[t] != label:
+                return None
+            labels[t] = label
+
+    adjacent = [[] for _ in triangles]
+    for owners in neighbours.values():
+        if len(owners) == 2:
+            first, second = owners
+            adjacent[first].append(second)
+            adjacent[second].append(first)
+
+    # Une composante sans arête de triangle sûr n'est bordée que par
+    # l'enveloppe convexe : elle est dans la zone à recalculer.
+    for seed in sorted(range(len(triangles)), key=lambda t: labels[t] is None):
+        if labels[seed] is None:
+            labels[seed] = True
+        stack = [seed]
+        while stack:
+            t = stack.pop()
+            for u in adjacent[t]:
+                if labels[u] is None:
+                    labels[u] = labels[t]
+                    stack.append(u)
+                elif labels[u] != labels[t]:
+                    return None
+    return labels
+
+
+def _is_valid_triangulation(triangles) -> bool:
+    """Vérifie que les triangles forment un polygone triangulé sans trou.
+
+    Chaque arête est partagée par au plus deux triangles et la relation
+    d'Euler T = 2V - 2 - H (H sommets de bord) doit être satisfaite.
+    """
+    vertices = {v for tri in triangles for v in tri}
+    base = max(vertices, default=0) + 1
+    edge_count = {}
+    for a, b, c in triangles:
+        for u, v in ((a, b), (b, c), (c, a)):
+            key = u * base + v if u < v else v * base + u
+            edge_count[key] = edge_count.get(key, 0) + 1
+    if any(count > 2 for count in edge_count.values()):
+        return False
+    hull_size = sum(1 for count in edge_count.values() if count == 1)
+    return len(triangles) == 2 * len(vertices) - 2 - hull_size
@@ -0,0 +1,95 @@
+"""
+Module Predicates
+Description : Ce module fournit les prédicats géométriques orient2d et
+incircle, calculés en flottants avec un filtre d'erreur statique et repris en
+arithmétique exacte lorsque le signe est incertain.
+"""
+EPSILON = 2.0 ** -53
+# Bornes d'erreur de Shewchuk (Adaptive Precision Floating-Point Arithmetic
+# and Fast Robust Geometric Predicates, 1997) pour le premier niveau.
+CCW_ERRBOUND = (3.0 + 16.0 * EPSILON) * EPSILON
+ICC_ERRBOUND = (10.0 + 96.0 * EPSILON) * EPSILON
+
+
+def orient2d(ax, ay, bx, by, cx, cy):
+    """Renvoie une valeur du signe de l'orientation du triangle (a, b, c).
+
+    Positive si (a, b, c) tourne dans le sens trigonométrique, négative dans
+    le sens horaire et nulle si les points sont alignés. La valeur est le
+    double de l'aire signée quand le calcul flottant est sûr.
+    """
+    left = (bx - ax) * (cy - ay)
+    right = (by - ay) * (cx - ax)
+    det = left - right
+    if abs(det) >= CCW_ERRBOUND * (abs(left) + abs(right)):
+        return det
+    return _orient2d_exact(ax, ay, bx, by, cx, cy)
+
+
+def incircle(ax, ay, bx, by, cx, cy, dx, dy):
+    """Renvoie une valeur du signe de la position de d par rapport au cercle.
+
+    Pour (a, b, c) dans le sens trigonométrique, la valeur est positive si d
+    est strictement dans le cercle circonscrit, négative s'il est à
+    l'extérieur et nulle s'il est dessus.
+    """
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+
+    bdxcdy, cdxbdy = bdx * cdy, cdx * bdy
+    cdxady, adxcdy = cdx * ady, adx * cdy
+    adxbdy, bdxady = adx * bdy, bdx * ady
+    alift = adx * adx + ady * ady
+    blift = bdx * bdx + bdy * bdy
+    clift = cdx * cdx + cdy * cdy
+
+    det = (
+        alift * (bdxcdy - cdxbdy) +
+        blift * (cdxady - adxcdy) +
+        clift * (adxbdy - bdxady)
+    )
+    permanent = (
+        (abs(bdxcdy) + abs(cdxbdy)) * alift +
+        (abs(cdxady) + abs(adxcdy)) * blift +
+        (abs(adxbdy) + abs(bdxady)) * clift
+    )
+    if abs(det) > ICC_ERRBOUND * permanent:
+        return det
+    return _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy)
+
+
+def _orient2d_exact(ax, ay, bx, by, cx, cy):
+    """Calcule orient2d en entiers exacts."""
+    ax, ay, bx, by, cx, cy = _exact_integers(ax, ay, bx, by, cx, cy)
+    return _sign((bx - ax) * (cy - ay) - (by - ay) * (cx - ax))
+
+
+def _incircle_exact(ax, ay, bx, by, cx, cy, dx, dy):
+    """Calcule incircle en entiers exacts."""
+    ax, ay, bx, by, cx, cy, dx, dy = _exact_integers(ax, ay, bx, by, cx, cy, dx, dy)
+    adx, ady = ax - dx, ay - dy
+    bdx, bdy = bx - dx, by - dy
+    cdx, cdy = cx - dx, cy - dy
+    return _sign(
+        (adx * adx + ady * ady) * (bdx * cdy - cdx * bdy) +
+        (bdx * bdx + bdy * bdy) * (cdx * ady - adx * cdy) +
+        (cdx * cdx + cdy * cdy) * (adx * bdy - bdx * ady)
+    )
+
+
+def _exact_integers(*values):
+    """Met des flottants à l'échelle entière commune, sans perte.
+
+    Un flottant fini est un rationnel de dénominateur puissance de deux :
+    multiplier par le plus grand dénominateur donne des entiers exacts, et
+    les prédicats sont homogènes, donc leur signe est inchangé.
+    """
+    ratios = [value.as_integer_ratio() for value in values]
+    scale = max(den for _, den in ratios)
+    return [num * (scale // den) for num, den in ratios]
+
+
+def _sign(value) -> float:
+    """Réduit un entier exact à -1.0, 0.0 ou 1.0."""
+    return float((value > 0) - (value < 0))
@@ -0,0 +1,158 @@
+"""
+Module Profiling
+Description : Ce module fournit le mode de profilage du service : les
+triangulations lentes, ou demandées par en-tête, sont enregistrées avec leur
+PointSet d'entrée pour être rejouées hors ligne (voir `replay`).
+"""
+import hashlib
+import json
+import logging
+import os
+import struct
+import sys
+import threading
+import time
+from collections import Counter
+from contextvars import ContextVar
+
+from .config import PROFILE_DIR, PROFILE_INTERVAL, PROFILE_THRESHOLD
+
+logger = logging.getLogger(__name__)
+
+PROFILE_HEADER = "X-Triangulator-Profile"
+POINTSET_FILE = "pointset.bin"
+PSTATS_FILE = "profile.pstats"
+STACKS_FILE = "stacks.folded"
+META_FILE = "meta.json"
+
+# Profilage complet demandé pour la requête en cours (en-tête PROFILE_HEADER).
+_requested = ContextVar("profile_requested", default=False)
+
+
+def request_profile(requested: bool):
+    """Indique si la requête courante demande un profil complet (cProfile)."""
+    _requested.set(requested)
+
+
+class StackSampler:
+    """Échantillonne à intervalle fixe la pile d'un thread.
+
+    Bien moins coûteux que cProfile, il peut rester actif sur chaque
+    triangulation ; le résultat est au format « folded » des flame graphs
+    (une pile par ligne, fonctions séparées par « ; », puis le compte).
+    """
+
+    def __init__(self, thread_id: int | None = None, interval=PROFILE_INTERVAL):
+        """Prépare l'échantillonnage de `thread_id` (l'appelant par défaut)."""
+        self.thread_id = thread_id or threading.get_ident()
+        self.interval = interval
+        self.stacks = Counter()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def __enter__(self):
+        """Démarre l'échantillonnage."""
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        """Arrête l'échantillonnage et attend la fin du thread."""
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        """Relève la pile du thread cible jusqu'à l'arrêt."""
+        while not self._stop.wait(self.interval):
+            frame = sys._current_frames().get(self.thread_id)
+            stack = []
+            while frame is not None:
+                code = frame.f_code
+                stack.append(
+                    f"{code.co_name} ({os.path.basename(code.co_filename)}"
+                    f":{code.co_firstlineno})"
+                )
+                frame = frame.f_back
+            if stack:
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def folded(self) -> str:
+        """Renvoie les piles relevées au format « folded »."""
+        return "".join(
+            f"{stack} {count}\n" for stack, count in self.stacks.most_common()
+        )
+
+
+def profiled_call(pointset_bin, func, *args):
+    """Exécute `func(*args)` sous le profilage configuré.
+
+    Sans PROFILE_DIR, l'appel est direct. Si la requête a demandé un profil,
+    l'appel est mesuré par cProfile et toujours enregistré ; sinon, avec
+    PROFILE_THRESHOLD > 0, il est échantillonné et enregistré seulement s'il
+    dépasse le seuil. Un appel qui échoue est enregistré de la même façon.
+    """
+    if PROFILE_DIR is None:
+        return func(*args)
+
+    if _requested.get():
+        import cProfile
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        profiler.enable()
+        try:
+            return func(*args)
+        finally:
+            profiler.disable()
+            elapsed = time.perf_counter() - start
+            save_capture(pointset_bin, elapsed, "requested", profiler=profiler)
+
+    if PROFILE_THRESHOLD <= 0:
+        return func(*args)
+
+    sampler = StackSampler()
+    start = time.perf_counter()
+    try:
+        with sampler:
+            return func(*args)
+    finally:
+        elapsed = time.perf_counter() - start
+        if elapsed >= PROFILE_THRESHOLD:
+            save_capture(pointset_bin, elapsed, "threshold", stacks=sampler.folded())
+
+
+def save_capture(pointset_bin, elapsed: float, reason: str, profiler=None,
+                 stacks: str | None = None) -> str | None:
+    """Enregistre une capture dans un sous-dossier de PROFILE_DIR.
+
+    Le dossier contient le PointSet d'entrée, le profil (`profile.pstats`
+    pour cProfile, `stacks.folded` pour l'échantillonneur) et `meta.json`.
+    Renvoie son chemin, ou None si l'écriture a échoué : une capture
+    manquée ne doit pas faire échouer la requête.
+    """
+    digest = hashlib.sha256(pointset_bin).hexdigest()
+    path = os.path.join(
+        PROFILE_DIR, f"{time.strftime('%Y%m%dT%H%M%S')}-{digest[:12]}"
+    )
+    meta = {
+        "reason": reason,
+        "elapsed": elapsed,
+        "points": struct.unpack_from('<I', pointset_bin)[0]
+        if len(pointset_bin) >= 4 else None,
+        "sha256": digest,
+        "created": time.time(),
+    }
+    try:
+        os.makedirs(path, exist_ok=True)
+        with open(os.path.join(path, POINTSET_FILE), "wb") as f:
+            f.write(pointset_bin)
+        if profiler is not None:
+            profiler.dump_stats(os.path.join(path, PSTATS_FILE))
+        if stacks is not None:
+            with open(os.path.join(path, STACKS_FILE), "w", encoding="utf-8") as f:
+                f.write(stacks)
+        with open(os.path.join(path, META_FILE), "w", encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+    except OSError as e:
+        logger.warning(f"Capture de profilage non enregistrée: {e}")
+        return None
+    logger.info(f"Capture de profilage enregistrée dans {path} ({elapsed:.3f}s)")
+    return path
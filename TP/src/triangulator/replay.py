@@ -0,0 +1,118 @@
+"""
+Module Replay
+Description : Ce module rejoue hors ligne une capture du mode de profilage (ou
+un binaire PointSet quelconque) à travers les fonctions du coeur.
+
+Usage : python -m src.triangulator.replay CAPTURE [--order brio] [--repeat N]
+        [--profile] [--top N] [--output FICHIER]
+
+CAPTURE est un dossier de capture (voir `profiling.save_capture`) ou un
+fichier PointSet. Les profils enregistrés s'inspectent avec
+`python -m pstats CAPTURE/profile.pstats`.
+"""
+import argparse
+import cProfile
+import io
+import json
+import os
+import pstats
+import sys
+import time
+
+from .core import deserialize_pointset, serialize_triangles, triangulate_points
+from .execption import TriangulatorError
+from .ordering import ORDERINGS
+from .profiling import META_FILE, POINTSET_FILE
+
+
+def load_capture(path: str) -> tuple[bytes, dict]:
+    """Lit le PointSet d'une capture et ses métadonnées ({} si absentes)."""
+    meta = {}
+    if os.path.isdir(path):
+        meta_path = os.path.join(path, META_FILE)
+        if os.path.exists(meta_path):
+            with open(meta_path, encoding="utf-8") as f:
+                meta = json.load(f)
+        path = os.path.join(path, POINTSET_FILE)
+    with open(path, "rb") as f:
+        return f.read(), meta
+
+
+def replay(pointset_bin: bytes, order: str = "brio", repeat: int = 1,
+           profiler: cProfile.Profile | None = None) -> tuple[dict, bytes]:
+    """Désérialise, triangule et sérialise `repeat` fois.
+
+    Renvoie la meilleure durée de chaque étape et le binaire Triangles. Si
+    `profiler` est fourni, il est actif pendant les triangulations.
+    """
+    best = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        points = deserialize_pointset(pointset_bin)
+        deserialized = time.perf_counter()
+        if profiler is not None:
+            profiler.enable()
+        try:
+            triangles = triangulate_points(points, order)
+        finally:
+            if profiler is not None:
+                profiler.disable()
+        triangulated = time.perf_counter()
+        result = serialize_triangles(points, triangles)
+        serialized = time.perf_counter()
+        for stage, seconds in (
+            ("deserialize", deserialized - start),
+            ("triangulate", triangulated - deserialized),
+            ("serialize", serialized - triangulated),
+        ):
+            best[stage] = min(seconds, best.get(stage, seconds))
+    return best, result
+
+
+def main(argv=None) -> int:
+    """Point d'entrée de la ligne de commande ; renvoie le code de sortie."""
+    parser = argparse.ArgumentParser(
+        prog="python -m src.triangulator.replay",
+        description="Rejoue une capture de profilage à travers le coeur.",
+    )
+    parser.add_argument("capture", help="dossier de capture ou fichier PointSet")
+    parser.add_argument("--order", choices=sorted(ORDERINGS), default="brio")
+    parser.add_argument("--repeat", type=int, default=1)
+    parser.add_argument("--profile", action="store_true",
+                        help="affiche le profil cProfile de la triangulation")
+    parser.add_argument("--top", type=int, default=25,
+                        help="nombre de fonctions du profil affichées")
+    parser.add_argument("--output", help="écrit le binaire Triangles obtenu")
+    args = parser.parse_args(argv)
+
+    try:
+        pointset_bin, meta = load_capture(args.capture)
+        profiler = cProfile.Profile() if args.profile else None
+        timings, result = replay(
+            pointset_bin, args.order, max(1, args.repeat), profiler
+        )
+    except (OSError, TriangulatorError) as e:
+        print(f"Erreur : {e}", file=sys.stderr)
+        return 1
+
+    num_points = int.from_bytes(pointset_bin[:4], "little")
+    print(f"PointSet : {num_points} points, {len(pointset_bin)} octets")
+    if meta:
+        print(f"Capture : {meta.get('reason')}, {meta.get('elapsed', 0):.3f}s "
+              "dans le service")
+    for stage, seconds in timings.items():
+        print(f"{stage:<12} {seconds * 1000:10.3f} ms")
+    if profiler is not None:
+        stream = io.StringIO()
+        pstats.Stats(profiler, stream=stream).sort_stats("cumulative").print_stats(
+            args.top
+        )
+        print(stream.getvalue())
+    if args.output:
+        with open(args.output, "wb") as f:
+            f.write(result)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
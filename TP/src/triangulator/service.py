@@ -1,29 +1,492 @@
-from .client_psm import get_pointset_bytes
-from .core import deserialize_pointset, serialize_triangles, triangulate_points
-from .execption import TriangulatorError
+import atexit
+import json
+import logging
+import threading
+import time
+from array import array
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from contextlib import ExitStack, nullcontext
+
+from . import metrics
+from .admission import AdmissionController, estimate_cost
+from .cache import ResultCache, TriangulationCache
+from .client_psm import default_client, get_pointset_bytes, read_pointset_body
+from .config import (
+    BATCH_CONCURRENCY,
+    CACHE_DIR,
+    CACHE_DISK_MAX_BYTES,
+    CACHE_MAX_BYTES,
+    INCREMENTAL_MAX_POINTS,
+    JOB_TIMEOUT,
+    PARALLEL_MIN_POINTS,
+    PSM_PREWARM_CONNECTIONS,
+    WORKER_PROCESSES,
+)
+from .core import (
+    CHUNK_ITEMS,
+    PointSetView,
+    Triangulation,
+    deserialize_pointset,
+    deserialize_pointset_buffer,
+    deserialize_pointset_view,
+    iter_serialize_triangles,
+    pack_batch_frame,
+    serialize_triangles,
+    triangulate_indices,
+    triangulate_points,
+)
+from .execption import (
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    ServiceOverloaded,
+    TriangulationTimeout,
+    TriangulatorError,
+    WorkerCrashed,
+)
+from .metrics import payload_bytes, timed, timed_chunks
+from .profiling import profiled_call
+from .spill import is_spilled, spill_triangles
+
+logger = logging.getLogger(__name__)
+
+
+class _Call:
+    """Appel en cours partagé par les requêtes concurrentes d'une même clé."""
+
+    def __init__(self):
+        """Prépare l'événement de fin et l'emplacement du résultat."""
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class SingleFlight:
+    """Regroupe les appels concurrents portant sur la même clé.
+
+    Le premier appelant exécute la fonction ; les appelants qui arrivent
+    pendant son exécution attendent et reçoivent le même résultat, ou la
+    même exception.
+    """
+
+    def __init__(self):
+        """Crée un groupe sans appel en cours."""
+        self.collapsed = 0
+        self._calls = {}
+        self._lock = threading.Lock()
+
+    def do(self, key, fn, *args):
+        """Exécute `fn(*args)` une seule fois pour tous les appels concurrents
+        sur `key`.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                self.collapsed += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args)
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+# Statut HTTP et code d'erreur de chaque exception, comme dans les
+# gestionnaires d'erreurs de l'application ; le premier type qui correspond
+# l'emporte.
+ERROR_STATUSES = (
+    (PointSetNotFound, 404, "NOT_FOUND"),
+    (PointSetManagerUnavailable, 503, "SERVICE_UNAVAILABLE"),
+    (TriangulationTimeout, 503, "TRIANGULATION_TIMEOUT"),
+    (WorkerCrashed, 503, "WORKER_CRASHED"),
+    (ServiceOverloaded, 503, "OVERLOADED"),
+)
+
+result_cache = ResultCache(CACHE_MAX_BYTES, CACHE_DIR, CACHE_DISK_MAX_BYTES)
+triangulations = TriangulationCache(INCREMENTAL_MAX_POINTS)
+admission = AdmissionController()
+inflight = SingleFlight()
+
+
+def _create_worker_pool():
+    """Crée le pool de workers configuré, ou None.
+
+    `workers` (et multiprocessing) n'est importé que si le pool est activé.
+    """
+    if WORKER_PROCESSES <= 0:
+        return None
+    from .workers import TriangulationPool
+    return TriangulationPool(WORKER_PROCESSES, JOB_TIMEOUT)
+
+
+worker_pool = _create_worker_pool()
 
 
 def process_triangulation_request(pointset_id: str) -> bytes:
     """Exécute le workflow complet : récupération, calcul, et sérialisation.
+
+    Le résultat est servi depuis le cache si l'identifiant, ou un PointSet
+    de contenu identique, a déjà été triangulé.
+    """
+    return b"".join(stream_triangulation_request(pointset_id))
+
+
+def stream_triangulation_request(
+    pointset_id: str, base: str | None = None
+) -> Iterator[bytes]:
+    """Variante par morceaux de `process_triangulation_request`.
+
+    Récupération et calcul sont faits avant le retour : les erreurs sont
+    levées ici, et l'itérateur renvoyé ne fait plus que sérialiser. Les
+    requêtes concurrentes pour un même identifiant partagent un seul calcul.
+
+    `base` désigne une version précédente du PointSet (éventuellement le
+    même identifiant, dont le contenu a changé) : le PointSet est alors
+    toujours récupéré à nouveau, et la triangulation conservée pour `base`
+    est mise à jour plutôt que recalculée (voir `_triangulate_incremental`).
+    """
+    if base is None:
+        cached = result_cache.get_by_id(pointset_id)
+        if cached is not None:
+            return iter_cached_result(cached)
+
+    key = pointset_id if base is None else (pointset_id, base)
+    outcome = inflight.do(key, _fetch_and_triangulate, pointset_id, base)
+    return result_chunks(pointset_id, *outcome)
+
+
+def stream_upload_request(stream) -> Iterator[bytes]:
+    """Triangule un PointSet envoyé directement dans le corps d'une requête.
+
+    Le corps est lu et validé au fil de l'eau comme une réponse du PSM, puis
+    suit le même chemin que `stream_triangulation_request` (cache par
+    contenu compris), sans identifiant.
+    """
+    with HeaderAdmission() as admit:
+        pointset_bin = read_pointset_body(stream, admit)
+        outcome = lookup_or_triangulate(pointset_bin, admitted=admit.admitted)
+    return result_chunks(None, *outcome)
+
+
+def stream_batch_request(
+    pointset_ids: list[str], concurrency: int = BATCH_CONCURRENCY
+) -> Iterator[bytes]:
+    """Triangule un lot de PointSets et renvoie une trame par élément.
+
+    Les éléments sont récupérés et triangulés en parallèle (cache, calcul
+    partagé et pool de workers compris) ; chaque trame est émise dès que son
+    élément est terminé, donc dans l'ordre de fin et non dans celui de la
+    demande. Une erreur ne concerne que la trame de son élément.
+    """
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, min(concurrency, len(pointset_ids))),
+        thread_name_prefix="batch",
+    )
+    futures = {
+        executor.submit(process_triangulation_request, pointset_id): pointset_id
+        for pointset_id in pointset_ids
+    }
+    return _batch_frames(executor, futures)
+
+
+def _batch_frames(executor, futures) -> Iterator[bytes]:
+    """Émet les trames au fil des résultats puis libère les threads.
+
+    Si le client abandonne, les éléments pas encore démarrés sont annulés.
     """
-    pointset_bin = get_pointset_bytes(pointset_id)
-    
     try:
-        points = deserialize_pointset(pointset_bin)
+        for future in as_completed(futures):
+            try:
+                status, payload = 200, future.result()
+            except Exception as e:
+                status, payload = error_payload(e)
+            yield pack_batch_frame(futures[future], status, payload)
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
+
+
+def error_payload(error: Exception) -> tuple[int, bytes]:
+    """Renvoie le statut HTTP et le corps JSON d'erreur d'une exception."""
+    status, code = next(
+        ((status, code) for error_type, status, code in ERROR_STATUSES
+         if isinstance(error, error_type)),
+        (500, "INTERNAL_ERROR"),
+    )
+    body = json.dumps({"code": code, "message": str(error)})
+    return status, body.encode()
+
+
+def _fetch_and_triangulate(pointset_id: str, base: str | None = None):
+    """Récupère le PointSet auprès du PSM puis le triangule.
+
+    L'admission est décidée dès l'en-tête reçu : un service saturé refuse
+    la requête sans télécharger ni allouer le corps.
+    """
+    with HeaderAdmission() as admit:
+        with timed("fetch"):
+            pointset_bin = get_pointset_bytes(pointset_id, on_header=admit)
+        return lookup_or_triangulate(
+            pointset_bin, pointset_id, base, admitted=admit.admitted
+        )
+
+
+class HeaderAdmission(ExitStack):
+    """Rappel `on_header` qui admet le calcul d'après l'en-tête du PointSet.
+
+    La place est tenue jusqu'à la sortie du bloc `with`. Un second appel
+    (requête rejouée sur une connexion neuve) ne réserve rien de plus.
+    """
+
+    admitted = False
+
+    def __call__(self, num_points: int):
+        """Réserve `num_points` dans le budget d'admission."""
+        if not self.admitted:
+            self.enter_context(admission.admit(num_points))
+            self.admitted = True
+
+
+def lookup_or_triangulate(pointset_bin: bytes, pointset_id: str | None = None,
+                          base: str | None = None, admitted: bool = False):
+    """Triangule un binaire PointSet, sauf si son contenu est déjà en cache.
+
+    Renvoie (empreinte, résultat en cache ou None, points, triangles), à
+    transmettre tel quel à `result_chunks`. `base` est transmis à
+    `triangulate_pointset` ; le résultat d'une mise à jour dépend alors des
+    versions précédentes et non du seul contenu : l'empreinte renvoyée est
+    None pour qu'il ne soit pas mis en cache. Sauf si l'appelant l'a déjà
+    fait (`admitted`), le calcul passe par le contrôle d'admission (voir
+    `admission`), qui peut lever ServiceOverloaded.
+    """
+    payload_bytes.observe(len(pointset_bin), "pointset")
+    digest = result_cache.digest(pointset_bin)
+    cached = result_cache.get(digest, pointset_id)
+    if cached is not None:
+        return digest, cached, None, None
+
+    slot = nullcontext() if admitted else admission.admit(estimate_cost(pointset_bin))
+    with slot:
+        points, triangles = triangulate_pointset(pointset_bin, pointset_id, base)
+    if base is not None:
+        digest = None
+    return digest, None, points, triangles
+
+
+def result_chunks(pointset_id, digest, cached, points, triangles) -> Iterator[bytes]:
+    """Renvoie les morceaux du binaire Triangles pour un calcul terminé.
+
+    Un résultat calculé est mis en cache une fois entièrement diffusé, s'il
+    a une empreinte et tient dans le budget du cache. Un calcul en mode
+    débordement est écrit sur disque et renvoyé comme `SpilledResult`, sans
+    passer par le cache.
+    """
+    if cached is not None:
+        return iter_cached_result(cached)
+
+    if isinstance(points, PointSetView):
+        with timed("serialize"):
+            result = spill_triangles(points, triangles)
+        payload_bytes.observe(result.size, "triangles")
+        return result
+
+    start = time.perf_counter()
+    chunks = iter_serialize_triangles(points, triangles)
+    chunks = timed_chunks(chunks, "serialize", time.perf_counter() - start)
+
+    expected_size = 8 + 8 * len(points) + 12 * len(triangles)
+    if digest is None or expected_size > result_cache.max_bytes:
+        return chunks
+    return _cache_on_completion(chunks, digest, pointset_id)
+
+
+def triangulate_pointset(pointset_bin: bytes, pointset_id: str | None = None,
+                         base: str | None = None) -> tuple[list, list]:
+    """Désérialise et triangule un binaire PointSet.
+
+    Si un pool de workers est configuré, le calcul y est délégué ; au-delà
+    de PARALLEL_MIN_POINTS points, il est réparti en bandes sur tout le pool.
+    En mode profilage (voir `profiling`), le calcul peut être enregistré avec
+    son entrée ; avec un pool, le profil ne couvre alors que l'attente.
+
+    Un PointSet reçu en mode débordement (voir `spill`) est lu sans copie
+    (`PointSetView`) et, calculé localement, ses triangles sont renvoyés à
+    plat (`triangulate_indices`).
+
+    Avec TRIANGULATOR_INCREMENTAL_MAX_POINTS > 0, un PointSet identifié (et
+    non débordé) est triangulé localement, sans le pool, et sa triangulation
+    conservée pour qu'une version suivante (`base`) n'ait qu'à appliquer la
+    différence.
+    """
+    spilled = is_spilled(pointset_bin)
+    deserialize = deserialize_pointset_view if spilled else deserialize_pointset
+    try:
+        with timed("deserialize"):
+            points = deserialize(pointset_bin)
     except TriangulatorError as e:
         raise TriangulatorError(
             f"Échec de la désérialisation du PointSet: {e}"
         ) from e
-    
+    metrics.pointset_points.observe(len(points))
+
     try:
-        triangles = triangulate_points(points)
+        with timed("triangulate"):
+            triangles = profiled_call(
+                pointset_bin, _compute_triangles, pointset_bin, points,
+                pointset_id, base,
+            )
     except TriangulatorError as e:
         raise e 
     except Exception as e:
         raise TriangulatorError(
             f"Échec critique de l'algorithme de triangulation: {e}"
         ) from e
-    
-    triangles_bin = serialize_triangles(points, triangles)
-    
-    return triangles_bin
\ No newline at end of file
+    metrics.result_triangles.observe(
+        len(triangles) // 3 if isinstance(triangles, array) else len(triangles)
+    )
+
+    return points, triangles
+
+
+def _compute_triangles(pointset_bin: bytes, points: list,
+                       pointset_id: str | None = None,
+                       base: str | None = None) -> list:
+    """Choisit le moteur de calcul : local, incrémental, pool de workers ou
+    par bandes.
+    """
+    if worker_pool is not None and len(points) >= PARALLEL_MIN_POINTS:
+        from .parallel import triangulate_points_parallel
+        return triangulate_points_parallel(points, pool=worker_pool)
+    spilled = is_spilled(pointset_bin)
+    if pointset_id is not None and triangulations.max_points > 0 and not spilled:
+        return _triangulate_incremental(points, pointset_id, base)
+    if worker_pool is not None:
+        return worker_pool.triangulate(deserialize_pointset_buffer(pointset_bin))
+    if spilled:
+        return triangulate_indices(points)
+    return triangulate_points(points)
+
+
+def _triangulate_incremental(points: list, pointset_id: str,
+                             base: str | None) -> list:
+    """Triangule en conservant une triangulation modifiable pour `pointset_id`.
+
+    Si celle de `base` est encore en cache, seule la différence entre les
+    deux versions lui est appliquée (`Triangulation.update`) ; sinon elle
+    est construite. Elle est ensuite conservée sous `pointset_id`.
+    """
+    triangulation = triangulations.take(base) if base is not None else None
+    if triangulation is None:
+        triangulation = Triangulation(points)
+    else:
+        triangulation.update(points)
+    triangles = triangulation.triangles(points)
+    triangulations.put(pointset_id, triangulation)
+    return triangles
+
+
+def triangulate_pointset_bytes(pointset_bin: bytes) -> bytes:
+    """Désérialise, triangule et sérialise un binaire PointSet."""
+    return serialize_triangles(*triangulate_pointset(pointset_bin))
+
+
+def render_metrics() -> str:
+    """Renvoie les métriques du service au format texte Prometheus.
+
+    Aux histogrammes d'étapes s'ajoutent les compteurs des caches, des
+    calculs partagés, du contrôle d'admission et du pool de connexions au PSM.
+    """
+    extra = {
+        f"triangulator_cache_{name}": value
+        for name, value in result_cache.stats().items()
+    }
+    extra.update(
+        (f"triangulator_incremental_{name}", value)
+        for name, value in triangulations.stats().items()
+    )
+    extra["triangulator_inflight_collapsed"] = inflight.collapsed
+    extra.update(
+        (f"triangulator_admission_{name}", value)
+        for name, value in admission.stats().items()
+    )
+    extra.update(
+        (f"triangulator_psm_{name}", value)
+        for name, value in default_client.stats().items()
+    )
+    return metrics.render(extra)
+
+
+def warm_up(connections: int = PSM_PREWARM_CONNECTIONS):
+    """Démarre les workers et ouvre `connections` connexions au PSM.
+
+    Un échec est journalisé sans être propagé : le service reste utilisable,
+    les premières requêtes paient alors le démarrage à froid.
+    """
+    if worker_pool is not None:
+        try:
+            worker_pool.warm_up()
+        except Exception as e:
+            logger.warning(f"Préchauffage des workers impossible: {e!r}")
+    if connections > 0:
+        try:
+            default_client.warm_up(connections)
+        except PointSetManagerUnavailable as e:
+            logger.warning(f"Préchauffage des connexions au PSM impossible: {e}")
+
+
+def start_warm_up(
+    connections: int = PSM_PREWARM_CONNECTIONS,
+) -> threading.Thread | None:
+    """Lance `warm_up` en arrière-plan s'il y a quelque chose à préchauffer.
+
+    Renvoie le thread lancé, ou None.
+    """
+    if worker_pool is None and connections <= 0:
+        return None
+    thread = threading.Thread(
+        target=warm_up, args=(connections,), name="triangulator-warm-up", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def shutdown():
+    """Arrête proprement le pool de workers, s'il existe."""
+    if worker_pool is not None:
+        worker_pool.shutdown()
+
+
+atexit.register(shutdown)
+
+
+def iter_cached_result(result: bytes) -> Iterator[bytes]:
+    """Découpe un résultat en cache en morceaux de taille fixe."""
+    view = memoryview(result)
+    step = 12 * CHUNK_ITEMS
+    for start in range(0, len(view), step):
+        yield view[start:start + step].tobytes()
+
+
+def _cache_on_completion(chunks, digest: str, pointset_id: str) -> Iterator[bytes]:
+    """Relaie les morceaux et met le résultat en cache une fois complet.
+
+    Si le client abandonne en cours de route, rien n'est mis en cache.
+    """
+    parts = []
+    for chunk in chunks:
+        parts.append(chunk)
+        yield chunk
+    result_cache.put(digest, b"".join(parts), pointset_id)
@@ -0,0 +1,98 @@
+"""
+Module Spill
+Description : Ce module gère le mode de débordement sur disque des très gros
+calculs : PointSet reçu dans un fichier temporaire projeté en mémoire (mmap)
+et binaire Triangles écrit dans un fichier temporaire diffusé depuis le disque.
+"""
+import mmap
+import os
+import tempfile
+from array import array
+from contextlib import ExitStack
+from itertools import chain
+
+from .config import SPILL_DIR, SPILL_THRESHOLD
+from .core import CHUNK_ITEMS, iter_serialize_triangles_buffer
+from .execption import InvalidBinaryFormat
+
+
+def should_spill(size: int) -> bool:
+    """Indique si un PointSet de `size` octets doit passer par le disque.
+
+    Le mode est désactivé tant que TRIANGULATOR_SPILL_THRESHOLD vaut 0.
+    """
+    return 0 < SPILL_THRESHOLD < size
+
+
+def allocate(size: int) -> mmap.mmap:
+    """Crée un fichier temporaire de `size` octets et le projette en mémoire.
+
+    Le fichier est anonyme (supprimé dès sa création) : l'espace disque est
+    rendu quand la projection est fermée ou collectée.
+    """
+    with tempfile.TemporaryFile(dir=SPILL_DIR) as f:
+        f.truncate(size)
+        return mmap.mmap(f.fileno(), size)
+
+
+def is_spilled(pointset_bin) -> bool:
+    """Indique si un binaire PointSet a été reçu en mode débordement."""
+    return isinstance(pointset_bin, mmap.mmap)
+
+
+class SpilledResult:
+    """Binaire Triangles stocké dans un fichier temporaire anonyme.
+
+    L'objet est itérable comme les autres résultats (morceaux de taille
+    fixe) ; `file` permet aussi de le servir sans copie (sendfile via
+    `wsgi.file_wrapper`). Le fichier est fermé en fin d'itération ou par
+    `close`.
+    """
+
+    def __init__(self, file, size: int):
+        """Enveloppe le fichier `file` contenant `size` octets."""
+        self.file = file
+        self.size = size
+
+    def __iter__(self):
+        step = 12 * CHUNK_ITEMS
+        try:
+            for offset in range(0, self.size, step):
+                yield os.pread(self.file.fileno(), step, offset)
+        finally:
+            self.close()
+
+    def close(self):
+        """Ferme le fichier, ce qui libère l'espace disque."""
+        self.file.close()
+
+
+def spill_triangles(points, triangles) -> SpilledResult:
+    """Écrit le binaire Triangles dans un fichier temporaire projeté.
+
+    `points` est une `PointSetView` (ses coordonnées sont recopiées depuis
+    le buffer d'entrée) ; `triangles` est un buffer d'indices à plat, comme
+    celui de `triangulate_indices`, ou une liste de triplets.
+    """
+    if not isinstance(triangles, array):
+        try:
+            triangles = array('I', chain.from_iterable(triangles))
+        except OverflowError as e:
+            raise InvalidBinaryFormat(
+                "Indice de sommet hors limite dans la sérialisation des triangles."
+            ) from e
+    size = 8 + 4 * len(points.coords) + 4 * len(triangles)
+    chunks = iter_serialize_triangles_buffer(points.coords, triangles)
+
+    # Le fichier n'est fermé ici qu'en cas d'erreur : sinon il survit à la
+    # fonction, dans le SpilledResult.
+    with ExitStack() as on_error:
+        file = on_error.enter_context(tempfile.TemporaryFile(dir=SPILL_DIR))
+        file.truncate(size)
+        with mmap.mmap(file.fileno(), size) as out:
+            offset = 0
+            for chunk in chunks:
+                out[offset:offset + len(chunk)] = chunk
+                offset += len(chunk)
+        on_error.pop_all()
+    return SpilledResult(file, size)
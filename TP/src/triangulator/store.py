@@ -0,0 +1,99 @@
+"""
+Module Store
+Description : Ce module fournit le stockage compact des triangles utilisé par
+la triangulation incrémentale (colonnes de tableaux typés et liste libre).
+"""
+from array import array
+
+NO_NEIGHBOUR = -1
+NAN = float('nan')
+# Au-delà de ce rapport entre l'écart au cercle et le rayon au carré, le
+# cercle circonscrit en flottants suffit à conclure sans prédicat exact.
+CIRCLE_MARGIN = 1e-6
+# Triangle considéré comme trop plat pour que son centre flottant soit fiable.
+FLAT_RATIO = 1e-6
+
+
+class TriangleStore:
+    """Triangles stockés en colonnes `array` plutôt qu'en objets Python.
+
+    Un triangle est désigné par son décalage `t` (multiple de 3) dans les
+    colonnes :
+    - `vertices[t:t + 3]` : ses sommets, dans le sens trigonométrique ;
+    - `neighbours[t + k]` : décalage du voisin situé de l'autre côté de
+      l'arête opposée au sommet k, ou NO_NEIGHBOUR ;
+    - `circles[t:t + 3]` : centre (x, y) et rayon au carré du cercle
+      circonscrit, calculés une seule fois à la création (NaN si le triangle
+      est trop plat pour que ces valeurs soient fiables).
+    Les emplacements libérés sont réutilisés via `free` avant d'agrandir les
+    colonnes.
+    """
+
+    def __init__(self, xs, ys):
+        """Prépare un stockage vide pour les points de coordonnées xs, ys."""
+        self.xs = xs
+        self.ys = ys
+        self.vertices = array('i')
+        self.neighbours = array('i')
+        self.circles = array('d')
+        self.free = array('i')
+
+    def add(self, a, b, c, n0=NO_NEIGHBOUR, n1=NO_NEIGHBOUR, n2=NO_NEIGHBOUR):
+        """Crée le triangle (a, b, c) et renvoie son décalage."""
+        if self.free:
+            t = self.free.pop()
+            self.vertices[t] = a
+            self.vertices[t + 1] = b
+            self.vertices[t + 2] = c
+            self.neighbours[t] = n0
+            self.neighbours[t + 1] = n1
+            self.neighbours[t + 2] = n2
+        else:
+            t = len(self.vertices)
+            self.vertices.extend((a, b, c))
+            self.neighbours.extend((n0, n1, n2))
+            self.circles.extend((0.0, 0.0, 0.0))
+        self.update_circle(t)
+        return t
+
+    def release(self, t):
+        """Libère l'emplacement du triangle `t`."""
+        self.vertices[t] = self.vertices[t + 1] = self.vertices[t + 2] = -1
+        self.free.append(t)
+
+    def update_circle(self, t):
+        """Recalcule le cercle circonscrit du triangle `t`."""
+        xs, ys = self.xs, self.ys
+        a, b, c = self.vertices[t:t + 3]
+        ax, ay = xs[a], ys[a]
+        bx, by = xs[b] - ax, ys[b] - ay
+        cx, cy = xs[c] - ax, ys[c] - ay
+        d = 2 * (bx * cy - by * cx)
+        b2 = bx * bx + by * by
+        c2 = cx * cx + cy * cy
+        circles = self.circles
+        if abs(d) <= FLAT_RATIO * (b2 + c2):
+            circles[t] = circles[t + 1] = circles[t + 2] = NAN
+            return
+        ux = (cy * b2 - by * c2) / d
+        uy = (bx * c2 - cx * b2) / d
+        circles[t] = ax + ux
+        circles[t + 1] = ay + uy
+        circles[t + 2] = ux * ux + uy * uy
+
+    def __len__(self):
+        """Nombre de triangles vivants."""
+        return len(self.vertices) // 3 - len(self.free)
+
+    def triangles(self):
+        """Itère sur les décalages des triangles vivants."""
+        vertices = self.vertices
+        return (t for t in range(0, len(vertices), 3) if vertices[t] >= 0)
+
+    @property
+    def nbytes(self):
+        """Taille en octets des colonnes, liste libre comprise."""
+        return sum(
+            column.itemsize * len(column)
+            for column in (self.vertices, self.neighbours, self.circles, self.free)
+        )
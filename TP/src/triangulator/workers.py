@@ -0,0 +1,191 @@
+"""
+Module Workers
+Description : Ce module exécute les triangulations dans un pool de processus,
+pour que le calcul ne bloque pas les autres requêtes sous le GIL.
+"""
+import multiprocessing
+import os
+import threading
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from concurrent.futures.process import BrokenProcessPool
+from itertools import chain
+from multiprocessing import shared_memory
+
+from .core import triangulate_points
+from .execption import TriangulationTimeout, WorkerCrashed
+
+
+class TriangulationPool:
+    """Pool de processus dédié à `triangulate_points`.
+
+    Les coordonnées sont transmises par mémoire partagée plutôt que par une
+    liste picklée ; seuls le nom du segment et le nombre de points
+    traversent la frontière entre processus.
+    """
+
+    def __init__(self, processes: int, timeout: float):
+        """Prépare un pool de `processes` workers, démarré au premier job."""
+        self.processes = processes
+        self.timeout = timeout
+        self._executor = None
+        self._lock = threading.Lock()
+
+    def start(self):
+        """Démarre les processus workers s'ils ne tournent pas déjà."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ProcessPoolExecutor(
+                    max_workers=self.processes,
+                    mp_context=multiprocessing.get_context("spawn"),
+                )
+            return self._executor
+
+    def warm_up(self) -> set[int]:
+        """Démarre les workers et attend qu'ils aient importé le coeur.
+
+        Un job vide est soumis par worker : le premier vrai job ne paie ni
+        le lancement des processus ni leurs imports. Renvoie les PID prêts.
+        """
+        executor = self.start()
+        futures = [executor.submit(_ready) for _ in range(self.processes)]
+        return {future.result(timeout=self.timeout) for future in futures}
+
+    def triangulate(self, coords) -> list[tuple[int, int, int]]:
+        """Triangule un buffer float32 à plat (x0, y0, ...) dans un worker.
+
+        Lève `TriangulationTimeout` si le job dépasse le délai ; les workers
+        sont alors tués et le job suivant démarre un pool neuf (voir
+        `map_points`).
+        """
+        return self.triangulate_many([coords])[0]
+
+    def triangulate_many(self, buffers: list) -> list[list[tuple[int, int, int]]]:
+        """Triangule plusieurs buffers de coordonnées en parallèle."""
+        results = []
+        for indices in self.map_points(_triangulate_packed, buffers):
+            it = iter(indices)
+            results.append(list(zip(it, it, it, strict=True)))
+        return results
+
+    def map_points(self, job, buffers: list, job_args: list | None = None) -> list:
+        """Exécute `job(points, *args)` dans les workers, un appel par buffer.
+
+        `job` doit être une fonction de module (picklable). Les buffers
+        peuvent être en float32 ('f') ou float64 ('d') ; le délai s'applique
+        à l'ensemble des jobs. À son dépassement, le pool est abandonné et
+        ses workers tués (voir `_abort`) pour ne pas bloquer les jobs
+        suivants. Un worker arrêté en cours de job (le nôtre ou un autre du
+        même pool) lève `WorkerCrashed` et le pool est lui aussi remplacé.
+        """
+        job_args = job_args or [()] * len(buffers)
+        segments = []
+        try:
+            calls = []
+            for coords, args in zip(buffers, job_args, strict=True):
+                coords = memoryview(coords)
+                raw = coords.cast('B')
+                shm = shared_memory.SharedMemory(create=True, size=max(1, len(raw)))
+                segments.append(shm)
+                shm.buf[:len(raw)] = raw
+                calls.append((shm.name, coords.format, len(coords) // 2, args))
+            executor, futures = self._submit(job, calls)
+
+            deadline = time.monotonic() + self.timeout
+            results = []
+            for future in futures:
+                try:
+                    results.append(
+                        future.result(timeout=max(0, deadline - time.monotonic()))
+                    )
+                except FutureTimeout as e:
+                    self._abort(executor)
+                    raise TriangulationTimeout(
+                        f"Triangulation interrompue après {self.timeout:g}s."
+                    ) from e
+                except BrokenProcessPool as e:
+                    self._discard(executor)
+                    raise WorkerCrashed(
+                        "Un worker s'est arrêté pendant la triangulation."
+                    ) from e
+            return results
+        finally:
+            for shm in segments:
+                shm.close()
+                shm.unlink()
+
+    def _submit(self, job, calls: list):
+        """Soumet un job par appel ; renvoie l'exécuteur et les futures.
+
+        Un exécuteur déjà cassé (worker mort entre deux jobs) est remplacé
+        une fois par un neuf avant de lever `WorkerCrashed`.
+        """
+        for attempt in range(2):
+            executor = self.start()
+            try:
+                return executor, [
+                    executor.submit(_run_shared, job, *call) for call in calls
+                ]
+            except BrokenProcessPool as e:
+                self._discard(executor)
+                if attempt:
+                    raise WorkerCrashed(
+                        "Le pool de workers ne démarre pas."
+                    ) from e
+
+    def _discard(self, executor):
+        """Oublie `executor` s'il est encore le courant : le prochain `start`
+        en crée un neuf.
+        """
+        with self._lock:
+            if self._executor is executor:
+                self._executor = None
+
+    def _abort(self, executor):
+        """Abandonne `executor` sans attendre ses jobs et tue ses workers.
+
+        Un calcul Python en cours ne peut pas être interrompu autrement ; le
+        prochain `start` crée un nouvel exécuteur.
+        """
+        self._discard(executor)
+        processes = list((executor._processes or {}).values())
+        executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.kill()
+        for process in processes:
+            process.join()
+
+    def shutdown(self):
+        """Arrête le pool après les jobs en cours, en annulant ceux en attente."""
+        with self._lock:
+            executor, self._executor = self._executor, None
+        if executor is not None:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+
+def _ready() -> int:
+    """Job vide du préchauffage : son dépickling importe ce module (et le
+    coeur) dans le worker.
+    """
+    return os.getpid()
+
+
+def _run_shared(job, shm_name: str, typecode: str, num_points: int, args):
+    """Point d'entrée du worker : lit les points en mémoire partagée."""
+    shm = shared_memory.SharedMemory(name=shm_name)
+    size = 2 * num_points * array(typecode).itemsize
+    try:
+        with shm.buf[:size] as raw, raw.cast(typecode) as coords:
+            values = coords.tolist()
+    finally:
+        shm.close()
+
+    points = list(zip(values[0::2], values[1::2], strict=True))
+    return job(points, *args)
+
+
+def _triangulate_packed(points) -> array:
+    """Triangule et renvoie les indices dans un tableau uint32 compact."""
+    return array('I', chain.from_iterable(triangulate_points(points)))
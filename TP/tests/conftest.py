@@ -0,0 +1,27 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+from src.triangulator.service import result_cache, triangulations
+from tests.data import StubPSMHandler
+
+
+@pytest.fixture(autouse=True)
+def clear_result_cache():
+    """Isole chaque test des caches partagés du service."""
+    result_cache.clear()
+    triangulations.clear()
+    yield
+    result_cache.clear()
+    triangulations.clear()
+
+
+@pytest.fixture
+def psm_url():
+    """Démarre un PointSetManager factice sur un port local libre."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPSMHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
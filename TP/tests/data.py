@@ -0,0 +1,55 @@
+"""
+Module Data
+Description : Ce module regroupe les données et le PointSetManager factice
+partagés par les tests ; `conftest.py` n'en garde que les fixtures.
+"""
+import struct
+import time
+from http.server import BaseHTTPRequestHandler
+
+POINTSET_BIN = struct.pack('<I', 3) + struct.pack('<6f', 0.0, 0.0, 1.0, 0.0, 0.0, 1.0)
+
+
+class StubPSMHandler(BaseHTTPRequestHandler):
+    """PointSetManager minimal répondant selon l'identifiant demandé."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        """Renvoie un PointSet, une erreur ou une réponse lente."""
+        pointset_id = self.path.rsplit("/", 1)[-1]
+        if pointset_id == "missing":
+            self._reply(404, b"{}")
+        elif pointset_id == "broken":
+            self._reply(500, b"{}")
+        elif pointset_id == "truncated":
+            self._reply(200, struct.pack('<I', 3) + struct.pack('<ff', 1.0, 2.0))
+        elif pointset_id == "chunked":
+            self._reply_chunked(POINTSET_BIN)
+        elif pointset_id == "chunked-truncated":
+            self._reply_chunked(struct.pack('<I', 3) + struct.pack('<ff', 1.0, 2.0))
+        elif pointset_id == "slow":
+            time.sleep(0.5)
+            self._reply(200, POINTSET_BIN)
+        else:
+            self._reply(200, POINTSET_BIN)
+
+    def _reply(self, status, body):
+        """Écrit une réponse keep-alive avec Content-Length."""
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _reply_chunked(self, body):
+        """Écrit une réponse en transfert chunked, sans Content-Length."""
+        self.send_response(200)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for start in range(0, len(body), 5):
+            part = body[start:start + 5]
+            self.wfile.write(f"{len(part):x}\r\n".encode() + part + b"\r\n")
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        """Silence les journaux du serveur de test."""
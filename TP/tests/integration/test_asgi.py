@@ -0,0 +1,361 @@
+import asyncio
+import json
+import struct
+import threading
+import time
+import zlib
+
+import pytest
+from src.triangulator import service
+from src.triangulator.admission import AdmissionController
+from src.triangulator.asgi import create_asgi_app
+from src.triangulator.client_psm_async import AsyncPSMClient
+from src.triangulator.encoding import decode_compact, iter_encode
+from src.triangulator.execption import (
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    ServiceOverloaded,
+)
+from src.triangulator.service import triangulate_pointset_bytes, triangulations
+from tests.data import POINTSET_BIN
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+class FakeAsyncClient:
+    """Client PSM asynchrone factice renvoyant une valeur ou une erreur."""
+
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.calls = 0
+
+    async def get_pointset_bytes(self, _pointset_id, on_header=None):
+        self.calls += 1
+        if isinstance(self.outcome, Exception):
+            raise self.outcome
+        if on_header is not None and len(self.outcome) >= 4:
+            await on_header(struct.unpack_from('<I', self.outcome)[0])
+        return self.outcome
+
+    async def close(self):
+        pass
+
+
+def call(app, path, method="GET", headers=(), query_string=b""):
+    """Exécute une requête HTTP sur l'application ASGI ; renvoie
+    (statut, en-têtes, corps).
+    """
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {
+        "type": "http", "method": method, "path": path, "headers": list(headers),
+        "query_string": query_string,
+    }
+    asyncio.run(app(scope, receive, send))
+    headers = dict(messages[0]["headers"])
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return messages[0]["status"], headers, body
+
+
+def test_asgi_success_matches_sync_pipeline():
+    """Teste que le binaire renvoyé est celui du pipeline synchrone."""
+    app = create_asgi_app(FakeAsyncClient(POINTSET_BIN))
+
+    status, headers, body = call(app, f"/triangulation/{POINT_SET_ID}")
+
+    assert status == 200
+    assert headers[b"content-type"] == b"application/octet-stream"
+    assert body == triangulate_pointset_bytes(POINTSET_BIN)
+
+
+@pytest.mark.parametrize("method, path, expected_status, expected_code", [
+    ("GET", "/triangulation/caillou", 400, "INVALID_ID_FORMAT"),
+    ("GET", "/triangulation/", 404, "NOT_FOUND"),
+    ("POST", "/triangulation", 404, "NOT_FOUND"),
+    ("POST", "/triangulation/batch", 405, "METHOD_NOT_ALLOWED"),
+])
+def test_asgi_routing_errors(method, path, expected_status, expected_code):
+    """Teste la validation de l'identifiant et le routage, routes POST de
+    `create_app` absentes comprises.
+    """
+    status, headers, body = call(
+        create_asgi_app(FakeAsyncClient(b"")), path, method
+    )
+
+    assert status == expected_status
+    assert headers[b"content-type"] == b"application/json"
+    assert expected_code.encode() in body
+
+
+@pytest.mark.parametrize("error, expected_status, expected_code", [
+    (PointSetNotFound("absent"), 404, "NOT_FOUND"),
+    (PointSetManagerUnavailable("panne"), 503, "SERVICE_UNAVAILABLE"),
+    (ValueError("bug"), 500, "INTERNAL_ERROR"),
+])
+def test_asgi_error_mapping(error, expected_status, expected_code):
+    """Teste la conversion des erreurs en réponses JSON, comme create_app."""
+    app = create_asgi_app(FakeAsyncClient(error))
+
+    status, _, body = call(app, f"/triangulation/{POINT_SET_ID}")
+
+    assert status == expected_status
+    assert expected_code.encode() in body
+
+
+def test_asgi_overloaded_503_retry_after(monkeypatch):
+    """Teste la réponse 503 avec Retry-After d'un calcul refusé."""
+    controller = AdmissionController(max_cost=3, small_cost=3, max_queue=0)
+    monkeypatch.setattr("src.triangulator.service.admission", controller)
+    app = create_asgi_app(FakeAsyncClient(POINTSET_BIN))
+
+    with controller.admit(3):
+        status, headers, body = call(app, f"/triangulation/{POINT_SET_ID}")
+
+    assert status == 503
+    assert headers[b"retry-after"] == b"5"
+    assert b"OVERLOADED" in body
+
+
+def test_asgi_overloaded_before_reading_body(psm_url, monkeypatch):
+    """Teste que l'admission est décidée dès l'en-tête : le corps n'est pas
+    lu et la connexion interrompue n'est pas rendue au pool.
+    """
+    controller = AdmissionController(max_cost=3, small_cost=3, max_queue=0)
+    monkeypatch.setattr("src.triangulator.service.admission", controller)
+    client = AsyncPSMClient(psm_url)
+    app = create_asgi_app(client)
+
+    with controller.admit(3):
+        status, _, body = call(app, f"/triangulation/{POINT_SET_ID}")
+
+    assert status == 503
+    assert json.loads(body)["code"] == "OVERLOADED"
+    assert client.stats()["idle"] == 0
+    assert controller.in_use == 0
+    assert call(app, f"/triangulation/{POINT_SET_ID}")[0] == 200
+    assert controller.in_use == 0
+
+
+def test_asgi_invalid_pointset_500():
+    """Teste qu'un PointSet mal formé produit une erreur interne."""
+    app = create_asgi_app(FakeAsyncClient(struct.pack('<I', 5)))
+
+    status, _, body = call(app, f"/triangulation/{POINT_SET_ID}")
+
+    assert status == 500
+    assert b"INTERNAL_ERROR" in body
+
+
+def test_async_client_against_stub_server(psm_url):
+    """Teste le client asynchrone contre un PSM factice, keep-alive compris."""
+    client = AsyncPSMClient(psm_url, pool_size=2)
+
+    async def scenario():
+        first = await client.get_pointset_bytes(POINT_SET_ID)
+        chunked = await client.get_pointset_bytes("chunked")
+        with pytest.raises(PointSetNotFound):
+            await client.get_pointset_bytes("missing")
+        with pytest.raises(PointSetManagerUnavailable):
+            await client.get_pointset_bytes("broken")
+        await client.close()
+        return first, chunked
+
+    first, chunked = asyncio.run(scenario())
+
+    assert first == chunked == POINTSET_BIN
+    assert client.stats()["opened"] == 1
+
+
+def test_async_client_header_hook(psm_url):
+    """Teste que `on_header` reçoit le nombre de points (corps de longueur
+    connue ou chunked), que son erreur interrompt la lecture, et que son
+    attente n'est pas comptée dans le délai de lecture.
+    """
+    client = AsyncPSMClient(psm_url, read_timeout=0.2)
+    headers = []
+
+    async def refuse(num_points):
+        headers.append(num_points)
+        raise ServiceOverloaded("Service saturé.", 1)
+
+    async def wait(num_points):
+        headers.append(num_points)
+        await asyncio.sleep(0.4)
+
+    async def scenario():
+        with pytest.raises(ServiceOverloaded):
+            await client.get_pointset_bytes(POINT_SET_ID, on_header=refuse)
+        idle = client.stats()["idle"]
+        results = [
+            await client.get_pointset_bytes(POINT_SET_ID, on_header=wait),
+            await client.get_pointset_bytes("chunked", on_header=wait),
+        ]
+        await client.close()
+        return idle, results
+
+    idle, results = asyncio.run(scenario())
+
+    assert idle == 0
+    assert results == [POINTSET_BIN, POINTSET_BIN]
+    assert headers == [3, 3, 3]
+
+
+def test_async_client_read_timeout(psm_url):
+    """Teste qu'une réponse trop lente est signalée comme indisponibilité."""
+    client = AsyncPSMClient(psm_url, read_timeout=0.1)
+
+    with pytest.raises(PointSetManagerUnavailable):
+        asyncio.run(client.get_pointset_bytes("slow"))
+
+
+def test_asgi_negotiates_compact_encoding():
+    """Teste la négociation du format compact et de la compression."""
+    app = create_asgi_app(FakeAsyncClient(POINTSET_BIN))
+
+    status, headers, body = call(
+        app,
+        f"/triangulation/{POINT_SET_ID}",
+        headers=[
+            (b"accept", b"application/x-triangles; vertices=0"),
+            (b"accept-encoding", b"deflate"),
+        ],
+    )
+
+    assert status == 200
+    assert headers[b"content-type"] == b"application/x-triangles"
+    assert headers[b"content-encoding"] == b"deflate"
+    indices = list(struct.unpack('<3I', triangulate_pointset_bytes(POINTSET_BIN)[-12:]))
+    assert decode_compact(zlib.decompress(body)) == (3, None, indices)
+
+
+def test_asgi_invalid_accept_406():
+    """Teste le refus d'un paramètre d'encodage invalide."""
+    client = FakeAsyncClient(POINTSET_BIN)
+    app = create_asgi_app(client)
+
+    status, _, body = call(
+        app,
+        f"/triangulation/{POINT_SET_ID}",
+        headers=[(b"accept", b"application/x-triangles; indices=u8")],
+    )
+
+    assert status == 406
+    assert json.loads(body)["code"] == "NOT_ACCEPTABLE"
+    assert client.calls == 0
+
+
+def test_asgi_server_timing_and_metrics():
+    """Teste l'en-tête Server-Timing et la route /metrics en ASGI."""
+    app = create_asgi_app(FakeAsyncClient(POINTSET_BIN))
+
+    _, headers, _ = call(app, f"/triangulation/{POINT_SET_ID}")
+    status, metrics_headers, body = call(app, "/metrics")
+
+    assert b"triangulate;dur=" in headers[b"server-timing"]
+    assert status == 200
+    assert metrics_headers[b"content-type"].startswith(b"text/plain")
+    assert b'triangulator_stage_seconds_count{stage="fetch"}' in body
+
+
+def test_asgi_base_refetches_and_updates(monkeypatch):
+    """Teste que le paramètre base force une nouvelle récupération et met à
+    jour la triangulation conservée.
+    """
+    monkeypatch.setattr(triangulations, "max_points", 1000)
+    client = FakeAsyncClient(POINTSET_BIN)
+    app = create_asgi_app(client)
+    call(app, f"/triangulation/{POINT_SET_ID}")
+    client.outcome = struct.pack('<I', 4) + struct.pack(
+        '<8f', 0.0, 0.0, 1.0, 0.0, 0.0, 1.0, 0.9, 0.8
+    )
+
+    _, _, stale = call(app, f"/triangulation/{POINT_SET_ID}")
+    status, _, body = call(
+        app, f"/triangulation/{POINT_SET_ID}",
+        query_string=f"base={POINT_SET_ID}".encode(),
+    )
+
+    assert stale == triangulate_pointset_bytes(POINTSET_BIN)
+    assert status == 200
+    assert body.startswith(client.outcome)
+    assert struct.unpack_from('<I', body, len(client.outcome))[0] == 2
+    assert client.calls == 2
+    assert triangulations.stats()["hits"] == 1
+
+
+def test_asgi_lifespan_warms_up_connections(psm_url, monkeypatch):
+    """Teste que le démarrage ASGI ouvre les connexions configurées."""
+    monkeypatch.setattr("src.triangulator.asgi.PSM_PREWARM_CONNECTIONS", 2)
+    client = AsyncPSMClient(psm_url, pool_size=4)
+    app = create_asgi_app(client)
+    messages = [{"type": "lifespan.startup"}, {"type": "lifespan.shutdown"}]
+    sent = []
+
+    async def receive():
+        return messages.pop(0)
+
+    async def send(message):
+        if message["type"] == "lifespan.startup.complete":
+            sent.append(client.stats()["idle"])
+        sent.append(message["type"])
+
+    asyncio.run(app({"type": "lifespan"}, receive, send))
+
+    assert sent == [2, "lifespan.startup.complete", "lifespan.shutdown.complete"]
+    assert client.stats()["opened"] == 2
+    assert client.stats()["idle"] == 0
+
+
+def test_asgi_concurrent_requests_share_computation(monkeypatch):
+    """Teste que des GET concurrents identiques partagent un seul calcul."""
+    expected = triangulate_pointset_bytes(POINTSET_BIN)
+    computed = []
+    original = service.triangulate_pointset
+
+    def slow_triangulate(*args):
+        computed.append(args[1])
+        time.sleep(0.2)
+        return original(*args)
+
+    monkeypatch.setattr(service, "triangulate_pointset", slow_triangulate)
+    app = create_asgi_app(FakeAsyncClient(POINTSET_BIN))
+
+    async def scenario():
+        return await asyncio.gather(*(
+            asyncio.to_thread(call, app, f"/triangulation/{POINT_SET_ID}")
+            for _ in range(4)
+        ))
+
+    results = asyncio.run(scenario())
+
+    assert computed == [POINT_SET_ID]
+    assert {status for status, _, _ in results} == {200}
+    assert {body for _, _, body in results} == {expected}
+
+
+def test_asgi_encodes_off_event_loop(monkeypatch):
+    """Teste que l'encodage de la réponse n'est pas exécuté sur la boucle."""
+    threads = []
+
+    def recording_encode(chunks, negotiated):
+        for chunk in iter_encode(chunks, negotiated):
+            threads.append(threading.get_ident())
+            yield chunk
+
+    monkeypatch.setattr("src.triangulator.asgi.iter_encode", recording_encode)
+    app = create_asgi_app(FakeAsyncClient(POINTSET_BIN))
+
+    status, _, body = call(
+        app, f"/triangulation/{POINT_SET_ID}",
+        headers=[(b"accept-encoding", b"gzip")],
+    )
+
+    assert status == 200
+    assert zlib.decompress(body, 31) == triangulate_pointset_bytes(POINTSET_BIN)
+    assert threads and threading.get_ident() not in threads
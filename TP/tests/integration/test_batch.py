@@ -0,0 +1,129 @@
+import json
+import threading
+
+import pytest
+from src.triangulator.app import create_app
+from src.triangulator.client_psm import PointSetManagerUnavailable, PointSetNotFound
+from src.triangulator.core import iter_batch_frames
+from src.triangulator.execption import InvalidBinaryFormat
+from tests.data import POINTSET_BIN
+
+FAST_ID = "11111111-1111-1111-1111-111111111111"
+SLOW_ID = "22222222-2222-2222-2222-222222222222"
+MISSING_ID = "33333333-3333-3333-3333-333333333333"
+DOWN_ID = "44444444-4444-4444-4444-444444444444"
+BROKEN_ID = "55555555-5555-5555-5555-555555555555"
+
+
+@pytest.fixture
+def client():
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture
+def fake_psm(monkeypatch):
+    """Remplace le PSM ; SLOW_ID attend que l'événement renvoyé soit levé."""
+    release_slow = threading.Event()
+
+    def get_pointset_bytes(pointset_id, on_header=None):
+        if pointset_id == SLOW_ID:
+            assert release_slow.wait(5)
+        elif pointset_id == MISSING_ID:
+            raise PointSetNotFound("PointSet ID non trouvé")
+        elif pointset_id == DOWN_ID:
+            raise PointSetManagerUnavailable("PSM inaccessible")
+        elif pointset_id == BROKEN_ID:
+            return b"\x01"
+        return POINTSET_BIN
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        get_pointset_bytes)
+    return release_slow
+
+
+def post_batch(client, pointset_ids):
+    """Envoie un lot et décode les trames de la réponse."""
+    response = client.post("/triangulation/batch",
+                           json={"pointSetIds": pointset_ids})
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    return list(iter_batch_frames(response.data))
+
+
+def test_batch_returns_frames_in_completion_order(client, fake_psm):
+    """Teste qu'un élément lent ne retarde pas un élément rapide."""
+    response = client.post("/triangulation/batch",
+                           json={"pointSetIds": [SLOW_ID, FAST_ID]},
+                           buffered=False)
+    chunks = iter(response.response)
+
+    first = next(chunks)
+    fake_psm.set()
+    frames = list(iter_batch_frames(first + b"".join(chunks)))
+
+    assert [frame[0] for frame in frames] == [FAST_ID, SLOW_ID]
+    assert all(status == 200 for _, status, _ in frames)
+    assert frames[0][2] == frames[1][2]
+
+
+def test_batch_results_match_single_route(client, fake_psm):
+    """Teste qu'une trame contient le même binaire que la route unitaire."""
+    [(_, status, payload)] = post_batch(client, [FAST_ID])
+
+    single = client.get(f"/triangulation/{FAST_ID}")
+
+    assert status == 200
+    assert payload == single.data
+
+
+def test_batch_per_item_errors(client, fake_psm):
+    """Teste qu'une erreur reste confinée à la trame de son élément."""
+    frames = {
+        pointset_id: (status, payload)
+        for pointset_id, status, payload in post_batch(
+            client, [FAST_ID, MISSING_ID, DOWN_ID, BROKEN_ID]
+        )
+    }
+
+    assert frames[FAST_ID][0] == 200
+    for pointset_id, status, code in [
+        (MISSING_ID, 404, "NOT_FOUND"),
+        (DOWN_ID, 503, "SERVICE_UNAVAILABLE"),
+        (BROKEN_ID, 500, "INTERNAL_ERROR"),
+    ]:
+        assert frames[pointset_id][0] == status
+        assert json.loads(frames[pointset_id][1])["code"] == code
+
+
+@pytest.mark.parametrize("body, code", [
+    (None, "INVALID_REQUEST"),
+    ({"pointSetIds": []}, "INVALID_REQUEST"),
+    ({"pointSetIds": FAST_ID}, "INVALID_REQUEST"),
+    ({"pointSetIds": [FAST_ID, "not-a-uuid"]}, "INVALID_ID_FORMAT"),
+    ({"pointSetIds": [FAST_ID, 42]}, "INVALID_ID_FORMAT"),
+])
+def test_batch_rejects_invalid_body(client, body, code):
+    """Teste la validation du corps de la requête de lot."""
+    response = client.post("/triangulation/batch", json=body)
+
+    assert response.status_code == 400
+    assert response.json["code"] == code
+
+
+def test_batch_rejects_too_many_items(client, monkeypatch):
+    """Teste la limite de taille d'un lot."""
+    monkeypatch.setattr("src.triangulator.app.BATCH_MAX_ITEMS", 2)
+
+    response = client.post("/triangulation/batch",
+                           json={"pointSetIds": [FAST_ID] * 3})
+
+    assert response.status_code == 400
+    assert response.json["code"] == "BATCH_TOO_LARGE"
+
+
+def test_batch_truncated_stream_rejected():
+    """Teste le décodage d'un flux de lot tronqué."""
+    with pytest.raises(InvalidBinaryFormat):
+        list(iter_batch_frames(b"\x00" * 10))
@@ -0,0 +1,152 @@
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+from src.triangulator.client_psm import PSMClient
+from src.triangulator.execption import (
+    InvalidBinaryFormat,
+    PointSetManagerUnavailable,
+    PointSetNotFound,
+    ServiceOverloaded,
+)
+from tests.data import POINTSET_BIN, StubPSMHandler
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def test_client_reuses_keep_alive_connection(psm_url):
+    """Teste que plusieurs requêtes successives partagent une connexion."""
+    client = PSMClient(psm_url, pool_size=2)
+
+    for _ in range(3):
+        assert client.get_pointset_bytes(POINT_SET_ID) == POINTSET_BIN
+
+    stats = client.stats()
+    assert stats["opened"] == 1
+    assert stats["requests"] == 3
+    assert stats["in_use"] == 0
+    assert stats["idle"] == 1
+    client.close()
+
+
+def test_client_pool_bounded_under_concurrency(psm_url):
+    """Teste que le nombre de connexions ouvertes ne dépasse pas le pool."""
+    client = PSMClient(psm_url, pool_size=2)
+    results = []
+
+    def fetch():
+        results.append(client.get_pointset_bytes(POINT_SET_ID))
+
+    threads = [threading.Thread(target=fetch) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert results == [POINTSET_BIN] * 8
+    assert client.stats()["opened"] <= 2
+    client.close()
+
+
+def test_client_not_found_404(psm_url):
+    """Teste la conversion d'un 404 du PSM en PointSetNotFound."""
+    client = PSMClient(psm_url)
+
+    with pytest.raises(PointSetNotFound):
+        client.get_pointset_bytes("missing")
+
+
+def test_client_server_error_503(psm_url):
+    """Teste la conversion d'un 5xx du PSM en PointSetManagerUnavailable."""
+    client = PSMClient(psm_url)
+
+    with pytest.raises(PointSetManagerUnavailable):
+        client.get_pointset_bytes("broken")
+
+
+def test_client_truncated_body_rejected(psm_url):
+    """Teste qu'un corps plus court que l'en-tête annoncé est rejeté,
+    et que la connexion fautive n'est pas remise dans le pool.
+    """
+    client = PSMClient(psm_url)
+
+    with pytest.raises(InvalidBinaryFormat):
+        client.get_pointset_bytes("truncated")
+    assert client.stats()["idle"] == 0
+
+
+def test_client_chunked_body_streamed(psm_url):
+    """Teste la lecture d'un PointSet transmis sans Content-Length."""
+    client = PSMClient(psm_url)
+
+    assert client.get_pointset_bytes("chunked") == POINTSET_BIN
+    with pytest.raises(InvalidBinaryFormat):
+        client.get_pointset_bytes("chunked-truncated")
+
+
+def test_client_header_hook_error_propagated(psm_url):
+    """Teste qu'une erreur levée par `on_header` interrompt la lecture sans
+    être masquée, et que la connexion interrompue n'est pas réutilisée.
+    """
+    client = PSMClient(psm_url)
+    headers = []
+
+    def refuse(num_points):
+        headers.append(num_points)
+        raise ServiceOverloaded("Service saturé.", 1)
+
+    with pytest.raises(ServiceOverloaded):
+        client.get_pointset_bytes(POINT_SET_ID, on_header=refuse)
+    assert headers == [3]
+    assert client.stats()["idle"] == 0
+    assert client.get_pointset_bytes(POINT_SET_ID, on_header=headers.append) == (
+        POINTSET_BIN
+    )
+    assert headers == [3, 3]
+    client.close()
+
+
+def test_client_read_timeout(psm_url):
+    """Teste qu'une réponse plus lente que le délai de lecture échoue."""
+    client = PSMClient(psm_url, read_timeout=0.1)
+
+    with pytest.raises(PointSetManagerUnavailable):
+        client.get_pointset_bytes("slow")
+    assert client.stats()["in_use"] == 0
+
+
+def test_client_connection_refused():
+    """Teste qu'un PSM injoignable est signalé comme indisponible."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPSMHandler)
+    port = server.server_address[1]
+    server.server_close()
+    client = PSMClient(f"http://127.0.0.1:{port}", connect_timeout=0.5)
+
+    with pytest.raises(PointSetManagerUnavailable):
+        client.get_pointset_bytes(POINT_SET_ID)
+
+
+def test_client_warm_up_opens_reusable_connections(psm_url):
+    """Teste que les connexions préchauffées servent les requêtes suivantes."""
+    client = PSMClient(psm_url, pool_size=2)
+
+    assert client.warm_up(5) == 2
+    assert client.stats()["idle"] == 2
+    assert client.get_pointset_bytes(POINT_SET_ID) == POINTSET_BIN
+
+    stats = client.stats()
+    assert stats["opened"] == 2
+    assert stats["idle"] == 2
+    client.close()
+
+
+def test_client_warm_up_unreachable():
+    """Teste que le préchauffage signale un PSM injoignable."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), StubPSMHandler)
+    port = server.server_address[1]
+    server.server_close()
+    client = PSMClient(f"http://127.0.0.1:{port}", connect_timeout=0.5)
+
+    with pytest.raises(PointSetManagerUnavailable):
+        client.warm_up(2)
+    assert client.stats()["idle"] == 0
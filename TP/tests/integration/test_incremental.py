@@ -0,0 +1,142 @@
+import random
+import struct
+
+import pytest
+from src.triangulator import service
+from src.triangulator.app import create_app
+from src.triangulator.service import triangulate_pointset_bytes, triangulations
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+NEXT_ID = "123e4567-e89b-12d3-a456-426614174001"
+COPY_ID = "123e4567-e89b-12d3-a456-426614174002"
+
+
+def pointset_bytes(points):
+    """Encode des points au format binaire PointSet."""
+    return struct.pack('<I', len(points)) + struct.pack(
+        f'<{2 * len(points)}f', *(c for point in points for c in point)
+    )
+
+
+def two_versions():
+    """Renvoie deux versions binaires d'un PointSet : 10 points remplacés,
+    coins de la boîte englobante conservés.
+    """
+    rng = random.Random(8)
+    corners = [(0.0, 0.0), (1000.0, 0.0), (0.0, 1000.0), (1000.0, 1000.0)]
+    points = [(float(rng.randrange(1, 1000)), float(rng.randrange(1, 1000)))
+              for _ in range(200)]
+    edited = points[10:] + [
+        (float(rng.randrange(1, 1000)), float(rng.randrange(1, 1000)))
+        for _ in range(10)
+    ]
+    return pointset_bytes(corners + points), pointset_bytes(corners + edited)
+
+
+def triangle_set(triangles_bin):
+    """Décode un binaire Triangles en ensemble de triangles de coordonnées,
+    indépendant de l'ordre des triangles et de leur sommet de départ.
+    """
+    num_points = struct.unpack_from('<I', triangles_bin)[0]
+    coords = struct.unpack_from(f'<{2 * num_points}f', triangles_bin, 4)
+    offset = 8 + 8 * num_points
+    indices = struct.unpack_from(f'<{(len(triangles_bin) - offset) // 4}I',
+                                 triangles_bin, offset)
+    points = list(zip(coords[0::2], coords[1::2], strict=True))
+    return {
+        frozenset(points[i] for i in indices[t:t + 3])
+        for t in range(0, len(indices), 3)
+    }
+
+
+def same_triangulation(triangles_bin, pointset_bin):
+    """Indique si un binaire Triangles est la triangulation de `pointset_bin`
+    (ses sommets reprennent le PointSet tel quel).
+    """
+    expected = triangulate_pointset_bytes(pointset_bin)
+    return (triangles_bin.startswith(pointset_bin)
+            and triangle_set(triangles_bin) == triangle_set(expected))
+
+
+@pytest.fixture
+def client():
+    """Crée un client Flask pour les tests d'API."""
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+@pytest.fixture
+def psm(monkeypatch):
+    """PSM simulé dont le contenu est modifiable ; active le mode incrémental."""
+    contents = {}
+    monkeypatch.setattr(service, "get_pointset_bytes",
+                        lambda pointset_id, on_header=None: contents[pointset_id])
+    monkeypatch.setattr(triangulations, "max_points", 1_000_000)
+    return contents
+
+
+def test_base_applies_diff_to_same_id(client, psm):
+    """Teste la mise à jour d'un PointSet dont le contenu a changé."""
+    first, second = two_versions()
+    psm[POINT_SET_ID] = first
+    assert client.get(f"/triangulation/{POINT_SET_ID}").get_data() == \
+        triangulate_pointset_bytes(first)
+
+    psm[POINT_SET_ID] = second
+    stale = client.get(f"/triangulation/{POINT_SET_ID}")
+    updated = client.get(f"/triangulation/{POINT_SET_ID}?base={POINT_SET_ID}")
+
+    assert stale.get_data() == triangulate_pointset_bytes(first)
+    assert updated.status_code == 200
+    assert same_triangulation(updated.get_data(), second)
+    assert triangulations.stats()["hits"] == 1
+    assert same_triangulation(
+        client.get(f"/triangulation/{POINT_SET_ID}").get_data(), second
+    )
+
+
+def test_base_applies_diff_to_new_id(client, psm):
+    """Teste la triangulation d'une nouvelle version sous un autre identifiant."""
+    first, second = two_versions()
+    psm[POINT_SET_ID], psm[NEXT_ID] = first, second
+    client.get(f"/triangulation/{POINT_SET_ID}").get_data()
+
+    response = client.get(f"/triangulation/{NEXT_ID}?base={POINT_SET_ID}")
+
+    assert same_triangulation(response.get_data(), second)
+    assert triangulations.stats()["hits"] == 1
+
+
+def test_base_result_not_shared_by_content(client, psm):
+    """Teste qu'un résultat incrémental, qui dépend des versions
+    précédentes, n'est pas servi à un autre identifiant de même contenu.
+    """
+    first, second = two_versions()
+    psm[POINT_SET_ID], psm[NEXT_ID], psm[COPY_ID] = first, second, second
+    client.get(f"/triangulation/{POINT_SET_ID}").get_data()
+    client.get(f"/triangulation/{NEXT_ID}?base={POINT_SET_ID}").get_data()
+
+    assert service.result_cache.get(service.result_cache.digest(second)) is None
+    assert client.get(f"/triangulation/{COPY_ID}").get_data() == \
+        triangulate_pointset_bytes(second)
+
+
+def test_base_unknown_falls_back_to_full_run(client, psm):
+    """Teste le calcul complet quand la version de base n'est pas conservée."""
+    _, second = two_versions()
+    psm[NEXT_ID] = second
+
+    response = client.get(f"/triangulation/{NEXT_ID}?base={POINT_SET_ID}")
+
+    assert response.get_data() == triangulate_pointset_bytes(second)
+    assert triangulations.stats()["misses"] == 1
+
+
+def test_base_invalid_uuid_400(client):
+    """Teste le refus d'une version de base qui n'est pas un UUID."""
+    response = client.get(f"/triangulation/{POINT_SET_ID}?base=caillou")
+
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_ID_FORMAT"
+
@@ -0,0 +1,55 @@
+import pytest
+from src.triangulator.app import create_app
+from tests.data import POINTSET_BIN
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(
+        "src.triangulator.service.get_pointset_bytes",
+        lambda _id, on_header=None: POINTSET_BIN,
+    )
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+def test_server_timing_lists_completed_stages(client):
+    """Teste que les étapes terminées avant les en-têtes sont annoncées."""
+    response = client.get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 200
+    stages = [
+        entry.split(";")[0]
+        for entry in response.headers["Server-Timing"].split(", ")
+    ]
+    assert stages == ["fetch", "deserialize", "triangulate"]
+
+
+def test_server_timing_absent_on_cache_hit(client):
+    """Teste qu'un résultat servi depuis le cache n'annonce aucune étape."""
+    client.get(f"/triangulation/{POINT_SET_ID}").get_data()
+
+    response = client.get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 200
+    assert "Server-Timing" not in response.headers
+
+
+def test_metrics_endpoint_exposes_histograms(client):
+    """Teste /metrics après une triangulation."""
+    client.get(f"/triangulation/{POINT_SET_ID}").get_data()
+
+    response = client.get("/metrics")
+
+    assert response.status_code == 200
+    assert response.content_type.startswith("text/plain; version=0.0.4")
+    text = response.get_data(as_text=True)
+    for stage in ("fetch", "deserialize", "triangulate", "serialize"):
+        assert f'triangulator_stage_seconds_count{{stage="{stage}"}}' in text
+    assert "triangulator_pointset_points_count" in text
+    assert "triangulator_result_triangles_count" in text
+    assert 'triangulator_payload_bytes_count{kind="triangles"}' in text
+    assert "triangulator_cache_hits" in text
@@ -1,8 +1,14 @@
+import io
 import struct
+import threading
+import time
 
 import pytest
+from src.triangulator import service
+from src.triangulator.admission import AdmissionController
 from src.triangulator.app import create_app
 from src.triangulator.client_psm import PointSetManagerUnavailable, PointSetNotFound
+from src.triangulator.service import inflight
 
 POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
 NOT_FOUND_ID = "00000000-0000-0000-0000-000000000000"
@@ -20,21 +26,21 @@ def client():
 def test_integration_success_workflow(client, monkeypatch):
     """Teste le scénario nominal complet.
     """
-    def mock_get_psm_success(_id):
+    def mock_get_psm_success(_id, on_header=None):
         return MOCK_POINTSET_BIN 
     
     def mock_triangulate_success(_data):
         return [(0, 1, 2)] 
 
     def mock_serialize_success(_points, _triangles):
-        return MOCK_TRIANGLES_BIN
+        yield MOCK_TRIANGLES_BIN
 
     monkeypatch.setattr("src.triangulator.service.get_pointset_bytes", 
                         mock_get_psm_success)
     monkeypatch.setattr("src.triangulator.service.triangulate_points", 
                         mock_triangulate_success)
     
-    monkeypatch.setattr("src.triangulator.service.serialize_triangles", 
+    monkeypatch.setattr("src.triangulator.service.iter_serialize_triangles", 
                         mock_serialize_success)
 
     response = client.get(f"/triangulation/{POINT_SET_ID}")
@@ -47,7 +53,7 @@ def test_integration_not_found_404(client, monkeypatch):
     """Teste la gestion d'une erreur 404 reçue du PointSetManager.
     Le Triangulator doit intercepter l'exception PointSetNotFound et répondre 404.
     """
-    def mock_get_psm_404(_id):
+    def mock_get_psm_404(_id, on_header=None):
         raise PointSetNotFound("PointSet ID non trouvé")
 
     monkeypatch.setattr("src.triangulator.service.get_pointset_bytes", mock_get_psm_404)
@@ -64,7 +70,7 @@ def test_integration_service_unavailable_503(client, monkeypatch):
     Le Triangulator doit intercepter l'exception PointSetManagerUnavailable 
     et répondre 503.
     """
-    def mock_get_psm_503(_id):
+    def mock_get_psm_503(_id, on_header=None):
         raise PointSetManagerUnavailable("PSM inaccessible ou en panne")
 
     monkeypatch.setattr("src.triangulator.service.get_pointset_bytes", mock_get_psm_503)
@@ -76,11 +82,73 @@ def test_integration_service_unavailable_503(client, monkeypatch):
     assert response.json["code"] == "SERVICE_UNAVAILABLE"
 
 
+def test_integration_overloaded_503_retry_after(client, monkeypatch):
+    """Teste le refus d'un calcul par le contrôle d'admission : 503, code
+    OVERLOADED et en-tête Retry-After.
+    """
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        lambda _id, on_header=None: MOCK_POINTSET_BIN)
+    monkeypatch.setattr("src.triangulator.service.admission",
+                        AdmissionController(max_cost=10, small_cost=10,
+                                            queue_timeout=2, max_queue=0))
+
+    with service.admission.admit(10):
+        response = client.get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 503
+    assert response.json["code"] == "OVERLOADED"
+    assert response.headers["Retry-After"] == "2"
+
+
+class RecordingStream(io.BytesIO):
+    """Corps de PointSet qui compte les octets lus."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.consumed = 0
+
+    def read(self, size=-1):
+        data = super().read(size)
+        self.consumed += len(data)
+        return data
+
+    def readinto(self, buffer):
+        count = super().readinto(buffer)
+        self.consumed += count
+        return count
+
+
+def test_integration_overloaded_body_not_read(client, monkeypatch):
+    """Teste qu'un service saturé refuse dès l'en-tête du PointSet, sans lire
+    son corps, qu'il vienne du PSM ou d'un envoi direct.
+    """
+    stream = RecordingStream(struct.pack('<I', 1000) + b"\x00" * 8000)
+    monkeypatch.setattr(
+        "src.triangulator.service.get_pointset_bytes",
+        lambda _id, on_header=None: service.read_pointset_body(stream, on_header),
+    )
+    monkeypatch.setattr("src.triangulator.service.admission",
+                        AdmissionController(max_cost=10, small_cost=10,
+                                            queue_timeout=0.1, max_queue=0))
+
+    with service.admission.admit(10):
+        fetched = client.get(f"/triangulation/{POINT_SET_ID}")
+        upload = RecordingStream(stream.getvalue())
+        uploaded = client.post("/triangulation", input_stream=upload,
+                               content_length=len(upload.getvalue()),
+                               content_type="application/octet-stream")
+
+    assert fetched.status_code == uploaded.status_code == 503
+    assert fetched.json["code"] == uploaded.json["code"] == "OVERLOADED"
+    assert stream.consumed == upload.consumed == 4
+    assert service.admission.stats()["in_use"] == 0
+
+
 def test_integration_internal_algorithm_failure_500(client, monkeypatch):
     """Teste le cas où l'algorithme de triangulation lève une erreur interne.
     Le Triangulator doit intercepter l'erreur et répondre 500.
     """
-    def mock_get_psm_success(_id):
+    def mock_get_psm_success(_id, on_header=None):
         return MOCK_POINTSET_BIN
     
     def mock_triangulate_failure(_data):
@@ -102,7 +170,7 @@ def test_integration_psm_unexpected_error_500(client, monkeypatch):
     """Teste la gestion d'une erreur inattendue levée par le client PSM .
     Le Triangulator doit gérer cette exception non gérée et répondre 500.
     """
-    def mock_get_psm_exception(_id):
+    def mock_get_psm_exception(_id, on_header=None):
         raise Exception("Erreur réseau ou parsing imprévue")
 
     monkeypatch.setattr("src.triangulator.service.get_pointset_bytes", 
@@ -115,3 +183,103 @@ def test_integration_psm_unexpected_error_500(client, monkeypatch):
     assert response.json["code"] == "INTERNAL_ERROR"
 
 
+def test_integration_cached_result_skips_psm(client, monkeypatch):
+    """Teste qu'un second appel pour le même identifiant est servi par le
+    cache sans solliciter à nouveau le PointSetManager.
+    """
+    calls = []
+
+    def mock_get_psm_success(_id, on_header=None):
+        calls.append(_id)
+        return MOCK_POINTSET_BIN
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        mock_get_psm_success)
+
+    first = client.get(f"/triangulation/{POINT_SET_ID}")
+    first_data = first.data
+    second = client.get(f"/triangulation/{POINT_SET_ID}")
+
+    assert first.status_code == second.status_code == 200
+    assert first_data == second.data
+    assert calls == [POINT_SET_ID]
+
+
+def test_integration_streamed_response_matches_serializer(client, monkeypatch):
+    """Teste que la réponse diffusée par morceaux est identique au binaire
+    produit en une fois par serialize_triangles.
+    """
+    points = [(float(x), float(y)) for x in range(40) for y in range(40)]
+    pointset_bin = struct.pack('<I', len(points)) + b"".join(
+        struct.pack('<ff', x, y) for x, y in points
+    )
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        lambda _id, on_header=None: pointset_bin)
+
+    response = client.get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 200
+    assert response.is_streamed
+    assert response.content_length is None
+    num_points = struct.unpack_from('<I', response.data)[0]
+    assert num_points == len(points)
+    num_triangles = struct.unpack_from('<I', response.data, 4 + 8 * num_points)[0]
+    assert num_triangles == 2 * 39 * 39
+
+
+def test_integration_concurrent_requests_coalesced(monkeypatch):
+    """Teste que des requêtes simultanées pour le même identifiant ne
+    déclenchent qu'une seule récupération auprès du PointSetManager.
+    """
+    calls = []
+
+    def mock_get_psm_slow(_id, on_header=None):
+        calls.append(_id)
+        time.sleep(0.2)
+        return MOCK_POINTSET_BIN
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        mock_get_psm_slow)
+    app = create_app()
+    statuses = []
+
+    def fetch():
+        response = app.test_client().get(f"/triangulation/{POINT_SET_ID}")
+        statuses.append(response.status_code)
+
+    collapsed_before = inflight.collapsed
+    threads = [threading.Thread(target=fetch) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [200] * 5
+    assert calls == [POINT_SET_ID]
+    assert inflight.collapsed - collapsed_before == 4
+
+
+def test_integration_concurrent_failure_shared(monkeypatch):
+    """Teste que l'erreur du premier appel est transmise aux requêtes en attente."""
+    def mock_get_psm_slow_404(_id, on_header=None):
+        time.sleep(0.2)
+        raise PointSetNotFound("PointSet ID non trouvé")
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        mock_get_psm_slow_404)
+    app = create_app()
+    statuses = []
+
+    def fetch():
+        response = app.test_client().get(f"/triangulation/{NOT_FOUND_ID}")
+        statuses.append(response.status_code)
+
+    threads = [threading.Thread(target=fetch) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert statuses == [404] * 3
+
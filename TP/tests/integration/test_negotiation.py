@@ -0,0 +1,80 @@
+import gzip
+import struct
+
+import pytest
+from src.triangulator.app import create_app
+from src.triangulator.encoding import COMPACT_MIMETYPE, decode_compact
+from src.triangulator.service import triangulate_pointset_bytes
+from tests.data import POINTSET_BIN
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+TRIANGLES_BIN = triangulate_pointset_bytes(POINTSET_BIN)
+INDICES = list(struct.unpack('<3I', TRIANGLES_BIN[-12:]))
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        lambda _id, on_header=None: POINTSET_BIN)
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+def test_default_format_unchanged(client):
+    """Teste que, sans en-tête, la réponse reste au format Triangles."""
+    response = client.get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    assert "Content-Encoding" not in response.headers
+    assert response.headers["Vary"] == "Accept, Accept-Encoding"
+    assert response.data == TRIANGLES_BIN
+
+
+def test_compact_without_vertices_gzip(client):
+    """Teste le format compact, sans sommets, compressé en gzip."""
+    response = client.get(
+        f"/triangulation/{POINT_SET_ID}",
+        headers={
+            "Accept": f"{COMPACT_MIMETYPE}; indices=varint; vertices=0",
+            "Accept-Encoding": "gzip",
+        },
+    )
+
+    assert response.status_code == 200
+    assert response.mimetype == COMPACT_MIMETYPE
+    assert response.headers["Content-Encoding"] == "gzip"
+    assert decode_compact(gzip.decompress(response.data)) == (3, None, INDICES)
+
+
+def test_upload_route_negotiates_too(client):
+    """Teste la négociation sur la route d'envoi direct."""
+    response = client.post(
+        "/triangulation",
+        data=POINTSET_BIN,
+        content_type="application/octet-stream",
+        headers={"Accept": COMPACT_MIMETYPE},
+    )
+
+    assert response.status_code == 200
+    num_points, coords, indices = decode_compact(response.data)
+    assert (num_points, indices) == (3, INDICES)
+    assert coords == TRIANGLES_BIN[4:28]
+
+
+def test_invalid_accept_parameter_406(client, monkeypatch):
+    """Teste qu'un paramètre invalide est refusé avant tout calcul."""
+    def psm_must_not_be_called(_id, on_header=None):
+        raise AssertionError("Le PSM ne doit pas être sollicité.")
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        psm_must_not_be_called)
+
+    response = client.get(
+        f"/triangulation/{POINT_SET_ID}",
+        headers={"Accept": f"{COMPACT_MIMETYPE}; indices=u8"},
+    )
+
+    assert response.status_code == 406
+    assert response.json["code"] == "NOT_ACCEPTABLE"
@@ -0,0 +1,47 @@
+import os
+
+import pytest
+from src.triangulator import profiling
+from src.triangulator.app import create_app
+from tests.data import POINTSET_BIN
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+@pytest.fixture
+def client(monkeypatch):
+    monkeypatch.setattr(
+        "src.triangulator.service.get_pointset_bytes",
+        lambda _id, on_header=None: POINTSET_BIN,
+    )
+    app = create_app()
+    app.config['TESTING'] = True
+    return app.test_client()
+
+
+def test_profile_header_saves_capture(client, tmp_path, monkeypatch):
+    """Teste qu'une requête avec l'en-tête de profilage laisse une capture."""
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+
+    response = client.get(
+        f"/triangulation/{POINT_SET_ID}",
+        headers={profiling.PROFILE_HEADER: "1"},
+    )
+
+    assert response.status_code == 200
+    [capture] = os.listdir(tmp_path)
+    files = set(os.listdir(tmp_path / capture))
+    assert {profiling.POINTSET_FILE, profiling.PSTATS_FILE} <= files
+
+
+def test_profile_header_ignored_when_disabled(client, tmp_path, monkeypatch):
+    """Teste que l'en-tête n'a aucun effet sans PROFILE_DIR."""
+    monkeypatch.setattr(profiling, "PROFILE_DIR", None)
+
+    response = client.get(
+        f"/triangulation/{POINT_SET_ID}",
+        headers={profiling.PROFILE_HEADER: "1"},
+    )
+
+    assert response.status_code == 200
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,131 @@
+import io
+import struct
+import zlib
+
+import pytest
+from src.triangulator.app import create_app
+from src.triangulator.core import (
+    deserialize_pointset,
+    serialize_triangles,
+    triangulate_points,
+)
+from tests.data import POINTSET_BIN
+
+SQUARE = [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)]
+SQUARE_BIN = struct.pack('<I', 4) + struct.pack('<8f', *(c for p in SQUARE for c in p))
+
+
+@pytest.fixture
+def app():
+    app = create_app()
+    app.config['TESTING'] = True
+    return app
+
+
+@pytest.fixture
+def client(app):
+    return app.test_client()
+
+
+def post_pointset(client, body, **kwargs):
+    """Envoie un binaire PointSet sur la route d'envoi direct."""
+    kwargs.setdefault("content_type", "application/octet-stream")
+    return client.post("/triangulation", data=body, **kwargs)
+
+
+def test_upload_success_matches_serializer(client, monkeypatch):
+    """Teste le chemin nominal : même binaire que le calcul local, sans PSM."""
+    def psm_must_not_be_called(_id, on_header=None):
+        raise AssertionError("Le PSM ne doit pas être sollicité.")
+
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        psm_must_not_be_called)
+
+    response = post_pointset(client, SQUARE_BIN)
+
+    assert response.status_code == 200
+    assert response.mimetype == "application/octet-stream"
+    assert response.data == serialize_triangles(SQUARE, triangulate_points(SQUARE))
+
+
+def test_upload_chunked_body(client):
+    """Teste un corps sans Content-Length, lu jusqu'à la fin du flux."""
+    response = client.post(
+        "/triangulation",
+        input_stream=io.BytesIO(SQUARE_BIN),
+        content_type="application/octet-stream",
+        environ_overrides={"wsgi.input_terminated": True},
+    )
+
+    assert response.status_code == 200
+    assert response.data == serialize_triangles(SQUARE, triangulate_points(SQUARE))
+
+
+@pytest.mark.parametrize("body", [
+    b"\x01\x00",
+    POINTSET_BIN[:-1],
+    POINTSET_BIN + b"\x00",
+])
+def test_upload_invalid_pointset_400(client, body):
+    """Teste le rejet d'un binaire PointSet mal formé."""
+    response = post_pointset(client, body)
+
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_POINTSET"
+
+
+def test_upload_too_few_points_400(client):
+    """Teste le rejet d'un PointSet bien formé mais de moins de trois points."""
+    body = struct.pack('<I', 2) + struct.pack('<4f', 0.0, 0.0, 1.0, 0.0)
+
+    response = post_pointset(client, body)
+
+    assert response.status_code == 400
+    assert response.json["code"] == "INVALID_POINTSET"
+
+
+def test_upload_wrong_content_type_415(client):
+    """Teste le rejet d'un corps qui n'est pas application/octet-stream."""
+    response = post_pointset(client, SQUARE_BIN, content_type="application/json")
+
+    assert response.status_code == 415
+    assert response.json["code"] == "UNSUPPORTED_MEDIA_TYPE"
+
+
+@pytest.mark.parametrize("chunked", [False, True])
+def test_upload_payload_too_large_413(app, client, chunked):
+    """Teste la taille maximale, annoncée ou découverte en cours de lecture."""
+    app.config["MAX_CONTENT_LENGTH"] = len(SQUARE_BIN) - 1
+    if chunked:
+        response = client.post(
+            "/triangulation",
+            input_stream=io.BytesIO(SQUARE_BIN),
+            content_type="application/octet-stream",
+            environ_overrides={"wsgi.input_terminated": True},
+        )
+    else:
+        response = post_pointset(client, SQUARE_BIN)
+
+    assert response.status_code == 413
+    assert response.json["code"] == "PAYLOAD_TOO_LARGE"
+
+
+@pytest.mark.parametrize("accept_encoding", [None, "gzip"])
+def test_upload_spilled_to_disk(client, monkeypatch, tmp_path, accept_encoding):
+    """Teste le mode débordement : même résultat, servi depuis le disque."""
+    monkeypatch.setattr("src.triangulator.spill.SPILL_THRESHOLD", 1)
+    monkeypatch.setattr("src.triangulator.spill.SPILL_DIR", str(tmp_path))
+    headers = {"Accept-Encoding": accept_encoding} if accept_encoding else {}
+
+    response = post_pointset(client, POINTSET_BIN, headers=headers)
+
+    assert response.status_code == 200
+    body = response.data
+    if accept_encoding:
+        body = zlib.decompress(body, 31)
+    else:
+        assert response.headers["Content-Length"] == str(len(body))
+    points = deserialize_pointset(POINTSET_BIN)
+    assert body == serialize_triangles(points, triangulate_points(points))
+    response.close()
+    assert list(tmp_path.iterdir()) == []
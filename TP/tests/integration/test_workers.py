@@ -0,0 +1,170 @@
+import os
+import random
+import signal
+import struct
+import threading
+import time
+
+import pytest
+from src.triangulator.app import create_app
+from src.triangulator.core import deserialize_pointset_buffer, triangulate_points
+from src.triangulator.execption import (
+    InsufficientPointsError,
+    TriangulationTimeout,
+    WorkerCrashed,
+)
+from src.triangulator.parallel import triangulate_points_parallel
+from src.triangulator.workers import TriangulationPool
+
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def make_pointset_bin(points):
+    """Construit un binaire PointSet à partir d'une liste de points."""
+    return struct.pack('<I', len(points)) + b"".join(
+        struct.pack('<ff', x, y) for x, y in points
+    )
+
+
+@pytest.fixture(scope="module")
+def pool():
+    """Pool à un worker partagé par les tests du module."""
+    pool = TriangulationPool(processes=1, timeout=30)
+    yield pool
+    pool.shutdown()
+
+
+def test_pool_matches_inline_triangulation(pool):
+    """Teste que le worker produit exactement la triangulation locale."""
+    rng = random.Random(7)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+    pointset_bin = make_pointset_bin(points)
+    float_points = [tuple(p) for p in struct.iter_unpack('<ff', pointset_bin[4:])]
+
+    triangles = pool.triangulate(deserialize_pointset_buffer(pointset_bin))
+
+    assert triangles == triangulate_points(float_points)
+
+
+def test_pool_parallel_strips(pool):
+    """Teste le mode par bandes exécuté dans les workers."""
+    rng = random.Random(11)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(600)]
+
+    triangles = triangulate_points_parallel(
+        points, strips=3, pool=pool, min_strip_points=10
+    )
+
+    expected = triangulate_points(points)
+    assert sorted(map(sorted, triangles)) == sorted(map(sorted, expected))
+
+
+def test_pool_propagates_triangulator_errors(pool):
+    """Teste que les erreurs métier du worker sont relancées telles quelles."""
+    pointset_bin = make_pointset_bin([(0.0, 0.0), (1.0, 1.0)])
+
+    with pytest.raises(InsufficientPointsError):
+        pool.triangulate(deserialize_pointset_buffer(pointset_bin))
+
+
+def test_pool_timeout():
+    """Teste qu'un job trop long lève TriangulationTimeout."""
+    rng = random.Random(3)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(20000)]
+    slow_pool = TriangulationPool(processes=1, timeout=0.001)
+
+    with pytest.raises(TriangulationTimeout):
+        slow_pool.triangulate(deserialize_pointset_buffer(make_pointset_bin(points)))
+    slow_pool.shutdown()
+
+
+def test_pool_accepts_job_after_timeout():
+    """Teste qu'après un dépassement de délai les workers bloqués sont tués
+    et qu'un nouveau job est servi aussitôt par un pool neuf.
+    """
+    rng = random.Random(5)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(60000)]
+    slow_pool = TriangulationPool(processes=1, timeout=30)
+    try:
+        (stuck_pid,) = slow_pool.warm_up()
+        slow_pool.timeout = 0.2
+        with pytest.raises(TriangulationTimeout):
+            slow_pool.triangulate(
+                deserialize_pointset_buffer(make_pointset_bin(points))
+            )
+
+        slow_pool.timeout = 5
+        triangle = make_pointset_bin([(0, 0), (1, 0), (0, 1)])
+        assert len(slow_pool.triangulate(deserialize_pointset_buffer(triangle))) == 1
+        assert slow_pool.warm_up() != {stuck_pid}
+    finally:
+        slow_pool.shutdown()
+
+
+def test_pool_replaces_crashed_worker():
+    """Teste qu'un worker tué pendant un job lève WorkerCrashed, puis que le
+    pool est remplacé, y compris si un worker meurt entre deux jobs.
+    """
+    rng = random.Random(6)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(60000)]
+    triangle = deserialize_pointset_buffer(
+        make_pointset_bin([(0, 0), (1, 0), (0, 1)])
+    )
+    crash_pool = TriangulationPool(processes=1, timeout=30)
+    try:
+        (pid,) = crash_pool.warm_up()
+        threading.Timer(0.3, os.kill, (pid, signal.SIGKILL)).start()
+        with pytest.raises(WorkerCrashed):
+            crash_pool.triangulate(
+                deserialize_pointset_buffer(make_pointset_bin(points))
+            )
+        assert len(crash_pool.triangulate(triangle)) == 1
+
+        (pid,) = crash_pool.warm_up()
+        os.kill(pid, signal.SIGKILL)
+        time.sleep(0.5)
+        assert len(crash_pool.triangulate(triangle)) == 1
+    finally:
+        crash_pool.shutdown()
+
+
+def test_api_worker_crash_503(monkeypatch):
+    """Teste la conversion d'un worker arrêté en réponse 503."""
+    class CrashedPool:
+        def triangulate(self, _coords):
+            raise WorkerCrashed("Un worker s'est arrêté pendant la triangulation.")
+
+    pointset_bin = make_pointset_bin([(0, 0), (1, 0), (0, 1)])
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        lambda _id, on_header=None: pointset_bin)
+    monkeypatch.setattr("src.triangulator.service.worker_pool", CrashedPool())
+
+    response = create_app().test_client().get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 503
+    assert response.json["code"] == "WORKER_CRASHED"
+
+
+def test_api_timeout_503(monkeypatch):
+    """Teste la conversion d'un dépassement de délai en réponse 503."""
+    class TimeoutPool:
+        def triangulate(self, _coords):
+            raise TriangulationTimeout("Triangulation interrompue.")
+
+    pointset_bin = make_pointset_bin([(0, 0), (1, 0), (0, 1)])
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        lambda _id, on_header=None: pointset_bin)
+    monkeypatch.setattr("src.triangulator.service.worker_pool", TimeoutPool())
+
+    response = create_app().test_client().get(f"/triangulation/{POINT_SET_ID}")
+
+    assert response.status_code == 503
+    assert response.json["code"] == "TRIANGULATION_TIMEOUT"
+
+
+def test_pool_warm_up_starts_workers(pool):
+    """Teste que le préchauffage démarre le worker avant le premier job."""
+    pids = pool.warm_up()
+
+    assert len(pids) == 1
+    assert pool.warm_up() == pids
@@ -0,0 +1,282 @@
+"""
+Module Bench
+Description : Ce module fournit le banc de mesure du Triangulator :
+désérialisation, triangulation, sérialisation et route Flask complète (PSM
+simulé), sur plusieurs distributions et tailles de PointSets, avec médiane,
+p95, pic mémoire, sauvegarde d'une référence JSON et comparaison.
+
+Usage : python -m tests.performance.bench [--save FICHIER] [--compare FICHIER]
+        [--max-regression 10] [--max-points N] [--stages ...]
+        [--distributions ...]
+"""
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import struct
+import sys
+import time
+import tracemalloc
+
+from src.triangulator import service
+from src.triangulator.app import create_app
+from src.triangulator.core import (
+    deserialize_pointset,
+    serialize_triangles,
+    triangulate_points,
+)
+
+SIZES = (1_000, 10_000, 100_000, 1_000_000)
+DISTRIBUTIONS = ("uniform", "clustered", "grid", "circle")
+STAGES = ("deserialize", "triangulate", "serialize", "endpoint")
+SEED = 1234
+# Au-delà de cette taille, une seule passe de chauffe serait trop coûteuse et
+# le nombre de mesures est réduit.
+LARGE_SIZE = 100_000
+REPEAT = int(os.environ.get("BENCH_REPEAT", 7))
+LARGE_REPEAT = int(os.environ.get("BENCH_LARGE_REPEAT", 3))
+MAX_REGRESSION = float(os.environ.get("BENCH_MAX_REGRESSION", 10))
+# Écart absolu en dessous duquel une médiane plus lente n'est pas une
+# régression : sur les mesures de l'ordre de la milliseconde, le bruit domine.
+MIN_DELTA = float(os.environ.get("BENCH_MIN_DELTA", 0.002))
+POINTSET_ID = "123e4567-e89b-12d3-a456-426614174000"
+
+
+def make_points(distribution: str, num_points: int) -> list[tuple[float, float]]:
+    """Génère un PointSet reproductible de la distribution demandée.
+
+    - uniform : tirage uniforme dans [0, 1000]² ;
+    - clustered : amas gaussiens serrés ;
+    - grid : grille régulière (cas dégénéré : points alignés et cocycliques) ;
+    - circle : points sur un cercle (tous cocycliques, repli sur les
+      prédicats exacts).
+    """
+    rng = random.Random(f"{SEED}-{distribution}-{num_points}")
+    if distribution == "uniform":
+        return [(rng.uniform(0, 1000), rng.uniform(0, 1000))
+                for _ in range(num_points)]
+    if distribution == "clustered":
+        centers = [(rng.uniform(0, 1000), rng.uniform(0, 1000)) for _ in range(10)]
+        return [
+            (cx + rng.gauss(0, 5), cy + rng.gauss(0, 5))
+            for cx, cy in (rng.choice(centers) for _ in range(num_points))
+        ]
+    if distribution == "grid":
+        side = math.isqrt(num_points)
+        return [(float(x), float(y)) for y in range(side) for x in range(side)]
+    if distribution == "circle":
+        step = 2 * math.pi / num_points
+        return [(500 + 400 * math.cos(i * step), 500 + 400 * math.sin(i * step))
+                for i in range(num_points)]
+    raise ValueError(f"Distribution inconnue : {distribution}")
+
+
+def pointset_bytes(points) -> bytes:
+    """Encode des points au format binaire PointSet."""
+    return struct.pack('<I', len(points)) + struct.pack(
+        f'<{2 * len(points)}f', *(c for point in points for c in point)
+    )
+
+
+def percentile(samples, fraction: float) -> float:
+    """Percentile par rang le plus proche (adapté aux petits échantillons)."""
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(fraction * len(ordered)) - 1)]
+
+
+def measure(func, setup=None, repeat: int = REPEAT, warmup: int = 1) -> dict:
+    """Mesure `func` : médiane, p95 et minimum des durées, puis pic mémoire.
+
+    `setup` est appelé avant chaque exécution, hors mesure. Le pic mémoire
+    vient d'une exécution supplémentaire sous tracemalloc, séparée des
+    mesures de durée que tracemalloc fausserait.
+    """
+    samples = []
+    for run in range(warmup + repeat):
+        if setup is not None:
+            setup()
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        if run >= warmup:
+            samples.append(elapsed)
+
+    if setup is not None:
+        setup()
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {
+        "median": statistics.median(samples),
+        "p95": percentile(samples, 0.95),
+        "min": min(samples),
+        "peak_bytes": peak,
+        "runs": len(samples),
+    }
+
+
+def stage_cases(distribution: str, num_points: int, client):
+    """Renvoie {étape: (fonction, préparation)} pour un PointSet donné."""
+    points = make_points(distribution, num_points)
+    binary = pointset_bytes(points)
+    decoded = deserialize_pointset(binary)
+    triangles = triangulate_points(decoded)
+
+    def endpoint():
+        response = client.get(f"/triangulation/{POINTSET_ID}")
+        if response.status_code != 200:
+            raise RuntimeError(f"Réponse inattendue : {response.status_code}")
+        response.get_data()
+
+    def endpoint_setup():
+        service.result_cache.clear()
+        service.get_pointset_bytes = lambda _id, on_header=None: binary
+
+    return {
+        "deserialize": (lambda: deserialize_pointset(binary), None),
+        "triangulate": (lambda: triangulate_points(decoded), None),
+        "serialize": (lambda: serialize_triangles(decoded, triangles), None),
+        "endpoint": (endpoint, endpoint_setup),
+    }
+
+
+def run_suite(sizes=SIZES, distributions=DISTRIBUTIONS, stages=STAGES,
+              log=print) -> dict:
+    """Exécute le banc et renvoie {"machine": ..., "results": {clé: mesures}}.
+
+    Les clés sont de la forme "étape/distribution/taille". La route Flask est
+    appelée avec un PSM simulé et un cache vidé avant chaque requête.
+    """
+    app = create_app()
+    app.config["TESTING"] = True
+    client = app.test_client()
+    original_fetch = service.get_pointset_bytes
+    results = {}
+    try:
+        for distribution in distributions:
+            for num_points in sizes:
+                cases = stage_cases(distribution, num_points, client)
+                large = num_points >= LARGE_SIZE
+                for stage in stages:
+                    func, setup = cases[stage]
+                    key = f"{stage}/{distribution}/{num_points}"
+                    results[key] = measure(
+                        func, setup,
+                        repeat=LARGE_REPEAT if large else REPEAT,
+                        warmup=0 if large else 1,
+                    )
+                    log(format_result(key, results[key]))
+    finally:
+        service.get_pointset_bytes = original_fetch
+        service.result_cache.clear()
+
+    return {"machine": machine_info(), "results": results}
+
+
+def machine_info() -> dict:
+    """Décrit la machine de mesure, pour juger si deux rapports sont comparables."""
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "cpus": os.cpu_count(),
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+    }
+
+
+def format_result(key: str, result: dict) -> str:
+    """Formate une mesure sur une ligne."""
+    return (
+        f"{key:<32} median {result['median'] * 1000:10.3f} ms  "
+        f"p95 {result['p95'] * 1000:10.3f} ms  "
+        f"peak {result['peak_bytes'] / 1024 / 1024:8.2f} MiB"
+    )
+
+
+def save_report(report: dict, path: str):
+    """Enregistre un rapport comme référence JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(report, f, indent=2, sort_keys=True)
+
+
+def load_report(path: str) -> dict:
+    """Lit une référence JSON."""
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def compare(report: dict, baseline: dict, max_regression: float = MAX_REGRESSION,
+            min_delta: float = MIN_DELTA) -> list[str]:
+    """Compare un rapport à une référence ; renvoie les régressions trouvées.
+
+    Une mesure régresse si sa médiane dépasse celle de la référence de plus
+    de `max_regression` % (et d'au moins `min_delta` secondes), ou si son pic
+    mémoire dépasse celui de la référence de plus de `max_regression` %.
+    Seules les clés présentes des deux côtés sont comparées.
+    """
+    limit = 1 + max_regression / 100
+    regressions = []
+    for key, current in report["results"].items():
+        reference = baseline["results"].get(key)
+        if reference is None:
+            continue
+        if (current["median"] > reference["median"] * limit
+                and current["median"] - reference["median"] >= min_delta):
+            regressions.append(
+                f"{key}: median {reference['median'] * 1000:.3f} -> "
+                f"{current['median'] * 1000:.3f} ms "
+                f"(+{(current['median'] / reference['median'] - 1) * 100:.1f}%)"
+            )
+        if current["peak_bytes"] > reference["peak_bytes"] * limit:
+            regressions.append(
+                f"{key}: peak {reference['peak_bytes']} -> "
+                f"{current['peak_bytes']} bytes "
+                f"(+{(current['peak_bytes'] / reference['peak_bytes'] - 1) * 100:.1f}%)"
+            )
+    return regressions
+
+
+def main(argv=None) -> int:
+    """Point d'entrée de la ligne de commande ; renvoie le code de sortie."""
+    parser = argparse.ArgumentParser(
+        prog="python -m tests.performance.bench",
+        description="Banc de mesure du Triangulator.",
+    )
+    parser.add_argument("--save", help="enregistre le rapport comme référence")
+    parser.add_argument("--compare", help="référence JSON à comparer")
+    parser.add_argument("--max-regression", type=float, default=MAX_REGRESSION,
+                        help="régression tolérée, en %% (défaut : %(default)s)")
+    parser.add_argument("--max-points", type=int,
+                        default=int(os.environ.get("PERF_MAX_POINTS", SIZES[-1])))
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=STAGES)
+    parser.add_argument("--distributions", nargs="+", choices=DISTRIBUTIONS,
+                        default=DISTRIBUTIONS)
+    args = parser.parse_args(argv)
+
+    sizes = [size for size in SIZES if size <= args.max_points]
+    report = run_suite(sizes, args.distributions, args.stages)
+    if args.save:
+        save_report(report, args.save)
+    if args.compare:
+        baseline = load_report(args.compare)
+        for field in ("python", "implementation", "cpus"):
+            if baseline.get("machine", {}).get(field) != report["machine"][field]:
+                print(f"ATTENTION : référence mesurée avec un autre {field} "
+                      f"({baseline.get('machine', {}).get(field)})", file=sys.stderr)
+        regressions = compare(report, baseline, args.max_regression)
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,90 @@
+import random
+import statistics
+import struct
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.triangulator import service
+from src.triangulator.admission import AdmissionController
+from src.triangulator.app import create_app
+
+LARGE_POINTS = 20_000
+SMALL_POINTS = 300
+N_LARGE = 4
+N_SMALL = 60
+SMALL_INTERVAL = 0.05
+
+
+def pointset_bytes(num_points, seed):
+    """Génère un PointSet binaire aléatoire reproductible."""
+    rng = random.Random(seed)
+    coords = [rng.uniform(0, 1000) for _ in range(2 * num_points)]
+    return struct.pack('<I', num_points) + struct.pack(f'<{2 * num_points}f', *coords)
+
+
+def percentile(latencies, fraction):
+    """Percentile par rang le plus proche."""
+    ordered = sorted(latencies)
+    return ordered[max(0, int(fraction * len(ordered) + 0.5) - 1)]
+
+
+def run_mixed_traffic(monkeypatch, controller):
+    """Lance N_LARGE gros calculs puis un flux régulier de petites requêtes ;
+    renvoie les latences des petites et les statuts des grosses.
+    """
+    large = {str(uuid.uuid4()): pointset_bytes(LARGE_POINTS, i) for i in range(N_LARGE)}
+    small = {str(uuid.uuid4()): pointset_bytes(SMALL_POINTS, 100 + i)
+             for i in range(N_SMALL)}
+    contents = {**large, **small}
+    monkeypatch.setattr(service, "get_pointset_bytes",
+                        lambda pointset_id, on_header=None: contents[pointset_id])
+    monkeypatch.setattr(service.result_cache, "max_bytes", 0)
+    monkeypatch.setattr(service, "admission", controller)
+    app = create_app()
+    app.config["TESTING"] = True
+
+    def get(pointset_id):
+        start = time.perf_counter()
+        response = app.test_client().get(f"/triangulation/{pointset_id}")
+        response.get_data()
+        return response.status_code, time.perf_counter() - start
+
+    with ThreadPoolExecutor(max_workers=N_LARGE + N_SMALL) as executor:
+        large_futures = [executor.submit(get, pointset_id) for pointset_id in large]
+        time.sleep(0.2)
+        small_futures = []
+        for pointset_id in small:
+            small_futures.append(executor.submit(get, pointset_id))
+            time.sleep(SMALL_INTERVAL)
+        small_results = [future.result() for future in small_futures]
+        large_statuses = [future.result()[0] for future in large_futures]
+
+    assert all(status == 200 for status, _ in small_results)
+    return [latency for _, latency in small_results], large_statuses
+
+
+@pytest.mark.performance
+def test_perf_admission_mixed_traffic(monkeypatch):
+    """Compare la latence des petites requêtes pendant des gros calculs, sans
+    puis avec contrôle d'admission (un seul gros calcul à la fois).
+    """
+    results = {}
+    for label, controller in (
+        ("sans admission", AdmissionController(max_cost=0)),
+        ("avec admission", AdmissionController(
+            max_cost=int(1.5 * LARGE_POINTS), small_cost=10 * SMALL_POINTS,
+            queue_timeout=120,
+        )),
+    ):
+        latencies, large_statuses = run_mixed_traffic(monkeypatch, controller)
+        results[label] = percentile(latencies, 0.99)
+        print(
+            f"\n[ADMISSION] {label}: petites requêtes médiane "
+            f"{statistics.median(latencies) * 1000:.1f}ms, "
+            f"p99 {results[label] * 1000:.1f}ms ; grosses : {large_statuses}"
+        )
+        assert all(status == 200 for status in large_statuses)
+
+    assert results["avec admission"] < results["sans admission"]
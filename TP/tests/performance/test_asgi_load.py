@@ -0,0 +1,107 @@
+import asyncio
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import pytest
+from src.triangulator.app import create_app
+from src.triangulator.asgi import create_asgi_app
+from src.triangulator.client_psm import PSMClient
+from src.triangulator.client_psm_async import AsyncPSMClient
+from tests.data import StubPSMHandler
+
+N_REQUESTS = 200
+SYNC_THREADS = 16
+PSM_LATENCY = 0.02
+
+
+class SlowPSMHandler(StubPSMHandler):
+    """PSM factice simulant un aller-retour réseau de PSM_LATENCY secondes."""
+
+    def do_GET(self):
+        time.sleep(PSM_LATENCY)
+        super().do_GET()
+
+
+class BacklogServer(ThreadingHTTPServer):
+    """Serveur acceptant une rafale de N_REQUESTS connexions simultanées."""
+
+    request_queue_size = N_REQUESTS
+
+
+@pytest.fixture
+def slow_psm_url():
+    """Démarre le PSM factice lent sur un port local libre."""
+    server = BacklogServer(("127.0.0.1", 0), SlowPSMHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    server.server_close()
+
+
+def report(label, latencies, elapsed):
+    """Affiche débit, médiane et p99 des latences."""
+    latencies = sorted(latencies)
+    p99 = latencies[int(0.99 * (len(latencies) - 1))]
+    print(
+        f"\n[{label}] {len(latencies) / elapsed:.1f} req/s, "
+        f"median={statistics.median(latencies) * 1000:.1f}ms, p99={p99 * 1000:.1f}ms"
+    )
+
+
+@pytest.mark.performance
+def test_perf_sync_vs_asgi_load(slow_psm_url, monkeypatch):
+    """Compare l'application Flask (threads) et l'application ASGI sous
+    N_REQUESTS requêtes concurrentes vers un PSM à latence fixe.
+    """
+    ids = [str(uuid.uuid4()) for _ in range(2 * N_REQUESTS)]
+
+    sync_client = PSMClient(slow_psm_url, pool_size=SYNC_THREADS)
+    monkeypatch.setattr("src.triangulator.service.get_pointset_bytes",
+                        sync_client.get_pointset_bytes)
+    flask_app = create_app()
+
+    def sync_request(pointset_id):
+        start = time.perf_counter()
+        response = flask_app.test_client().get(f"/triangulation/{pointset_id}")
+        assert response.status_code == 200
+        return time.perf_counter() - start
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=SYNC_THREADS) as threads:
+        sync_latencies = list(threads.map(sync_request, ids[:N_REQUESTS]))
+    sync_elapsed = time.perf_counter() - start
+    report("SYNC", sync_latencies, sync_elapsed)
+
+    asgi_app = create_asgi_app(AsyncPSMClient(slow_psm_url, pool_size=N_REQUESTS))
+
+    async def asgi_request(pointset_id):
+        start = time.perf_counter()
+        statuses = []
+
+        async def receive():
+            return {"type": "http.request", "body": b"", "more_body": False}
+
+        async def send(message):
+            if message["type"] == "http.response.start":
+                statuses.append(message["status"])
+
+        scope = {"type": "http", "method": "GET",
+                 "path": f"/triangulation/{pointset_id}", "headers": []}
+        await asgi_app(scope, receive, send)
+        assert statuses == [200]
+        return time.perf_counter() - start
+
+    async def run_asgi():
+        return await asyncio.gather(*(asgi_request(i) for i in ids[N_REQUESTS:]))
+
+    start = time.perf_counter()
+    asgi_latencies = asyncio.run(run_asgi())
+    asgi_elapsed = time.perf_counter() - start
+    report("ASGI", asgi_latencies, asgi_elapsed)
+
+    assert len(asgi_latencies) == N_REQUESTS
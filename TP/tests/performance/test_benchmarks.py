@@ -0,0 +1,63 @@
+import os
+
+import pytest
+from tests.performance.bench import (
+    SIZES,
+    compare,
+    load_report,
+    make_points,
+    run_suite,
+    save_report,
+)
+
+
+def report(median, peak_bytes=1000):
+    """Rapport minimal à une seule mesure."""
+    return {"results": {"triangulate/uniform/1000": {
+        "median": median, "p95": median, "min": median, "peak_bytes": peak_bytes,
+    }}}
+
+
+def test_compare_flags_slower_median():
+    """Teste qu'une médiane au-delà de la tolérance est une régression."""
+    assert compare(report(0.150), report(0.100), max_regression=10)
+    assert not compare(report(0.105), report(0.100), max_regression=10)
+
+
+def test_compare_ignores_noise_on_fast_measures():
+    """Teste que les écarts sous `min_delta` ne sont pas signalés."""
+    assert not compare(report(0.0015), report(0.001), min_delta=0.002)
+
+
+def test_compare_flags_memory_growth():
+    """Teste qu'un pic mémoire en hausse est une régression."""
+    [regression] = compare(report(0.1, 2000), report(0.1, 1000))
+    assert "peak" in regression
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "clustered", "grid", "circle"])
+def test_make_points_is_reproducible(distribution):
+    """Teste que chaque distribution est déterministe et de la bonne taille."""
+    points = make_points(distribution, 1024)
+
+    assert points == make_points(distribution, 1024)
+    assert len(points) == 1024
+
+
+@pytest.mark.performance
+def test_benchmark_suite(tmp_path):
+    """Exécute le banc de mesure complet.
+
+    PERF_MAX_POINTS borne les tailles (100 000 par défaut, 1000000 pour le
+    banc complet), BENCH_SAVE enregistre le rapport comme référence et
+    BENCH_BASELINE le compare à une référence : le test échoue au-delà de
+    BENCH_MAX_REGRESSION % de régression.
+    """
+    max_points = int(os.environ.get("PERF_MAX_POINTS", 100_000))
+    result = run_suite([size for size in SIZES if size <= max_points])
+
+    save_report(result, os.environ.get("BENCH_SAVE") or tmp_path / "bench.json")
+    baseline = os.environ.get("BENCH_BASELINE")
+    if baseline:
+        regressions = compare(result, load_report(baseline))
+        assert not regressions, "\n".join(regressions)
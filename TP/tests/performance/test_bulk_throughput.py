@@ -0,0 +1,45 @@
+import os
+import random
+import struct
+
+import pytest
+from src.triangulator.bulk import list_jobs, run
+
+N_FILES = 16
+N_POINTS = 10_000
+CPU_COUNT = os.cpu_count() or 1
+
+
+@pytest.mark.performance
+def test_perf_bulk_throughput(tmp_path):
+    """Mesure le débit du traitement par lots, en un processus puis sur
+    tous les cœurs.
+    """
+    folder = tmp_path / "in"
+    folder.mkdir()
+    for i in range(N_FILES):
+        rng = random.Random(i)
+        coords = [rng.uniform(0, 1000) for _ in range(2 * N_POINTS)]
+        (folder / f"set{i:03d}.bin").write_bytes(
+            struct.pack('<I', N_POINTS) + struct.pack(f'<{2 * N_POINTS}f', *coords)
+        )
+
+    rates = {}
+    for processes in sorted({1, CPU_COUNT}):
+        output = tmp_path / f"out{processes}"
+        output.mkdir()
+        jobs = list_jobs([str(folder)], str(output))
+        summary = run(jobs, processes=processes, log=lambda _line: None)
+        assert summary["done"] == N_FILES
+        rates[processes] = summary["points"] / summary["seconds"]
+        print(
+            f"\n[BULK] processes={processes}: {rates[processes]:.0f} points/s, "
+            f"{N_FILES / summary['seconds']:.1f} files/s"
+        )
+
+    resumed = run(jobs, processes=CPU_COUNT, resume=True, log=lambda _line: None)
+    assert resumed["skipped"] == N_FILES
+
+    if CPU_COUNT < 2:
+        pytest.skip("Un seul cœur disponible, pas de passage à l'échelle mesurable.")
+    assert rates[CPU_COUNT] > rates[1] * 1.3
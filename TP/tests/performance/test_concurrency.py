@@ -0,0 +1,49 @@
+import os
+import random
+import struct
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from src.triangulator.core import deserialize_pointset_buffer
+from src.triangulator.workers import TriangulationPool
+
+N_POINTS = 20000
+N_JOBS = 8
+CPU_COUNT = os.cpu_count() or 1
+
+
+def make_pointset_bin(num_points):
+    """Génère un binaire PointSet aléatoire."""
+    coords = [random.uniform(0, 1000) for _ in range(2 * num_points)]
+    return struct.pack('<I', num_points) + struct.pack(f'<{2 * num_points}f', *coords)
+
+
+def run_jobs(pool, payloads):
+    """Soumet les jobs depuis des threads, comme le ferait un serveur WSGI."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=len(payloads)) as threads:
+        list(threads.map(
+            lambda data: pool.triangulate(deserialize_pointset_buffer(data)),
+            payloads,
+        ))
+    return time.perf_counter() - start
+
+
+@pytest.mark.performance
+def test_perf_pool_throughput_scales_with_cores():
+    """Mesure le débit du pool de workers pour 1 à N processus."""
+    payloads = [make_pointset_bin(N_POINTS) for _ in range(N_JOBS)]
+    throughputs = {}
+
+    for processes in sorted({1, min(CPU_COUNT, 4), CPU_COUNT}):
+        pool = TriangulationPool(processes=processes, timeout=600)
+        pool.triangulate(deserialize_pointset_buffer(payloads[0]))
+        elapsed = run_jobs(pool, payloads)
+        pool.shutdown()
+        throughputs[processes] = N_JOBS / elapsed
+        print(f"\n[POOL] processes={processes}: {throughputs[processes]:.2f} jobs/s")
+
+    if CPU_COUNT < 2:
+        pytest.skip("Un seul cœur disponible, pas de passage à l'échelle mesurable.")
+    assert throughputs[max(throughputs)] > 1.3 * throughputs[1]
@@ -0,0 +1,39 @@
+import os
+import random
+import time
+
+import pytest
+from src.triangulator.core import triangulate_points
+from src.triangulator.parallel import triangulate_points_parallel
+from src.triangulator.workers import TriangulationPool
+
+N_POINTS = min(200_000, int(os.environ.get("PERF_MAX_POINTS", 200_000)))
+CPU_COUNT = os.cpu_count() or 1
+
+
+@pytest.mark.performance
+def test_perf_parallel_triangulation_scales_with_cores():
+    """Mesure la triangulation d'un seul grand ensemble sur 1 à N cœurs."""
+    points = [
+        (random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(N_POINTS)
+    ]
+    start = time.perf_counter()
+    expected = triangulate_points(points)
+    timings = {1: time.perf_counter() - start}
+    print(f"\n[PARALLEL] sequential: {timings[1]:.2f}s")
+
+    for processes in sorted({min(CPU_COUNT, 4), CPU_COUNT} - {1}):
+        pool = TriangulationPool(processes=processes, timeout=600)
+        pool.start()
+        start = time.perf_counter()
+        triangles = triangulate_points_parallel(
+            points, pool=pool, min_strip_points=N_POINTS // (2 * processes)
+        )
+        timings[processes] = time.perf_counter() - start
+        pool.shutdown()
+        assert len(triangles) == len(expected)
+        print(f"[PARALLEL] processes={processes}: {timings[processes]:.2f}s")
+
+    if CPU_COUNT < 2:
+        pytest.skip("Un seul cœur disponible, pas de passage à l'échelle mesurable.")
+    assert timings[max(timings)] < timings[1] / 1.3
@@ -0,0 +1,119 @@
+import os
+import subprocess
+import sys
+import time
+from array import array
+
+import pytest
+from src.triangulator.workers import TriangulationPool
+
+RUNS = 5
+POINT_SET_ID = "123e4567-e89b-12d3-a456-426614174000"
+FIRST_REQUEST_SCRIPT = """
+import sys, time
+start = time.perf_counter()
+from src.triangulator import client_psm
+from src.triangulator.app import create_app
+client_psm.default_client = client_psm.PSMClient(sys.argv[1])
+app = create_app()
+imported = time.perf_counter()
+response = app.test_client().get(sys.argv[2])
+response.get_data()
+print(response.status_code, imported - start, time.perf_counter() - imported)
+"""
+
+
+def cached_bytecode_env(tmp_path) -> dict:
+    """Environnement d'un conteneur déployé : bytecode compilé et réutilisé."""
+    env = dict(os.environ, PYTHONPYCACHEPREFIX=str(tmp_path))
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+
+def import_times(env) -> dict[str, int]:
+    """Renvoie {module: durée cumulée en µs} d'après `-X importtime`."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import src.triangulator.app"],
+        capture_output=True, text=True, check=True, env=env,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.mark.performance
+def test_perf_import_time(tmp_path):
+    """Mesure l'import de l'application, hors Flask, avec `-X importtime`."""
+    env = cached_bytecode_env(tmp_path)
+    import_times(env)
+    runs = [import_times(env) for _ in range(RUNS)]
+    app_time = min(times["src.triangulator.app"] for times in runs) / 1e6
+    flask_time = min(times["flask"] for times in runs) / 1e6
+    own_time = min(
+        times["src.triangulator.app"] - times["flask"] for times in runs
+    ) / 1e6
+    print(
+        f"\n[STARTUP] import app: {app_time * 1000:.1f}ms "
+        f"(flask {flask_time * 1000:.1f}ms, triangulator {own_time * 1000:.1f}ms)"
+    )
+
+    assert not {"asyncio", "multiprocessing", "cProfile"} & set(runs[0])
+    assert own_time < flask_time / 5
+
+
+@pytest.mark.performance
+def test_perf_time_to_first_request(psm_url, tmp_path):
+    """Mesure le délai entre le lancement du processus et la première
+    triangulation réussie, contre un PSM factice.
+    """
+    env = cached_bytecode_env(tmp_path)
+    command = [
+        sys.executable, "-c", FIRST_REQUEST_SCRIPT,
+        psm_url, f"/triangulation/{POINT_SET_ID}",
+    ]
+    subprocess.run(command, capture_output=True, check=True, env=env)
+
+    totals = []
+    for _ in range(RUNS):
+        start = time.perf_counter()
+        result = subprocess.run(
+            command, capture_output=True, text=True, check=True, env=env
+        )
+        totals.append(time.perf_counter() - start)
+        status, startup, first_request = result.stdout.split()
+        assert status == "200"
+    print(
+        f"\n[STARTUP] first request: {min(totals) * 1000:.1f}ms after spawn "
+        f"(import+create_app {float(startup) * 1000:.1f}ms, "
+        f"request {float(first_request) * 1000:.1f}ms)"
+    )
+
+    assert min(totals) < 2.0
+
+
+@pytest.mark.performance
+def test_perf_worker_pool_warm_up():
+    """Compare le premier job d'un pool à froid et d'un pool préchauffé."""
+    coords = array('f', [0.0, 0.0, 1.0, 0.0, 0.0, 1.0])
+    timings = {}
+    for warm in (False, True):
+        pool = TriangulationPool(processes=1, timeout=30)
+        try:
+            if warm:
+                pool.warm_up()
+            start = time.perf_counter()
+            assert len(pool.triangulate(coords)) == 1
+            timings[warm] = time.perf_counter() - start
+        finally:
+            pool.shutdown()
+    print(
+        f"\n[STARTUP] first pool job: cold {timings[False] * 1000:.1f}ms, "
+        f"warm {timings[True] * 1000:.1f}ms"
+    )
+
+    assert timings[True] < timings[False] / 2
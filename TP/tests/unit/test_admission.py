@@ -0,0 +1,109 @@
+import struct
+import threading
+import time
+
+import pytest
+from src.triangulator.admission import AdmissionController, estimate_cost
+from src.triangulator.execption import ServiceOverloaded
+
+
+def test_estimate_cost_reads_header():
+    """Teste l'estimation du coût par le nombre de points déclaré."""
+    assert estimate_cost(struct.pack('<I', 1234) + b"\x00" * 8) == 1234
+    assert estimate_cost(b"\x01") == 0
+
+
+def test_admit_within_budget_and_release():
+    """Teste l'occupation du budget pendant le calcul puis sa libération."""
+    controller = AdmissionController(max_cost=100, small_cost=10)
+
+    with controller.admit(40), controller.admit(30):
+        assert controller.in_use == 70
+
+    assert controller.stats()["in_use"] == 0
+    assert controller.stats()["admitted"] == 2
+
+
+def test_admit_disabled_without_budget():
+    """Teste qu'un budget nul désactive le contrôle."""
+    controller = AdmissionController(max_cost=0)
+
+    with controller.admit(10 ** 9):
+        assert controller.in_use == 0
+
+
+def test_admit_waits_for_release():
+    """Teste qu'un calcul en file démarre dès que la place se libère."""
+    controller = AdmissionController(max_cost=100, small_cost=10, queue_timeout=5)
+    admitted = threading.Event()
+
+    def second():
+        with controller.admit(60):
+            admitted.set()
+
+    with controller.admit(60):
+        thread = threading.Thread(target=second)
+        thread.start()
+        time.sleep(0.05)
+        assert not admitted.is_set()
+        assert controller.waiting == 1
+    thread.join(timeout=5)
+
+    assert admitted.is_set()
+
+
+def test_admit_queue_timeout_rejects():
+    """Teste le refus une fois le délai d'attente écoulé."""
+    controller = AdmissionController(max_cost=100, small_cost=10, queue_timeout=0.05)
+
+    with (
+        controller.admit(70),
+        pytest.raises(ServiceOverloaded) as error,
+        controller.admit(70),
+    ):
+        pass
+
+    assert error.value.retry_after == 1
+    assert controller.stats()["rejected"] == 1
+    assert controller.stats()["waiting"] == 0
+
+
+def test_admit_full_queue_rejects_immediately():
+    """Teste le refus immédiat quand la file est pleine."""
+    controller = AdmissionController(max_cost=100, small_cost=10, queue_timeout=5,
+                                     max_queue=0)
+
+    start = time.perf_counter()
+    with (
+        controller.admit(70),
+        pytest.raises(ServiceOverloaded),
+        controller.admit(70),
+    ):
+        pass
+
+    assert time.perf_counter() - start < 1
+
+
+def test_small_requests_use_reserved_share():
+    """Teste que les petites requêtes passent quand les grosses ont épuisé
+    leur part du budget, et que les grosses attendent.
+    """
+    controller = AdmissionController(max_cost=100, small_cost=10, queue_timeout=0.05)
+
+    with controller.admit(75):
+        with controller.admit(10), controller.admit(10):
+            assert controller.in_use == 95
+        with pytest.raises(ServiceOverloaded), controller.admit(20):
+            pass
+
+
+def test_oversized_request_runs_alone():
+    """Teste qu'un calcul plus gros que le budget est admis seul."""
+    controller = AdmissionController(max_cost=100, small_cost=10, queue_timeout=0.05)
+
+    with controller.admit(10 ** 6):
+        assert controller.in_use == 75
+        with controller.admit(5):
+            pass
+        with pytest.raises(ServiceOverloaded), controller.admit(11):
+            pass
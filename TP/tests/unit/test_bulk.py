@@ -0,0 +1,144 @@
+import random
+import struct
+
+import pytest
+from src.triangulator.bulk import (
+    archive_members,
+    is_complete,
+    list_jobs,
+    main,
+    run,
+)
+from src.triangulator.core import (
+    deserialize_pointset,
+    serialize_triangles,
+    triangulate_points,
+)
+from tests.data import POINTSET_BIN
+
+
+def pointset_bin(num_points, seed):
+    """Génère un PointSet binaire aléatoire reproductible."""
+    rng = random.Random(seed)
+    coords = [rng.uniform(0, 100) for _ in range(2 * num_points)]
+    return struct.pack('<I', num_points) + struct.pack(f'<{2 * num_points}f', *coords)
+
+
+def expected_triangles(data):
+    """Binaire Triangles attendu pour un PointSet."""
+    points = deserialize_pointset(data)
+    return serialize_triangles(points, triangulate_points(points))
+
+
+@pytest.fixture
+def pointsets(tmp_path):
+    """Dossier de trois PointSets, plus un fichier ignoré par le motif."""
+    folder = tmp_path / "in"
+    folder.mkdir()
+    contents = {f"set{i}": pointset_bin(50 + 10 * i, i) for i in range(3)}
+    for name, data in contents.items():
+        (folder / f"{name}.bin").write_bytes(data)
+    (folder / "notes.txt").write_text("pas un PointSet")
+    return folder, contents
+
+
+def test_bulk_directory(pointsets, tmp_path, capsys):
+    """Teste la triangulation d'un dossier et le rapport par fichier."""
+    folder, contents = pointsets
+    output = tmp_path / "out"
+
+    assert main([str(folder), "--output", str(output), "--jobs", "1"]) == 0
+
+    for name, data in contents.items():
+        assert (output / f"{name}.triangles").read_bytes() == expected_triangles(data)
+    assert sorted(p.name for p in output.iterdir()) == [
+        "set0.triangles", "set1.triangles", "set2.triangles",
+    ]
+    text = capsys.readouterr().out
+    assert "points/s" in text
+    assert "3 triangulés, 0 déjà complets, 0 en erreur" in text
+
+
+def test_bulk_process_pool(pointsets, tmp_path):
+    """Teste que le pool de processus produit les mêmes sorties."""
+    folder, contents = pointsets
+    output = tmp_path / "out"
+    jobs = list_jobs([str(folder)], str(output))
+    output.mkdir()
+
+    summary = run(jobs, processes=2, log=lambda _line: None)
+
+    assert summary["done"] == 3
+    assert summary["points"] == sum(50 + 10 * i for i in range(3))
+    for name, data in contents.items():
+        assert (output / f"{name}.triangles").read_bytes() == expected_triangles(data)
+
+
+def test_bulk_archive(tmp_path):
+    """Teste le découpage d'une archive, membre final tronqué compris."""
+    members = [pointset_bin(20, 1), POINTSET_BIN, pointset_bin(30, 2)]
+    archive = tmp_path / "night.pts"
+    archive.write_bytes(b"".join(members) + struct.pack('<I', 5) + b"\x00" * 8)
+    output = tmp_path / "out"
+
+    assert len(archive_members(str(archive))) == 4
+    assert main([str(archive), "--archive", "--output", str(output),
+                 "--jobs", "1"]) == 1
+
+    for index, data in enumerate(members):
+        path = output / f"night-{index:06d}.triangles"
+        assert path.read_bytes() == expected_triangles(data)
+    assert not (output / "night-000003.triangles").exists()
+
+
+def test_bulk_resume_skips_complete_outputs(pointsets, tmp_path):
+    """Teste que la reprise saute les sorties complètes et refait les autres."""
+    folder, contents = pointsets
+    output = tmp_path / "out"
+    jobs = list_jobs([str(folder)], str(output))
+    output.mkdir()
+    run(jobs, log=lambda _line: None)
+    complete = output / "set0.triangles"
+    truncated = output / "set1.triangles"
+    truncated.write_bytes(truncated.read_bytes()[:-5])
+    (output / "set2.triangles").unlink()
+    mtime = complete.stat().st_mtime_ns
+
+    summary = run(jobs, resume=True, log=lambda _line: None)
+
+    assert (summary["done"], summary["skipped"]) == (2, 1)
+    assert complete.stat().st_mtime_ns == mtime
+    for name, data in contents.items():
+        path = output / f"{name}.triangles"
+        assert is_complete(str(path))
+        assert path.read_bytes() == expected_triangles(data)
+
+
+def test_bulk_invalid_file_reported(tmp_path, capsys):
+    """Teste qu'un PointSet invalide est signalé sans arrêter le lot."""
+    good = tmp_path / "good.bin"
+    good.write_bytes(POINTSET_BIN)
+    broken = tmp_path / "broken.bin"
+    broken.write_bytes(b"\x01")
+    output = tmp_path / "out"
+
+    assert main([str(broken), str(good), "--output", str(output),
+                 "--jobs", "1"]) == 1
+
+    assert (output / "good.triangles").read_bytes() == expected_triangles(POINTSET_BIN)
+    assert not (output / "broken.triangles").exists()
+    text = capsys.readouterr().out
+    assert "broken" in text and "ERREUR" in text
+
+
+def test_bulk_duplicate_outputs_rejected(tmp_path, capsys):
+    """Teste le refus de deux entrées qui écriraient la même sortie."""
+    for folder in ("a", "b"):
+        (tmp_path / folder).mkdir()
+        (tmp_path / folder / "same.bin").write_bytes(POINTSET_BIN)
+
+    code = main([str(tmp_path / "a"), str(tmp_path / "b"),
+                 "--output", str(tmp_path / "out")])
+
+    assert code == 1
+    assert "Erreur" in capsys.readouterr().err
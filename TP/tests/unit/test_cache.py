@@ -0,0 +1,134 @@
+import os
+
+from src.triangulator.cache import ResultCache, TriangulationCache
+from src.triangulator.core import Triangulation
+
+
+def test_cache_miss_then_hit():
+    """Teste le comptage des échecs puis des succès sur une même empreinte."""
+    cache = ResultCache(max_bytes=1024)
+    digest = cache.digest(b"pointset")
+
+    assert cache.get(digest) is None
+    cache.put(digest, b"triangles")
+
+    assert cache.get(digest) == b"triangles"
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
+
+
+def test_cache_identical_content_shared_between_ids():
+    """Teste que deux identifiants de même contenu partagent une entrée."""
+    cache = ResultCache(max_bytes=1024)
+    digest = cache.digest(b"same-pointset")
+    cache.put(digest, b"triangles", "id-a")
+
+    assert cache.get_by_id("id-b") is None
+    assert cache.get(cache.digest(b"same-pointset"), "id-b") == b"triangles"
+    assert cache.get_by_id("id-b") == b"triangles"
+    assert cache.stats()["entries"] == 1
+
+
+def test_cache_lru_eviction_by_size():
+    """Teste l'éviction de l'entrée la moins récemment utilisée."""
+    cache = ResultCache(max_bytes=10)
+    cache.put("a", b"12345", "id-a")
+    cache.put("b", b"12345")
+    cache.get("a")
+    cache.put("c", b"12345")
+
+    assert cache.get("b") is None
+    assert cache.get_by_id("id-a") == b"12345"
+    assert cache.stats()["evictions"] == 1
+    assert cache.stats()["bytes"] == 10
+
+
+def test_cache_entry_larger_than_budget_not_stored():
+    """Teste qu'un résultat plus gros que le budget n'est pas conservé."""
+    cache = ResultCache(max_bytes=4)
+    cache.put("a", b"12345")
+
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 0
+
+
+def test_cache_disk_tier_survives_restart(tmp_path):
+    """Teste qu'une nouvelle instance relit les entrées du niveau disque."""
+    ResultCache(max_bytes=1024, disk_dir=str(tmp_path)).put("a", b"triangles")
+
+    warm_cache = ResultCache(max_bytes=1024, disk_dir=str(tmp_path))
+
+    assert warm_cache.get("a") == b"triangles"
+    assert warm_cache.stats()["entries"] == 1
+
+
+def test_cache_disk_tier_evicts_least_recently_used(tmp_path):
+    """Teste que le niveau disque reste dans son budget en supprimant les
+    fichiers les moins récemment lus.
+    """
+    cache = ResultCache(max_bytes=0, disk_dir=str(tmp_path), disk_max_bytes=10)
+    cache.put("a", b"12345")
+    cache.put("b", b"12345")
+    assert cache.get("a") == b"12345"
+    cache.put("c", b"12345")
+
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["a.bin", "c.bin"]
+    assert cache.get("b") is None
+    stats = cache.stats()
+    assert (stats["disk_entries"], stats["disk_bytes"]) == (2, 10)
+    assert stats["disk_evictions"] == 1
+
+
+def test_cache_disk_tier_budget_applied_on_restart(tmp_path):
+    """Teste qu'au démarrage les fichiers existants sont classés par date de
+    modification et ramenés dans le budget.
+    """
+    for index, digest in enumerate(("old", "recent", "newest")):
+        path = tmp_path / f"{digest}.bin"
+        path.write_bytes(b"12345")
+        os.utime(path, ns=(index * 10**9, index * 10**9))
+
+    cache = ResultCache(max_bytes=1024, disk_dir=str(tmp_path), disk_max_bytes=10)
+
+    assert not (tmp_path / "old.bin").exists()
+    assert cache.get("recent") == b"12345"
+    assert cache.stats()["disk_bytes"] == 10
+
+
+def test_cache_eviction_drops_only_its_aliases():
+    """Teste que l'éviction d'une entrée oublie tous ses identifiants, et
+    seulement les siens, y compris après un changement de contenu.
+    """
+    cache = ResultCache(max_bytes=10)
+    cache.put("a", b"12345", "id-a1")
+    cache.put("a", b"12345", "id-a2")
+    cache.put("b", b"12345", "id-b")
+    cache.put("b", b"12345", "id-a2")
+    cache.put("c", b"12345")
+
+    assert cache.get_by_id("id-a1") is None
+    assert cache.get_by_id("id-a2") == cache.get_by_id("id-b") == b"12345"
+    assert cache._ids_by_digest == {"b": {"id-a2", "id-b"}}
+
+
+def test_triangulation_cache_take_removes_entry():
+    """Teste qu'une triangulation prise n'est plus dans le cache."""
+    cache = TriangulationCache(max_points=10)
+    triangulation = Triangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    cache.put("id-a", triangulation)
+
+    assert cache.take("id-a") is triangulation
+    assert cache.take("id-a") is None
+    assert cache.stats()["points"] == 0
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+
+def test_triangulation_cache_eviction_by_points():
+    """Teste l'éviction de la moins récente au-delà du budget de points."""
+    cache = TriangulationCache(max_points=7)
+    for pointset_id in ("id-a", "id-b", "id-c"):
+        cache.put(pointset_id, Triangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]))
+
+    assert cache.take("id-a") is None
+    assert cache.take("id-c") is not None
+    assert cache.stats()["evictions"] == 1
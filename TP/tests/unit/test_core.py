@@ -1,13 +1,25 @@
 import math
+import random
 import struct
+from array import array
 
 import pytest
 from src.triangulator.core import (
+    Triangulation,
     deserialize_pointset,
+    deserialize_pointset_buffer,
+    get_circumcircle,
+    iter_batch_frames,
+    iter_serialize_triangles,
+    pack_batch_frame,
     serialize_triangles,
+    serialize_triangles_buffer,
+    triangulate_indices,
     triangulate_points,
+    unique_points,
 )
 from src.triangulator.execption import InsufficientPointsError, InvalidBinaryFormat
+from src.triangulator.predicates import incircle, orient2d
 
 
 def test_deserialize_pointset_nominal_case():
@@ -59,6 +71,71 @@ def test_deserialize_pointset_truncated_data():
         deserialize_pointset(binary_data)
 
 
+def test_deserialize_pointset_buffer_view():
+    """Teste que la vue float32 couvre les coordonnées sans les recopier."""
+    binary_data = struct.pack('<I', 2) + struct.pack('<ffff', 1.0, 2.0, 3.0, 4.0)
+
+    coords = deserialize_pointset_buffer(binary_data)
+
+    assert coords.format == 'f'
+    assert coords.tolist() == [1.0, 2.0, 3.0, 4.0]
+    assert coords.obj is binary_data
+
+
+def test_deserialize_pointset_buffer_size_mismatch():
+    """Teste que la validation de taille est conservée sur le chemin buffer."""
+    binary_data = struct.pack('<I', 2) + struct.pack('<ff', 1.0, 2.0)
+
+    with pytest.raises(InvalidBinaryFormat):
+        deserialize_pointset_buffer(binary_data)
+
+
+def test_serialize_triangles_buffer_roundtrip():
+    """Teste l'écriture en bloc depuis des buffers float32 / uint32."""
+    coords = array('f', [0.0, 0.0, 1.0, 0.0, 0.0, 1.0])
+    indices = array('I', [0, 1, 2])
+
+    actual_binary = serialize_triangles_buffer(coords, indices)
+
+    assert actual_binary == serialize_triangles(
+        [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)], [(0, 1, 2)]
+    )
+
+
+def test_serialize_triangles_buffer_invalid_index():
+    """Teste le contrôle de bornes vectorisé sur le buffer d'indices."""
+    coords = array('f', [0.0, 0.0, 1.0, 0.0])
+    indices = array('I', [0, 1, 2])
+
+    with pytest.raises(InvalidBinaryFormat):
+        serialize_triangles_buffer(coords, indices)
+
+
+def test_serialize_triangles_negative_index():
+    """Teste l'échec de sérialisation si un indice de triangle est négatif."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+
+    with pytest.raises(InvalidBinaryFormat):
+        serialize_triangles(points, [(0, 1, -1)])
+
+
+def test_iter_serialize_triangles_chunks():
+    """Teste que les morceaux, concaténés, redonnent le binaire complet."""
+    points = [(float(i), float(i % 7)) for i in range(10)]
+    triangles = [(i, i + 1, i + 2) for i in range(8)]
+
+    chunks = list(iter_serialize_triangles(points, triangles, chunk_items=3))
+
+    assert b"".join(chunks) == serialize_triangles(points, triangles)
+    assert len(chunks) == 1 + 4 + 1 + 3
+
+
+def test_iter_serialize_triangles_validates_eagerly():
+    """Teste que l'erreur de bornes est levée avant le premier morceau."""
+    with pytest.raises(InvalidBinaryFormat):
+        iter_serialize_triangles([(0.0, 0.0)], [(0, 1, 2)])
+
+
 def test_serialize_triangles_single_triangle():
     """Teste la sérialisation d'un PointSet de 3 points résultant en 1 triangle.
     Vérifie la conformité du format binaire Triangles.
@@ -143,3 +220,220 @@ def test_triangulate_points_insufficient_points():
     with pytest.raises(InsufficientPointsError):
         triangulate_points(points_too_few)
 
+
+def test_triangulate_points_delaunay_property():
+    """Teste qu'aucun point n'est strictement dans le cercle circonscrit
+    d'un triangle produit (propriété de Delaunay) et que le nombre de
+    triangles respecte la formule d'Euler (2n - 2 - h).
+    """
+    rng = random.Random(42)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(200)]
+
+    triangles = triangulate_points(points)
+
+    for i1, i2, i3 in triangles:
+        center, r_sq = get_circumcircle(points[i1], points[i2], points[i3])
+        for j, (x, y) in enumerate(points):
+            if j not in (i1, i2, i3):
+                assert (x - center[0])**2 + (y - center[1])**2 >= r_sq * (1 - 1e-9)
+
+    edges = {}
+    for tri in triangles:
+        for a, b in ((tri[0], tri[1]), (tri[1], tri[2]), (tri[2], tri[0])):
+            key = (min(a, b), max(a, b))
+            edges[key] = edges.get(key, 0) + 1
+    hull_size = sum(1 for count in edges.values() if count == 1)
+    assert len(triangles) == 2 * len(points) - 2 - hull_size
+
+
+def test_triangulate_points_duplicates_ignored():
+    """Teste que les points dupliqués ne produisent pas de triangle dégénéré."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0), (1.0, 0.0), (0.0, 0.0)]
+
+    triangles = triangulate_points(points)
+
+    assert len(triangles) == 1
+    assert set(triangles[0]) <= {0, 1, 2, 3, 4}
+
+
+def test_unique_points_keeps_first_occurrence():
+    """Teste la déduplication : première occurrence gardée, ordre conservé."""
+    points = [(1.0, 0.0), (0.0, 0.0), (1.0, 0.0), (2.0, 2.0), (0.0, 0.0)]
+
+    unique, originals = unique_points(points)
+
+    assert unique == [(1.0, 0.0), (0.0, 0.0), (2.0, 2.0)]
+    assert originals == [0, 1, 3]
+
+
+def test_unique_points_without_duplicates():
+    """Teste qu'une entrée sans doublon est renvoyée telle quelle."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+
+    assert unique_points(points) == (points, None)
+
+
+def test_triangulate_points_duplicates_remapped():
+    """Teste que les indices renvoyés sont ceux de l'entrée d'origine."""
+    points = [(5.0, 5.0), (0.0, 0.0), (5.0, 5.0), (4.0, 0.0), (0.0, 4.0),
+              (4.0, 0.0)]
+
+    triangles = triangulate_points(points)
+
+    assert sorted(sorted(t) for t in triangles) == [[0, 3, 4], [1, 3, 4]]
+    assert list(triangulate_indices(points)) == [i for t in triangles for i in t]
+
+
+def test_triangulate_points_duplicates_collapse_below_three():
+    """Teste qu'une entrée réduite à moins de 3 points distincts ne donne rien."""
+    points = [(0.0, 0.0), (1.0, 1.0), (0.0, 0.0), (1.0, 1.0)]
+
+    assert triangulate_points(points) == []
+    assert len(triangulate_indices(points)) == 0
+
+
+def test_triangulate_points_large_collinear():
+    """Teste qu'une grande entrée alignée est rejetée sans triangulation."""
+    points = [(float(i), 2.0 * i + 1.0) for i in range(20_000)]
+    random.Random(3).shuffle(points)
+
+    assert triangulate_points(points) == []
+
+
+def _by_coordinates(points, triangles):
+    """Rend une triangulation comparable quel que soit l'ordre des points."""
+    return sorted(tuple(sorted(points[i] for i in tri)) for tri in triangles)
+
+
+def _random_edit(rng, num_points, edits):
+    """Renvoie deux versions d'un PointSet dont `edits` points diffèrent ;
+    les coins fixes gardent le même super-triangle.
+    """
+    corners = [(0.0, 0.0), (100.0, 0.0), (0.0, 100.0), (100.0, 100.0)]
+    old = corners + [(rng.uniform(1, 99), rng.uniform(1, 99))
+                     for _ in range(num_points)]
+    new = corners + old[4 + edits:] + [(rng.uniform(1, 99), rng.uniform(1, 99))
+                                       for _ in range(edits)]
+    rng.shuffle(new)
+    return old, new
+
+
+def test_triangulation_matches_triangulate_points():
+    """Teste que la construction donne la même triangulation."""
+    rng = random.Random(1)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+
+    triangulation = Triangulation(points)
+
+    assert triangulation.points == points
+    assert sorted(triangulation.triangles()) == sorted(triangulate_points(points))
+
+
+def test_triangulation_update_matches_full_run():
+    """Teste qu'appliquer une différence équivaut à tout recalculer."""
+    old, new = _random_edit(random.Random(2), 500, 40)
+    triangulation = Triangulation(old)
+
+    assert triangulation.update(new) == (40, 40)
+
+    assert _by_coordinates(new, triangulation.triangles(new)) == \
+        _by_coordinates(new, triangulate_points(new))
+
+
+def test_triangulation_update_large_change_rebuilds():
+    """Teste le repli sur une reconstruction quand trop de points changent."""
+    old, new = _random_edit(random.Random(3), 100, 60)
+    triangulation = Triangulation(old)
+
+    triangulation.update(new)
+
+    assert _by_coordinates(new, triangulation.triangles(new)) == \
+        _by_coordinates(new, triangulate_points(new))
+
+
+def test_triangulation_insert_and_remove():
+    """Teste l'insertion et le retrait d'un point isolé."""
+    square = [(0.0, 0.0), (4.0, 0.0), (4.0, 4.0), (0.0, 4.0)]
+    triangulation = Triangulation(square)
+
+    assert triangulation.insert((2.0, 1.0))
+    assert not triangulation.insert((2.0, 1.0))
+    assert len(triangulation.triangles()) == 4
+    assert (2.0, 1.0) in triangulation
+
+    assert triangulation.remove((2.0, 1.0))
+    assert not triangulation.remove((2.0, 1.0))
+    assert len(triangulation) == 4
+    assert len(triangulation.triangles()) == 2
+
+
+def test_triangulation_insert_outside_frame():
+    """Teste l'insertion d'un point loin de la boîte englobante initiale."""
+    triangulation = Triangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+
+    triangulation.insert((50.0, 50.0))
+
+    points = triangulation.points
+    assert _by_coordinates(points, triangulation.triangles()) == \
+        _by_coordinates(points, triangulate_points(points))
+
+
+def test_triangulation_stays_delaunay_on_grid_edits():
+    """Teste la validité (cercles vides, orientation) après des modifications
+    aléatoires d'une grille, cas dégénéré plein de points cocycliques.
+    """
+    rng = random.Random(4)
+    points = [(float(x), float(y)) for x in range(8) for y in range(8)]
+    triangulation = Triangulation(points)
+    for _ in range(120):
+        point = (float(rng.randrange(-2, 10)), float(rng.randrange(-2, 10)))
+        if point in triangulation and len(triangulation) > 3:
+            triangulation.remove(point)
+        else:
+            triangulation.insert(point)
+
+    points = triangulation.points
+    triangles = triangulation.triangles()
+    assert triangles
+    for a, b, c in triangles:
+        corners = (*points[a], *points[b], *points[c])
+        assert orient2d(*corners) > 0
+        assert all(incircle(*corners, *point) <= 0 for point in points)
+
+
+def test_triangulation_remove_all_then_insert():
+    """Teste qu'une triangulation vidée peut être de nouveau remplie."""
+    points = [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)]
+    triangulation = Triangulation(points)
+    for point in points:
+        triangulation.remove(point)
+
+    assert triangulation.triangles() == []
+    for point in points:
+        triangulation.insert(point)
+    assert triangulation.triangles() == [(0, 1, 2)]
+
+
+def test_triangulation_errors():
+    """Teste les erreurs : trop peu de points, point inconnu de la liste."""
+    with pytest.raises(InsufficientPointsError):
+        Triangulation([(0.0, 0.0), (1.0, 1.0)])
+    triangulation = Triangulation([(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)])
+    with pytest.raises(InsufficientPointsError):
+        triangulation.update([(0.0, 0.0)])
+    with pytest.raises(ValueError):
+        triangulation.triangles([(0.0, 0.0), (1.0, 0.0)])
+
+
+def test_batch_frames_round_trip():
+    """Teste l'encodage puis le décodage de trames de lot."""
+    frames = [
+        ("123e4567-e89b-12d3-a456-426614174000", 200, b"TRIANGLES"),
+        ("00000000-0000-0000-0000-000000000000", 404, b'{"code": "NOT_FOUND"}'),
+        ("ffffffff-ffff-ffff-ffff-ffffffffffff", 200, b""),
+    ]
+    data = b"".join(pack_batch_frame(*frame) for frame in frames)
+
+    assert list(iter_batch_frames(data)) == frames
+    with pytest.raises(InvalidBinaryFormat):
+        list(iter_batch_frames(data[:-1]))
@@ -0,0 +1,162 @@
+import gzip
+import random
+import struct
+import zlib
+
+import pytest
+from src.triangulator.core import serialize_triangles, triangulate_points
+from src.triangulator.encoding import (
+    COMPACT_MIMETYPE,
+    DEFAULT_MIMETYPE,
+    Negotiated,
+    decode_compact,
+    encode_compact,
+    iter_encode,
+    negotiate,
+)
+from src.triangulator.execption import InvalidBinaryFormat, UnsupportedEncoding
+
+RNG = random.Random(5)
+POINTS = [(RNG.uniform(0, 100), RNG.uniform(0, 100)) for _ in range(200)]
+TRIANGLES = triangulate_points(POINTS)
+TRIANGLES_BIN = serialize_triangles(POINTS, TRIANGLES)
+FLAT_INDICES = [i for tri in TRIANGLES for i in tri]
+
+
+@pytest.mark.parametrize("accept, accept_encoding, expected", [
+    (None, None, Negotiated()),
+    ("*/*", "identity", Negotiated()),
+    ("application/octet-stream", "gzip", Negotiated(coding="gzip")),
+    (COMPACT_MIMETYPE, None, Negotiated("auto", True)),
+    (f"{COMPACT_MIMETYPE}; indices=varint; vertices=0", "deflate",
+     Negotiated("varint", False, "deflate")),
+    (f"{COMPACT_MIMETYPE};q=0.5, application/octet-stream", None, Negotiated()),
+    (f"application/octet-stream;q=0.1, {COMPACT_MIMETYPE};indices=u16", None,
+     Negotiated("u16", True)),
+    (None, "br, gzip;q=0.8, deflate;q=0.9", Negotiated(coding="deflate")),
+    (None, "gzip;q=0", Negotiated()),
+])
+def test_negotiate(accept, accept_encoding, expected):
+    """Teste le choix de l'encodage d'après Accept et Accept-Encoding."""
+    negotiated = negotiate(accept, accept_encoding)
+
+    assert negotiated == expected
+    compact = expected.indices is not None
+    assert negotiated.mimetype == (COMPACT_MIMETYPE if compact else DEFAULT_MIMETYPE)
+
+
+@pytest.mark.parametrize("accept", [
+    f"{COMPACT_MIMETYPE}; indices=u8",
+    f"{COMPACT_MIMETYPE}; vertices=yes",
+])
+def test_negotiate_invalid_parameters(accept):
+    """Teste le rejet de paramètres de format compact invalides."""
+    with pytest.raises(UnsupportedEncoding):
+        negotiate(accept, None)
+
+
+@pytest.mark.parametrize("indices", ["auto", "u32", "u16", "varint"])
+@pytest.mark.parametrize("vertices", [True, False])
+def test_compact_round_trip(indices, vertices):
+    """Teste que le format compact restitue sommets et indices."""
+    data = encode_compact(TRIANGLES_BIN, indices, vertices)
+
+    num_points, coords, flat = decode_compact(data)
+
+    assert num_points == len(POINTS)
+    assert flat == FLAT_INDICES
+    if vertices:
+        assert coords == TRIANGLES_BIN[4:4 + 8 * len(POINTS)]
+    else:
+        assert coords is None
+
+
+def test_compact_is_smaller():
+    """Teste que les indices uint16 et varint réduisent la taille."""
+    without_vertices = len(TRIANGLES_BIN) - 8 * len(POINTS)
+
+    assert len(encode_compact(TRIANGLES_BIN, "u16")) < len(TRIANGLES_BIN)
+    assert len(encode_compact(TRIANGLES_BIN, "varint", False)) < without_vertices / 2
+
+
+def test_compact_u16_falls_back_for_large_sets():
+    """Teste le repli sur uint32 quand les indices dépassent 16 bits."""
+    num_points = 70000
+    data = (
+        struct.pack('<I', num_points) + bytes(8 * num_points) +
+        struct.pack('<4I', 1, 0, 1, num_points - 1)
+    )
+
+    encoded = encode_compact(data, "u16", vertices=False)
+
+    assert decode_compact(encoded) == (num_points, None, [0, 1, num_points - 1])
+    assert len(encoded) == 9 + 12
+
+
+@pytest.mark.parametrize("data", [b"\x00", b"\x05" + struct.pack('<II', 0, 1)])
+def test_decode_compact_invalid(data):
+    """Teste le rejet d'un binaire compact tronqué."""
+    with pytest.raises(InvalidBinaryFormat):
+        decode_compact(data)
+
+
+@pytest.mark.parametrize("coding, decompress", [
+    ("gzip", gzip.decompress),
+    ("deflate", zlib.decompress),
+])
+def test_iter_encode_compresses_stream(coding, decompress):
+    """Teste la compression d'un flux découpé en morceaux."""
+    chunks = [TRIANGLES_BIN[i:i + 100] for i in range(0, len(TRIANGLES_BIN), 100)]
+
+    encoded = b"".join(iter_encode(iter(chunks), Negotiated(coding=coding)))
+
+    assert decompress(encoded) == TRIANGLES_BIN
+
+
+class SizedChunks:
+    """Flux de morceaux de taille totale connue, comme `SpilledResult`."""
+
+    def __init__(self, data, step):
+        self.data = data
+        self.size = len(data)
+        self.step = step
+        self.consumed = 0
+
+    def __iter__(self):
+        for start in range(0, self.size, self.step):
+            self.consumed = start + self.step
+            yield self.data[start:start + self.step]
+
+
+@pytest.mark.parametrize("indices", ["u32", "u16", "varint"])
+@pytest.mark.parametrize("vertices", [True, False])
+@pytest.mark.parametrize("step", [7, 100, 4096])
+def test_iter_encode_compact_streams_any_chunking(indices, vertices, step):
+    """Teste que l'encodage compact par morceaux, de taille connue ou non,
+    donne le même binaire que `encode_compact`.
+    """
+    expected = encode_compact(TRIANGLES_BIN, indices, vertices)
+    negotiated = Negotiated(indices, vertices)
+    chunks = [TRIANGLES_BIN[i:i + step] for i in range(0, len(TRIANGLES_BIN), step)]
+
+    assert b"".join(iter_encode(iter(chunks), negotiated)) == expected
+    assert b"".join(iter_encode(SizedChunks(TRIANGLES_BIN, step), negotiated)) == (
+        expected
+    )
+
+
+def test_iter_encode_compact_does_not_buffer():
+    """Teste que la sortie compacte commence avant la fin du flux d'entrée."""
+    chunks = SizedChunks(TRIANGLES_BIN, 64)
+    encoded = iter_encode(chunks, Negotiated("varint", True))
+
+    next(encoded)
+    next(encoded)
+
+    assert chunks.consumed < len(TRIANGLES_BIN) / 4
+
+
+def test_iter_encode_compact_truncated_stream():
+    """Teste le rejet d'un flux Triangles tronqué."""
+    with pytest.raises(InvalidBinaryFormat):
+        b"".join(iter_encode([TRIANGLES_BIN[:-5]], Negotiated("u16", False)))
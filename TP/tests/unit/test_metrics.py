@@ -0,0 +1,78 @@
+import pytest
+from src.triangulator import metrics
+from src.triangulator.metrics import (
+    Histogram,
+    server_timing,
+    start_request_timings,
+    timed,
+    timed_chunks,
+)
+
+
+@pytest.fixture
+def stage_histogram(monkeypatch):
+    """Remplace l'histogramme des étapes par un histogramme vide."""
+    histogram = Histogram("test_stage_seconds", "test", (0.1, 1.0), ("stage",))
+    monkeypatch.setattr(metrics, "stage_seconds", histogram)
+    return histogram
+
+
+def test_histogram_counts_values_per_bucket():
+    """Teste la répartition des valeurs et les totaux d'une série."""
+    histogram = Histogram("h", "test", (1, 10))
+    for value in (0.5, 1, 5, 50):
+        histogram.observe(value)
+
+    assert histogram.snapshot() == ([2, 1, 1], 56.5, 4)
+
+
+def test_histogram_render_is_cumulative():
+    """Teste le format texte Prometheus : bornes cumulées, +Inf, somme."""
+    histogram = Histogram("h", "aide", (1, 10), ("kind",))
+    histogram.observe(5, "a")
+    histogram.observe(50, "a")
+
+    lines = histogram.render()
+
+    assert lines[:2] == ["# HELP h aide", "# TYPE h histogram"]
+    assert 'h_bucket{kind="a",le="1"} 0' in lines
+    assert 'h_bucket{kind="a",le="10"} 1' in lines
+    assert 'h_bucket{kind="a",le="+Inf"} 2' in lines
+    assert 'h_sum{kind="a"} 55.0' in lines
+    assert 'h_count{kind="a"} 2' in lines
+
+
+def test_timed_records_histogram_and_request(stage_histogram):
+    """Teste qu'une étape mesurée alimente l'histogramme et la requête."""
+    timings = start_request_timings()
+    with timed("deserialize"):
+        pass
+
+    assert stage_histogram.snapshot("deserialize")[2] == 1
+    assert set(timings) == {"deserialize"}
+
+
+def test_timed_records_on_error(stage_histogram):
+    """Teste qu'une étape interrompue par une exception est mesurée."""
+    with pytest.raises(ValueError), timed("triangulate"):
+        raise ValueError
+
+    assert stage_histogram.snapshot("triangulate")[2] == 1
+
+
+def test_timed_chunks_relays_and_measures(stage_histogram):
+    """Teste le relais des morceaux et l'enregistrement en fin de flux."""
+    chunks = timed_chunks([b"ab", b"cde"], elapsed=0.5)
+
+    assert stage_histogram.snapshot("serialize")[2] == 0
+    assert list(chunks) == [b"ab", b"cde"]
+    _, total, count = stage_histogram.snapshot("serialize")
+    assert count == 1
+    assert total >= 0.5
+
+
+def test_server_timing_format():
+    """Teste le format de l'en-tête Server-Timing (millisecondes)."""
+    header = server_timing({"fetch": 0.0012, "triangulate": 0.5})
+
+    assert header == "fetch;dur=1.200, triangulate;dur=500.000"
@@ -0,0 +1,49 @@
+import random
+
+import pytest
+from src.triangulator.core import triangulate_points
+from src.triangulator.ordering import ORDERINGS, hilbert_keys
+
+RNG = random.Random(3)
+POINTS = [(RNG.uniform(-50, 50), RNG.uniform(0, 10)) for _ in range(300)]
+
+
+def bounds(points):
+    """Renvoie les arguments communs aux fonctions d'ordre."""
+    xs = [p[0] for p in points]
+    ys = [p[1] for p in points]
+    min_x, min_y = min(xs), min(ys)
+    delta = max(max(xs) - min_x, max(ys) - min_y) or 1.0
+    return xs, ys, len(points), min_x, min_y, delta
+
+
+@pytest.mark.parametrize("order", sorted(ORDERINGS))
+def test_order_is_permutation(order):
+    """Teste que chaque ordre renvoie chaque indice exactement une fois."""
+    assert sorted(ORDERINGS[order](*bounds(POINTS))) == list(range(len(POINTS)))
+
+
+def test_hilbert_keys_follow_curve():
+    """Teste l'ordre de Hilbert sur les quatre quadrants d'une grille 2x2."""
+    xs = [0.0, 0.0, 1.0, 1.0]
+    ys = [0.0, 1.0, 1.0, 0.0]
+
+    keys = hilbert_keys(xs, ys, range(4), 0.0, 0.0, 1.0, bits=1)
+
+    assert keys == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("order", sorted(ORDERINGS))
+def test_triangulation_independent_of_order(order):
+    """Teste que l'ordre d'insertion ne change pas la triangulation."""
+    expected = sorted(tuple(sorted(t)) for t in triangulate_points(POINTS))
+
+    actual = triangulate_points(POINTS, order=order)
+
+    assert sorted(tuple(sorted(t)) for t in actual) == expected
+
+
+def test_unknown_order_rejected():
+    """Teste qu'un ordre d'insertion inconnu est refusé."""
+    with pytest.raises(ValueError):
+        triangulate_points(POINTS, order="random")
@@ -0,0 +1,96 @@
+import random
+
+import pytest
+from src.triangulator import parallel
+from src.triangulator.core import triangulate_points
+from src.triangulator.execption import InsufficientPointsError
+from src.triangulator.parallel import triangulate_points_parallel
+
+
+def normalize(triangles):
+    """Rend une triangulation comparable indépendamment de l'ordre."""
+    return sorted(tuple(sorted(tri)) for tri in triangles)
+
+
+@pytest.mark.parametrize("points", [
+    [(0.0, 0.0), (1.0, 0.0), (0.0, 1.0)],
+    [(0.0, 0.0), (1.0, 0.0), (1.0, 1.0), (0.0, 1.0)],
+    [(0.0, 0.0), (1.0, 1.0), (2.0, 2.0)],
+])
+def test_parallel_matches_sequential_small_cases(points):
+    """Teste les cas unitaires du moteur séquentiel en mode parallèle."""
+    actual = triangulate_points_parallel(points, strips=2, min_strip_points=1)
+
+    assert normalize(actual) == normalize(triangulate_points(points))
+
+
+def test_parallel_insufficient_points():
+    """Teste l'échec si le nombre de points est inférieur à 3."""
+    with pytest.raises(InsufficientPointsError):
+        triangulate_points_parallel([(0.0, 0.0), (1.0, 1.0)], strips=2)
+
+
+@pytest.mark.parametrize("strips", [2, 3, 5])
+def test_parallel_matches_sequential_random(strips):
+    """Teste que la couture des bandes redonne la triangulation séquentielle."""
+    rng = random.Random(strips)
+    points = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(1500)]
+
+    actual = triangulate_points_parallel(points, strips=strips, min_strip_points=10)
+
+    assert normalize(actual) == normalize(triangulate_points(points))
+
+
+def test_parallel_cocircular_grid_is_valid():
+    """Teste qu'une grille (points cocycliques sur les coutures) reste une
+    triangulation complète.
+    """
+    points = [(float(x), float(y)) for x in range(20) for y in range(20)]
+
+    actual = triangulate_points_parallel(points, strips=3, min_strip_points=10)
+
+    assert len(actual) == 2 * 19 * 19
+    assert len(set(normalize(actual))) == len(actual)
+
+
+@pytest.mark.parametrize("side", [20, 45])
+def test_parallel_grid_keeps_parallel_path(side, monkeypatch):
+    """Teste que les coutures cocycliques d'une grille sont recousues sans
+    repli sur le calcul séquentiel complet.
+    """
+    points = [(float(x), float(y)) for x in range(side) for y in range(side)]
+    repairs = []
+    original = parallel._repair_seams
+
+    def spy(*args):
+        repairs.append(original(*args))
+        return repairs[-1]
+
+    monkeypatch.setattr(parallel, "_repair_seams", spy)
+
+    actual = triangulate_points_parallel(points, strips=3, min_strip_points=10)
+
+    assert len(repairs) == 1 and repairs[0] is not None
+    assert len(set(normalize(actual))) == len(actual) == 2 * (side - 1) ** 2
+
+
+def test_inside_strip_margin():
+    """Teste qu'un cercle tangent à une borne de bande n'est pas jugé sûr."""
+    a, b, c = (0.0, 0.0), (2.0, 0.0), (1.0, 1.0)
+
+    assert parallel._inside_strip(a, b, c, -0.5, 2.5)
+    assert not parallel._inside_strip(a, b, c, 0.0, 2.5)
+    assert not parallel._inside_strip(a, b, c, -0.5, 2.0)
+    assert not parallel._inside_strip(a, (1.0, 1e-12), b, -10.0, 10.0)
+
+
+def test_parallel_duplicates_remapped():
+    """Teste que les doublons sont retirés avant le découpage en bandes."""
+    rng = random.Random(11)
+    unique = [(rng.uniform(0, 100), rng.uniform(0, 100)) for _ in range(300)]
+    points = unique + unique[:100]
+
+    actual = triangulate_points_parallel(points, strips=3, min_strip_points=10)
+
+    assert normalize(actual) == normalize(triangulate_points(points))
+    assert max(max(tri) for tri in actual) < len(unique)
@@ -0,0 +1,57 @@
+import pytest
+from src.triangulator.core import is_collinear, triangulate_points
+from src.triangulator.predicates import incircle, orient2d
+
+
+def test_orient2d_signs():
+    """Teste le signe de l'orientation dans les trois cas."""
+    assert orient2d(0.0, 0.0, 1.0, 0.0, 0.0, 1.0) > 0
+    assert orient2d(0.0, 0.0, 0.0, 1.0, 1.0, 0.0) < 0
+    assert orient2d(0.0, 0.0, 1.0, 1.0, 2.0, 2.0) == 0
+
+
+def test_orient2d_near_degenerate_is_exact():
+    """Teste un cas où le calcul flottant naïf se trompe de signe."""
+    eps = 2.0 ** -52
+    ax, ay = 0.5 + eps, 0.5
+    bx, by = 12.0, 12.0
+    cx, cy = 24.0, 24.0
+    naive = (bx - ax) * (cy - ay) - (by - ay) * (cx - ax)
+
+    result = orient2d(ax, ay, bx, by, cx, cy)
+
+    assert naive == 0
+    assert result < 0
+
+
+def test_incircle_signs():
+    """Teste la position d'un point par rapport au cercle unité."""
+    square = (1.0, 0.0, 0.0, 1.0, -1.0, 0.0)
+    assert incircle(*square, 0.0, 0.0) > 0
+    assert incircle(*square, 2.0, 0.0) < 0
+    assert incircle(*square, 0.0, -1.0) == 0
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e6, 1e12])
+def test_incircle_cocircular_large_coordinates(offset):
+    """Teste un point cocyclique exact, loin de l'origine."""
+    a, b, c, d = [(offset + x, offset + y) for x, y in ((0, 0), (1, 0), (1, 1), (0, 1))]
+
+    assert incircle(*a, *b, *c, *d) == 0
+
+
+def test_is_collinear_is_scale_independent():
+    """Teste que la tolérance suit l'échelle des points."""
+    assert is_collinear((0.0, 0.0), (1e-6, 1e-6), (2e-6, 2e-6))
+    assert not is_collinear((0.0, 0.0), (1e-6, 0.0), (0.0, 1e-6))
+    assert is_collinear((0.0, 0.0), (1e9, 1e9), (2e9, 2e9 + 1e-3))
+
+
+@pytest.mark.parametrize("offset", [0.0, 1e6])
+def test_triangulate_grid_far_from_origin(offset):
+    """Teste une grille cocyclique décalée : tous les carrés sont coupés."""
+    points = [(offset + x, offset + y) for x in range(10) for y in range(10)]
+
+    triangles = triangulate_points(points)
+
+    assert len(triangles) == 2 * 9 * 9
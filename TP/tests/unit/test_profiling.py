@@ -0,0 +1,114 @@
+import json
+import os
+import pstats
+import time
+
+import pytest
+from src.triangulator import profiling
+from src.triangulator.profiling import StackSampler, profiled_call, request_profile
+from tests.data import POINTSET_BIN
+
+
+@pytest.fixture
+def profile_dir(tmp_path, monkeypatch):
+    """Active le mode de profilage dans un dossier temporaire."""
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    monkeypatch.setattr(profiling, "PROFILE_THRESHOLD", 0.0)
+    request_profile(False)
+    yield tmp_path
+    request_profile(False)
+
+
+def captures(path):
+    """Renvoie les dossiers de capture présents dans `path`."""
+    return [os.path.join(path, name) for name in sorted(os.listdir(path))]
+
+
+def busy(seconds):
+    """Occupe le thread courant pendant `seconds` secondes."""
+    end = time.perf_counter() + seconds
+    while time.perf_counter() < end:
+        pass
+    return "ok"
+
+
+def test_disabled_mode_calls_directly(monkeypatch):
+    """Teste que sans PROFILE_DIR rien n'est mesuré ni écrit."""
+    monkeypatch.setattr(profiling, "PROFILE_DIR", None)
+    request_profile(True)
+    try:
+        assert profiled_call(POINTSET_BIN, lambda x: x * 2, 21) == 42
+    finally:
+        request_profile(False)
+
+
+def test_requested_profile_saves_pstats(profile_dir):
+    """Teste la capture cProfile demandée pour la requête."""
+    request_profile(True)
+
+    assert profiled_call(POINTSET_BIN, busy, 0.01) == "ok"
+
+    [capture] = captures(profile_dir)
+    with open(os.path.join(capture, profiling.POINTSET_FILE), "rb") as f:
+        assert f.read() == POINTSET_BIN
+    with open(os.path.join(capture, profiling.META_FILE)) as f:
+        meta = json.load(f)
+    assert meta["reason"] == "requested"
+    assert meta["points"] == int.from_bytes(POINTSET_BIN[:4], "little")
+    stats = pstats.Stats(os.path.join(capture, profiling.PSTATS_FILE))
+    assert any(func[2] == "busy" for func in stats.stats)
+
+
+def test_threshold_saves_sampled_stacks(profile_dir, monkeypatch):
+    """Teste la capture par échantillonnage d'un appel plus lent que le seuil."""
+    monkeypatch.setattr(profiling, "PROFILE_THRESHOLD", 0.05)
+
+    profiled_call(POINTSET_BIN, busy, 0.1)
+
+    [capture] = captures(profile_dir)
+    with open(os.path.join(capture, profiling.STACKS_FILE)) as f:
+        assert "busy (test_profiling.py" in f.read()
+
+
+def test_threshold_ignores_fast_calls(profile_dir, monkeypatch):
+    """Teste qu'un appel sous le seuil ne laisse aucune capture."""
+    monkeypatch.setattr(profiling, "PROFILE_THRESHOLD", 10.0)
+
+    profiled_call(POINTSET_BIN, busy, 0.0)
+
+    assert captures(profile_dir) == []
+
+
+def test_failing_call_is_captured(profile_dir):
+    """Teste qu'un calcul en échec est enregistré puis relancé."""
+    request_profile(True)
+
+    def failing():
+        raise RuntimeError("boom")
+
+    with pytest.raises(RuntimeError):
+        profiled_call(POINTSET_BIN, failing)
+
+    assert len(captures(profile_dir)) == 1
+
+
+def test_capture_write_failure_is_ignored(tmp_path, monkeypatch):
+    """Teste qu'un dossier inutilisable ne fait pas échouer l'appel."""
+    blocker = tmp_path / "file"
+    blocker.write_bytes(b"")
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(blocker))
+    request_profile(True)
+    try:
+        assert profiled_call(POINTSET_BIN, busy, 0.0) == "ok"
+    finally:
+        request_profile(False)
+
+
+def test_stack_sampler_records_target_thread():
+    """Teste que l'échantillonneur relève la pile du thread appelant."""
+    with StackSampler(interval=0.001) as sampler:
+        busy(0.05)
+
+    assert sum(sampler.stacks.values()) > 0
+    assert all(line.rsplit(" ", 1)[1].isdigit()
+               for line in sampler.folded().splitlines())
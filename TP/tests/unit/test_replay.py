@@ -0,0 +1,48 @@
+from src.triangulator import profiling
+from src.triangulator.core import (
+    deserialize_pointset,
+    serialize_triangles,
+    triangulate_points,
+)
+from src.triangulator.replay import load_capture, main
+from tests.data import POINTSET_BIN
+
+
+def expected_triangles():
+    """Binaire Triangles attendu pour POINTSET_BIN."""
+    points = deserialize_pointset(POINTSET_BIN)
+    return serialize_triangles(points, triangulate_points(points))
+
+
+def test_replay_capture_directory(tmp_path, monkeypatch, capsys):
+    """Teste le rejeu d'une capture enregistrée par le mode de profilage."""
+    monkeypatch.setattr(profiling, "PROFILE_DIR", str(tmp_path))
+    capture = profiling.save_capture(POINTSET_BIN, 1.5, "threshold")
+    output = tmp_path / "triangles.bin"
+
+    code = main([capture, "--repeat", "2", "--output", str(output)])
+
+    assert code == 0
+    assert output.read_bytes() == expected_triangles()
+    text = capsys.readouterr().out
+    assert "threshold, 1.500s" in text
+    assert "triangulate" in text
+
+
+def test_replay_raw_pointset_with_profile(tmp_path, capsys):
+    """Teste le rejeu d'un fichier PointSet avec le profil affiché."""
+    path = tmp_path / "pointset.bin"
+    path.write_bytes(POINTSET_BIN)
+
+    assert main([str(path), "--profile", "--top", "5"]) == 0
+    assert "function calls" in capsys.readouterr().out
+    assert load_capture(str(path)) == (POINTSET_BIN, {})
+
+
+def test_replay_invalid_input(tmp_path, capsys):
+    """Teste le code de sortie sur un binaire invalide."""
+    path = tmp_path / "broken.bin"
+    path.write_bytes(b"\x01")
+
+    assert main([str(path)]) == 1
+    assert "Erreur" in capsys.readouterr().err
@@ -0,0 +1,132 @@
+import io
+import mmap
+import random
+import struct
+from itertools import chain
+
+import pytest
+from src.triangulator import spill
+from src.triangulator.client_psm import read_pointset_body
+from src.triangulator.core import (
+    deserialize_pointset,
+    deserialize_pointset_view,
+    serialize_triangles,
+    triangulate_indices,
+    triangulate_points,
+)
+from src.triangulator.execption import InvalidBinaryFormat
+from src.triangulator.spill import SpilledResult, allocate, spill_triangles
+
+POINTS = [(random.uniform(0, 100), random.uniform(0, 100)) for _ in range(300)]
+POINTS_BIN = struct.pack('<I', len(POINTS)) + struct.pack(
+    f'<{2 * len(POINTS)}f', *chain.from_iterable(POINTS)
+)
+
+
+class RecordingStream(io.BytesIO):
+    """Flux sans longueur annoncée qui note les tailles demandées à `read`."""
+
+    def __init__(self, data):
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1):
+        self.reads.append(size)
+        return super().read(size)
+
+
+@pytest.fixture
+def spill_everything(monkeypatch, tmp_path):
+    """Active le mode débordement pour tout PointSet."""
+    monkeypatch.setattr(spill, "SPILL_THRESHOLD", 1)
+    monkeypatch.setattr(spill, "SPILL_DIR", str(tmp_path))
+
+
+def test_should_spill_disabled_by_default(monkeypatch):
+    """Teste qu'un seuil nul désactive le mode débordement."""
+    monkeypatch.setattr(spill, "SPILL_THRESHOLD", 0)
+
+    assert not spill.should_spill(1 << 40)
+
+
+def test_allocate_returns_writable_mapping(tmp_path, monkeypatch):
+    """Teste la projection d'un fichier temporaire anonyme."""
+    monkeypatch.setattr(spill, "SPILL_DIR", str(tmp_path))
+
+    mapping = allocate(16)
+    mapping[:4] = b"abcd"
+
+    assert len(mapping) == 16
+    assert mapping[:4] == b"abcd"
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_read_pointset_body_spills_to_mapping(spill_everything):
+    """Teste la lecture d'un corps au-delà du seuil dans une projection."""
+    body = read_pointset_body(io.BytesIO(POINTS_BIN))
+
+    assert isinstance(body, mmap.mmap)
+    assert spill.is_spilled(body)
+    assert body[:] == POINTS_BIN
+
+
+def test_read_pointset_body_spilled_truncated(spill_everything):
+    """Teste qu'un corps tronqué est rejeté en mode débordement aussi."""
+    with pytest.raises(InvalidBinaryFormat):
+        read_pointset_body(io.BytesIO(POINTS_BIN[:-3]))
+
+
+def test_point_set_view_matches_list():
+    """Teste que la vue se comporte comme la liste de `deserialize_pointset`."""
+    view = deserialize_pointset_view(POINTS_BIN)
+    points = deserialize_pointset(POINTS_BIN)
+
+    assert len(view) == len(points)
+    assert list(view) == points
+    assert view[0] == points[0]
+    assert view[-1] == points[-1]
+    with pytest.raises(IndexError):
+        view[len(points)]
+
+
+def test_triangulate_indices_matches_triangulate_points():
+    """Teste que les indices à plat sont ceux de `triangulate_points`."""
+    view = deserialize_pointset_view(POINTS_BIN)
+    expected = triangulate_points(deserialize_pointset(POINTS_BIN))
+
+    assert list(triangulate_indices(view)) == list(chain.from_iterable(expected))
+
+
+@pytest.mark.parametrize("flat", [True, False])
+def test_spill_triangles_matches_serializer(spill_everything, flat):
+    """Teste le binaire écrit sur disque, indices à plat ou en triplets."""
+    view = deserialize_pointset_view(POINTS_BIN)
+    points = deserialize_pointset(POINTS_BIN)
+    triangles = triangulate_points(points)
+
+    result = spill_triangles(
+        view, triangulate_indices(view) if flat else triangles
+    )
+
+    expected = serialize_triangles(points, triangles)
+    assert isinstance(result, SpilledResult)
+    assert result.size == len(expected)
+    assert b"".join(result) == expected
+    assert result.file.closed
+
+
+def test_read_pointset_body_without_length_preallocates():
+    """Teste qu'un flux sans longueur annoncée est lu dans un buffer alloué
+    d'après l'en-tête, sans lecture par morceaux ; corps court ou trop long
+    rejeté.
+    """
+    stream = RecordingStream(POINTS_BIN)
+
+    body = read_pointset_body(stream)
+
+    assert isinstance(body, bytearray)
+    assert body == POINTS_BIN
+    assert stream.reads == [1]
+    for data in (POINTS_BIN[:-3], POINTS_BIN + b"\0"):
+        with pytest.raises(InvalidBinaryFormat):
+            read_pointset_body(RecordingStream(data))
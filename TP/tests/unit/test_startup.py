@@ -0,0 +1,47 @@
+import subprocess
+import sys
+
+import pytest
+
+# Modules lourds qui ne doivent être chargés qu'à la première utilisation.
+LAZY_MODULES = (
+    "asyncio",
+    "cProfile",
+    "multiprocessing",
+    "concurrent.futures.process",
+    "src.triangulator.client_psm_async",
+    "src.triangulator.parallel",
+    "src.triangulator.workers",
+)
+
+
+def loaded_modules(statement: str) -> set[str]:
+    """Exécute `statement` dans un interpréteur neuf ; renvoie les modules
+    de LAZY_MODULES alors chargés.
+    """
+    script = (
+        f"import sys\n{statement}\n"
+        f"print('\\n'.join(m for m in {LAZY_MODULES!r} if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", script], capture_output=True, text=True, check=True
+    )
+    return set(result.stdout.split())
+
+
+@pytest.mark.parametrize("statement", [
+    "import src.triangulator.core",
+    "from src.triangulator.app import create_app; create_app()",
+])
+def test_startup_skips_heavy_modules(statement):
+    """Teste que le coeur et l'application Flask démarrent sans les moteurs
+    optionnels.
+    """
+    assert loaded_modules(statement) == set()
+
+
+def test_async_client_loaded_on_demand():
+    """Teste que `client_psm.AsyncPSMClient` charge asyncio à la demande."""
+    statement = "from src.triangulator.client_psm import AsyncPSMClient"
+
+    assert loaded_modules(statement) == {"asyncio", "src.triangulator.client_psm_async"}
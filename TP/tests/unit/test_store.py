@@ -0,0 +1,58 @@
+import math
+
+from src.triangulator.store import NO_NEIGHBOUR, TriangleStore
+
+
+def make_store():
+    """Crée un stockage sur le carré unité (x, y) plus un point aligné."""
+    xs = [0.0, 1.0, 1.0, 0.0, 2.0]
+    ys = [0.0, 0.0, 1.0, 1.0, 0.0]
+    return TriangleStore(xs, ys)
+
+
+def test_add_stores_columns_and_circle():
+    """Teste qu'un triangle ajouté remplit ses colonnes et son cercle."""
+    store = make_store()
+
+    t = store.add(0, 1, 2, NO_NEIGHBOUR, 3, NO_NEIGHBOUR)
+
+    assert t == 0
+    assert list(store.vertices[t:t + 3]) == [0, 1, 2]
+    assert list(store.neighbours[t:t + 3]) == [NO_NEIGHBOUR, 3, NO_NEIGHBOUR]
+    assert store.circles[t] == 0.5
+    assert store.circles[t + 1] == 0.5
+    assert store.circles[t + 2] == 0.5
+    assert len(store) == 1
+
+
+def test_flat_triangle_has_no_circle():
+    """Teste qu'un triangle dégénéré n'a pas de cercle mémorisé."""
+    store = make_store()
+
+    t = store.add(0, 1, 4)
+
+    assert all(math.isnan(value) for value in store.circles[t:t + 3])
+
+
+def test_released_slot_is_reused():
+    """Teste que la liste libre est consommée avant d'agrandir les colonnes."""
+    store = make_store()
+    first = store.add(0, 1, 2)
+    second = store.add(0, 2, 3)
+
+    store.release(first)
+    reused = store.add(1, 2, 3)
+
+    assert reused == first
+    assert len(store.vertices) == 6
+    assert len(store) == 2
+    assert sorted(store.triangles()) == [first, second]
+
+
+def test_nbytes_counts_columns():
+    """Teste la taille mémoire : 3 sommets, 3 voisins, 3 flottants."""
+    store = make_store()
+    store.add(0, 1, 2)
+    store.add(0, 2, 3)
+
+    assert store.nbytes == 2 * (3 * 4 + 3 * 4 + 3 * 8)